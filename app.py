@@ -1,15 +1,34 @@
+import queue
+import threading
+
 import numpy as np
-import matplotlib.pyplot as plt
-from tabulate import tabulate
 from fractions import Fraction
+from simplex_revisado import SimplexRevisado, CAMBIO_DE_COTA
+from matriz_dispersa import es_dispersa, a_csc
+from estrategias_pricing import crear_estrategia
+from presolve import Presolve
+from escalamiento import Escalamiento, debe_escalar
+from base_simplex import BaseSimplex, columnas_independientes
+from sensibilidad import calcular_sensibilidad, inversa_desde_tableau
+from simplex_exacto import SimplexExacto, a_fraccion
+from historial_tableaux import HistorialTableaux
+from formato_fracciones import FormatoFracciones
+from eventos_simplex import (EventoSimplex, TABLEAU_INICIAL, PIVOTE, ITERACION, FASE_DOS,
+                             INFACTIBLE)
 
 class SolucionadorPL:
     """
-    Solucionador de Programación Lineal usando el método Simplex con Big M
+    Solucionador de Programación Lineal usando el método Simplex con Big M o dos fases
     """
     
-    def __init__(self):
-        """Inicializa el solucionador con valores por defecto"""
+    def __init__(self, pricing=None):
+        """
+        Inicializa el solucionador con valores por defecto
+        
+        Args:
+            pricing: Regla para la columna entrante ("dantzig", "parcial", "devex",
+                     "steepest_edge" o una instancia de EstrategiaPricing)
+        """
         self.A = None                    # Matriz de coeficientes de restricciones
         self.b = None                    # Vector de lado derecho
         self.c = None                    # Vector de coeficientes de función objetivo
@@ -22,13 +41,46 @@ class SolucionadorPL:
         self.M = None                   # Valor Big M
         self.num_restricciones = 0      # Número de restricciones
         self.num_variables = 0          # Número de variables originales
-        self.historial_tableaux = []    # Historial de tableaux para visualización
+        self.historial_tableaux = HistorialTableaux()  # Historial de tableaux (por diferencias) para visualización
         self.usar_fracciones = True     # Mostrar resultados como fracciones
         self.verbose = True             # Mostrar información detallada
         self.epsilon = 1e-12            # Tolerancia para comparaciones numéricas
+        self.tolerancia_pivote = 1e-9   # Magnitud mínima de un elemento pivote
         self.vars_originales = []       # Índices de variables originales
         self.vars_holgura = []          # Índices de variables de holgura
         self.vars_artificiales_idx = [] # Índices de variables artificiales
+        self.motor = "tableau"          # Motor de resolución ("tableau", "dual" o "revisado")
+        self.max_iteraciones = 100      # Límite de iteraciones del simplex
+        self.iteraciones = 0            # Iteraciones realizadas en la última resolución
+        self.estado = None              # Estado final: optimo, no_acotado, infactible, max_iteraciones, cancelado
+        self.metodo = "big_m"           # Manejo de artificiales ("big_m" o "dos_fases")
+        self.tolerancia_factibilidad = 1e-9  # Tolerancia de la Fase I para declarar infactibilidad
+        self.filas_redundantes = []     # Filas eliminadas al terminar la Fase I
+        self.pricing = crear_estrategia(pricing)  # Estrategia de selección de columna
+        self.cotas_inferiores = None    # Cotas inferiores por variable (None = 0)
+        self.cotas_superiores = None    # Cotas superiores por variable (None = sin cota)
+        self._cotas_superiores = None   # Cota superior de cada columna ya desplazada
+        self._invertida = None          # Columnas sustituidas por u_j - x_j (en cota superior)
+        self._constante_objetivo = 0.0  # Término constante por el desplazamiento de cotas
+        self.usar_presolve = False      # Reducir el modelo antes de la forma estándar
+        self.presolve = None            # Presolve de la última resolución (con su reporte)
+        self.escalar = None             # Escalar filas y columnas (None = según el tamaño)
+        self.escalamiento = None        # Factores de escala usados en la última resolución
+        self.arranque_en_caliente = False  # La última resolución partió de una base dada
+        self.dual_automatico = True     # Usar el simplex dual si la base de holguras es dual factible
+        self.algoritmo = None           # "primal" o "dual": algoritmo usado en la última resolución
+        self.motor_usado = None         # Motor usado en la última resolución (puede diferir de motor)
+        self._fila_original = None      # Fila del modelo de cada fila del tableau dual
+        self._signo_filas = None        # Signo de cada fila de la forma estándar respecto del modelo
+        self._filas_activas = None      # Filas de la forma estándar que siguen en el tableau
+        self._calculo_sensibilidad = None  # Cálculo pendiente del análisis de sensibilidad
+        self._sensibilidad = None       # Análisis de sensibilidad ya calculado
+        self._base_final = None         # Base de la última resolución (ver exportar_base)
+        self.exacto = False             # Aritmética racional exacta (fijar antes de cargar el problema)
+        self._formato_fracciones = FormatoFracciones()  # Racionalizador vectorizado para mostrar tableaux
+        self._cache_etiquetas = None    # Orden y etiquetas de columnas compartidos entre iteraciones
+        self.al_evento = None           # Función que recibe cada EventoSimplex (ver resolver_eventos)
+        self.cancelacion = threading.Event()  # Pedido de detener la resolución (ver cancelar)
 
     def establecer_objetivo(self, coeficientes, tipo_problema="max"):
         """
@@ -38,7 +90,11 @@ class SolucionadorPL:
             coeficientes: Lista de coeficientes de la función objetivo
             tipo_problema: "max" o "min"
         """
-        self.c = np.array(coeficientes, dtype=float)
+        if self.exacto:
+            # Se conservan como Fraction (ver parsear_fraccion con exacto=True)
+            self.c = np.array([a_fraccion(v) for v in coeficientes], dtype=object)
+        else:
+            self.c = np.array(coeficientes, dtype=float)
         self.num_variables = len(coeficientes)
         self.tipo_problema = tipo_problema.lower()
         
@@ -53,27 +109,101 @@ class SolucionadorPL:
         Agrega restricciones al problema
         
         Args:
-            A: Matriz de coeficientes de restricciones
+            A: Matriz de coeficientes de restricciones (densa, MatrizCSR o MatrizCSC)
             b: Vector de lado derecho
             desigualdades: Lista de tipos de desigualdad ("<=", ">=", "=")
         """
-        A = np.array(A, dtype=float)
-        b = np.array(b, dtype=float)
-        self.num_restricciones = len(b)
+        if self.exacto:
+            if es_dispersa(A):
+                raise ValueError("El modo exacto no admite matrices dispersas")
+            A = np.array([[a_fraccion(v) for v in fila] for fila in A], dtype=object)
+            b = np.array([a_fraccion(v) for v in b], dtype=object)
+        elif es_dispersa(A):
+            # Las matrices dispersas se guardan en CSC y nunca se densifican
+            A = a_csc(A)
+            b = np.array(b, dtype=float)
+        else:
+            A = np.array(A, dtype=float)
+            b = np.array(b, dtype=float)
         
         if self.A is None:
             self.A = A
             self.b = b
             self.desigualdades = desigualdades
+        elif es_dispersa(self.A) or es_dispersa(A):
+            self.A = a_csc(self.A).apilar(a_csc(A))
+            self.b = np.concatenate((self.b, b))
+            self.desigualdades.extend(desigualdades)
         else:
             self.A = np.vstack((self.A, A))
             self.b = np.concatenate((self.b, b))
             self.desigualdades.extend(desigualdades)
+        
+        self.num_restricciones = len(self.b)
+
+    def establecer_cotas(self, inferiores=None, superiores=None):
+        """
+        Establece cotas por variable l_j <= x_j <= u_j sin agregar restricciones
+        
+        Las cotas se manejan implícitamente en la prueba de la razón y el pivoteo
+        (cambio de cota), por lo que no agregan filas ni columnas al tableau.
+        
+        Args:
+            inferiores: Lista de cotas inferiores finitas (None = todas en 0)
+            superiores: Lista de cotas superiores (None o inf = sin cota)
+        """
+        n = self.num_variables
+        exactas = None
+        if self.exacto:
+            exactas = (None if inferiores is None else np.array([a_fraccion(v) for v in inferiores], dtype=object),
+                       None if superiores is None else np.array(
+                           [np.inf if u is None or np.isinf(float(u)) else a_fraccion(u) for u in superiores],
+                           dtype=object))
+        if inferiores is not None:
+            inferiores = np.array([float(v) for v in inferiores], dtype=float)
+            if inferiores.shape != (n,) or not np.isfinite(inferiores).all():
+                raise ValueError("Las cotas inferiores deben ser finitas, una por variable")
+        if superiores is not None:
+            superiores = np.array([np.inf if u is None else float(u) for u in superiores], dtype=float)
+            if superiores.shape != (n,):
+                raise ValueError("Debe haber una cota superior por variable")
+        
+        l = inferiores if inferiores is not None else np.zeros(n)
+        if superiores is not None and (superiores < l).any():
+            raise ValueError("Cotas inconsistentes: alguna cota superior es menor que la inferior")
+        
+        self.cotas_inferiores = inferiores
+        self.cotas_superiores = superiores
+        if exactas is not None:
+            self.cotas_inferiores, self.cotas_superiores = exactas
+
+    def _desplazar_cotas(self):
+        """
+        Sustituye x = l + x' para que toda variable tenga cota inferior 0 y
+        calcula las cotas superiores desplazadas u - l de las variables originales
+        """
+        n = self.num_variables
+        self._constante_objetivo = 0.0
+        if self.cotas_inferiores is not None and self.cotas_inferiores.any():
+            l = self.cotas_inferiores
+            if es_dispersa(self.A):
+                self.b = self.b - self.A.producto(l)
+            else:
+                self.b = self.b - self.A @ l
+            self._constante_objetivo = float(self.c[:n] @ l)
+        
+        self._cotas_superiores = np.full(n, np.inf)
+        if self.cotas_superiores is not None:
+            l = self.cotas_inferiores if self.cotas_inferiores is not None else 0.0
+            self._cotas_superiores = self.cotas_superiores - l
 
     def _calcular_big_m(self):
         """Calcula el valor Big M basado en los coeficientes del problema"""
         max_obj = np.max(np.abs(self.c)) if len(self.c) > 0 else 1
-        max_constr = np.max(np.abs(self.A)) if self.A is not None and self.A.size > 0 else 1
+        if es_dispersa(self.A):
+            max_constr = self.A.max_abs() if self.A.nnz > 0 else 1
+        else:
+            max_constr = np.max(np.abs(self.A)) if self.A is not None and self.A.size > 0 else 1
         max_rhs = np.max(np.abs(self.b)) if self.b is not None and self.b.size > 0 else 1
         
         max_value = max(max_obj, max_constr, max_rhs)
@@ -84,16 +214,45 @@ class SolucionadorPL:
             print(f"Valor Big M calculado: {M}")
         return M
 
-    def _convertir_a_forma_estandar(self):
-        """Convierte el problema a forma estándar agregando variables de holgura y artificiales"""
-        if self.M is None:
+    def _preparar_forma_estandar(self, sin_artificiales=False):
+        """
+        Determina las variables de holgura y artificiales sin construir la matriz expandida
+
+        Cada columna lógica (holgura, exceso o artificial) tiene un único coeficiente
+        no nulo; su fila y signo quedan en _filas_logicas y _signos_logicos.
+        
+        Args:
+            sin_artificiales: Todas las filas ya son <= y su holgura es básica aunque
+                              el lado derecho sea negativo (base inicial del simplex dual)
+        """
+        if self.M is None and self.metodo == "big_m" and not sin_artificiales:
             self.M = self._calcular_big_m()
+        costo_artificial = -self.M if self.metodo == "big_m" and self.M is not None else 0.0
+        self._desplazar_cotas()
+        desigualdades = ["<="] * self.num_restricciones if sin_artificiales else self.desigualdades
+        
+        # Manejar RHS negativos antes de asignar la base inicial
+        negativos = self.b < 0
+        if self._signo_filas is None:
+            self._signo_filas = np.ones(self.num_restricciones)
+        if negativos.any() and not sin_artificiales:
+            self._signo_filas[negativos] *= -1
+            if es_dispersa(self.A):
+                self.A.negar_filas(negativos)
+            else:
+                self.A[negativos] = -self.A[negativos]
+            self.b[negativos] = -self.b[negativos]
+            for i in np.flatnonzero(negativos):
+                if self.desigualdades[i] == ">=":
+                    self.desigualdades[i] = "<="
+                elif self.desigualdades[i] == "<=":
+                    self.desigualdades[i] = ">="
         
         # Contar variables necesarias
         num_holgura_exceso = 0
         num_artificiales = 0
         
-        for desigualdad in self.desigualdades:
+        for desigualdad in desigualdades:
             if desigualdad == "<=":
                 num_holgura_exceso += 1
             elif desigualdad == ">=":
@@ -102,10 +261,10 @@ class SolucionadorPL:
             elif desigualdad == "=":
                 num_artificiales += 1
         
-        # Crear matriz expandida
         total_vars = self.num_variables + num_holgura_exceso + num_artificiales
-        nueva_A = np.zeros((self.num_restricciones, total_vars))
-        nueva_A[:, :self.num_variables] = self.A
+        num_logicas = num_holgura_exceso + num_artificiales
+        self._filas_logicas = np.zeros(num_logicas, dtype=np.intp)
+        self._signos_logicos = np.zeros(num_logicas)
         
         nuevo_c = np.zeros(total_vars)
         nuevo_c[:self.num_variables] = self.c
@@ -118,55 +277,121 @@ class SolucionadorPL:
         idx_holgura = self.num_variables
         idx_artificial = self.num_variables + num_holgura_exceso
         
-        for i, desigualdad in enumerate(self.desigualdades):
+        def agregar_columna_logica(idx, fila, signo):
+            self._filas_logicas[idx - self.num_variables] = fila
+            self._signos_logicos[idx - self.num_variables] = signo
+        
+        for i, desigualdad in enumerate(desigualdades):
             if desigualdad == "<=":
                 # Agregar variable de holgura
-                nueva_A[i, idx_holgura] = 1
+                agregar_columna_logica(idx_holgura, i, 1)
                 self.vars_basicas[i] = idx_holgura
                 self.vars_holgura.append(idx_holgura)
                 idx_holgura += 1
                 
             elif desigualdad == ">=":
                 # Agregar variable de exceso (negativa)
-                nueva_A[i, idx_holgura] = -1
+                agregar_columna_logica(idx_holgura, i, -1)
                 self.vars_holgura.append(idx_holgura)
                 idx_holgura += 1
                 
                 # Agregar variable artificial
-                nueva_A[i, idx_artificial] = 1
+                agregar_columna_logica(idx_artificial, i, 1)
                 self.vars_basicas[i] = idx_artificial
                 self.vars_artificiales.append(idx_artificial)
                 self.indices_artificiales.append(idx_artificial)
                 self.vars_artificiales_idx.append(idx_artificial)
-                nuevo_c[idx_artificial] = -self.M
+                nuevo_c[idx_artificial] = costo_artificial
                 idx_artificial += 1
                 
             elif desigualdad == "=":
                 # Agregar variable artificial
-                nueva_A[i, idx_artificial] = 1
+                agregar_columna_logica(idx_artificial, i, 1)
                 self.vars_basicas[i] = idx_artificial
                 self.vars_artificiales.append(idx_artificial)
                 self.indices_artificiales.append(idx_artificial)
                 self.vars_artificiales_idx.append(idx_artificial)
-                nuevo_c[idx_artificial] = -self.M
+                nuevo_c[idx_artificial] = costo_artificial
                 idx_artificial += 1
         
-        # Actualizar matrices
-        self.A = nueva_A
         self.c = nuevo_c
         
-        # Manejar RHS negativos
-        for i in range(len(self.b)):
-            if self.b[i] < 0:
-                self.A[i] = -self.A[i]
-                self.b[i] = -self.b[i]
-                if self.desigualdades[i] == ">=":
-                    self.desigualdades[i] = "<="
-                elif self.desigualdades[i] == "<=":
-                    self.desigualdades[i] = ">="
+        # Las holguras y artificiales no tienen cota superior
+        cotas = np.full(total_vars, np.inf)
+        cotas[:self.num_variables] = self._cotas_superiores
+        self._cotas_superiores = cotas
+        self._invertida = np.zeros(total_vars, dtype=bool)
+        
+        # Establecer variables básicas y no básicas como arreglos de índices
+        self._inicializar_indices_base(total_vars)
+
+    def _convertir_a_forma_estandar(self, sin_artificiales=False):
+        """Convierte el problema a forma estándar agregando variables de holgura y artificiales"""
+        self._preparar_forma_estandar(sin_artificiales)
+        
+        # Crear matriz expandida
+        total_vars = len(self.c)
+        nueva_A = np.zeros((self.num_restricciones, total_vars))
+        nueva_A[:, :self.num_variables] = self.A
+        columnas_logicas = np.arange(self.num_variables, total_vars)
+        nueva_A[self._filas_logicas, columnas_logicas] = self._signos_logicos
+        
+        self.A = nueva_A
+
+    def _convertir_a_forma_dual(self):
+        """
+        Forma estándar sin artificiales para el simplex dual
+        
+        Cada fila se escribe como <=: las >= se multiplican por -1 y las = se parten
+        en dos desigualdades. Las holguras forman la base inicial aunque algún lado
+        derecho quede negativo (infactibilidad primal que el simplex dual elimina).
+        """
+        filas, signos = [], []
+        for i, desigualdad in enumerate(self.desigualdades):
+            if desigualdad in ("<=", "="):
+                filas.append(i)
+                signos.append(1.0)
+            if desigualdad in (">=", "="):
+                filas.append(i)
+                signos.append(-1.0)
+        signos = np.array(signos)
+        self._signo_filas = signos
+        self._fila_original = np.array(filas, dtype=np.intp)
+        self.A = self.A[self._fila_original] * signos[:, np.newaxis]
+        self.b = self.b[self._fila_original] * signos
+        self.num_restricciones = len(filas)
+        self._convertir_a_forma_estandar(sin_artificiales=True)
+
+    def _es_dual_factible_inicial(self):
+        """
+        Indica si conviene el simplex dual: hay filas que pedirían artificiales y la
+        base de holguras es dual factible (c_j <= 0 en forma de max, o x_j acotada
+        para poder ponerla en su cota superior)
+        """
+        if es_dispersa(self.A):
+            return False
+        necesita_artificiales = any(d != "<=" for d in self.desigualdades) or (self.b < 0).any()
+        superiores = self.cotas_superiores if self.cotas_superiores is not None else np.inf
+        acotadas = np.isfinite(superiores) & np.ones(self.num_variables, dtype=bool)
+        return necesita_artificiales and bool(np.all((self.c[:self.num_variables] <= self.epsilon) | acotadas))
+
+    def _inicializar_indices_base(self, total_vars):
+        """
+        Construye los arreglos de índices de la base con búsqueda O(1)
+
+        _fila_basica[j] es la fila en la que la variable j es básica (-1 si no lo es)
+        y _pos_no_basica[j] es su posición dentro de vars_no_basicas (-1 si es básica).
+        """
+        self.vars_basicas = np.asarray(self.vars_basicas, dtype=np.intp)
+        self._fila_basica = np.full(total_vars, -1, dtype=np.intp)
+        self._fila_basica[self.vars_basicas] = np.arange(len(self.vars_basicas))
+        
+        self.vars_no_basicas = np.flatnonzero(self._fila_basica < 0)
+        self._pos_no_basica = np.full(total_vars, -1, dtype=np.intp)
+        self._pos_no_basica[self.vars_no_basicas] = np.arange(len(self.vars_no_basicas))
         
-        # Establecer variables no básicas
-        self.vars_no_basicas = list(set(range(total_vars)) - set(self.vars_basicas))
+        self._es_artificial = np.zeros(total_vars, dtype=bool)
+        self._es_artificial[[i for i in self.indices_artificiales if i < total_vars]] = True
 
     def _crear_tableau_inicial(self):
         """Crea el tableau inicial del método simplex"""
@@ -177,296 +402,1178 @@ class SolucionadorPL:
         self.tableau = np.zeros((filas, columnas))
         self.tableau[:self.num_restricciones, :self.A.shape[1]] = self.A
         self.tableau[:self.num_restricciones, -1] = self.b
-        self.tableau[self.num_restricciones, :self.A.shape[1]] = -self.c
         
-        # Aplicar método Big M si hay variables artificiales
-        if len(self.vars_artificiales) > 0:
+        if len(self.vars_artificiales) > 0 and self.metodo == "dos_fases":
+            # Fase I: maximizar -(suma de artificiales)
             if self.verbose:
+                print("\nFase I: minimizando la suma de las variables artificiales")
+            costos = np.zeros(self.A.shape[1])
+            costos[self.indices_artificiales] = -1.0
+            self._establecer_fila_objetivo(costos)
+        else:
+            # Aplicar método Big M si hay variables artificiales
+            if len(self.vars_artificiales) > 0 and self.verbose:
                 print("\nAplicando método Big M para variables artificiales")
-            
-            for art_idx in self.indices_artificiales:
-                for j in range(self.num_restricciones):
-                    if art_idx == self.vars_basicas[j]:
-                        coeff = self.tableau[self.num_restricciones, art_idx]
-                        self.tableau[self.num_restricciones, :] += (-coeff) * self.tableau[j, :]
-                        break
+            self._establecer_fila_objetivo(self.c)
+        
+        self._asignar_buffers()
+        self._inicializar_pricing()
+        self.historial_tableaux.append(self.tableau.copy(), self.vars_basicas)
+
+    def _inicializar_pricing(self):
+        """Prepara la estrategia de pricing para las columnas del tableau actual"""
+        normas = None
+        if self.pricing.usa_normas:
+            restricciones = self.tableau[:self.num_restricciones, :-1]
+            normas = 1.0 + np.einsum("ij,ij->j", restricciones, restricciones)
+        self.pricing.inicializar(self.tableau.shape[1] - 1, normas)
+
+    def _asignar_buffers(self):
+        """Buffers preasignados para el pivoteo y la prueba de la razón"""
+        self._buffer_pivoteo = np.empty_like(self.tableau)
+        self._buffer_columna = np.empty(self.tableau.shape[0])
+        self._buffer_razones = np.empty(self.num_restricciones)
+        self._sale_en_cota_superior = False
+
+    def _establecer_fila_objetivo(self, costos):
+        """Escribe la fila z para los costos dados y la expresa en términos de la base actual"""
+        m = self.num_restricciones
+        n = len(costos)
+        invertida = self._invertida[:n]
+        self.tableau[m, :] = 0.0
+        # Las columnas invertidas (u_j - x_j) cambian de signo y aportan c_j·u_j al valor
+        self.tableau[m, :n] = np.where(invertida, costos, -costos)
+        self.tableau[m, -1] = costos[invertida] @ self._cotas_superiores[:n][invertida]
+        self.tableau[m, :] -= self.tableau[m, self.vars_basicas] @ self.tableau[:m, :]
+
+    def _etiqueta_variable(self, idx):
+        """Nombre para mostrar de la variable con índice idx"""
+        if idx in self.vars_artificiales_idx:
+            return f"a{self.vars_artificiales_idx.index(idx)+1}"
+        if self.presolve is not None and self.presolve.columnas is not None:
+            # Con presolve se muestran los nombres del modelo original
+            columnas = self.presolve.columnas
+            if idx < len(columnas):
+                return f"x{columnas[idx]+1}"
+            return f"x{idx - len(columnas) + self.presolve.num_variables + 1}"
+        return f"x{idx+1}"
+
+    def _etiquetas_tableau(self, filas, columnas, vars_basicas=None):
+        """
+        Calcula el orden de columnas para mostrar un tableau y sus etiquetas
         
-        self.historial_tableaux.append(self.tableau.copy())
+        Args:
+            vars_basicas: Básica de cada fila (None = la base actual del solucionador)
+        
+        Returns:
+            tuple: (nuevo_orden, etiquetas_columnas, etiquetas_filas)
+        """
+        # El orden y las etiquetas de columnas solo cambian con la forma estándar:
+        # se calculan una vez y se comparten entre iteraciones
+        clave = (columnas, tuple(self.vars_originales), tuple(self.vars_holgura),
+                 tuple(self.vars_artificiales_idx), id(self.presolve))
+        if self._cache_etiquetas is None or self._cache_etiquetas[0] != clave:
+            idx_art = [idx for idx in self.vars_artificiales_idx if idx < columnas - 1]
+            nuevo_orden = np.array(self.vars_originales + self.vars_holgura + idx_art + [columnas - 1],
+                                   dtype=np.intp)
+            etiquetas_col = [self._etiqueta_variable(idx) for idx in nuevo_orden[:-1]]
+            etiquetas_col.append("LD")
+            etiquetas_var = {idx: etiqueta for idx, etiqueta in zip(nuevo_orden[:-1].tolist(), etiquetas_col)}
+            self._cache_etiquetas = (clave, nuevo_orden, etiquetas_col, etiquetas_var)
+        _, nuevo_orden, etiquetas_col, etiquetas_var = self._cache_etiquetas
+        
+        if vars_basicas is None:
+            vars_basicas = self.vars_basicas
+        etiquetas_fila = []
+        for j in range(filas - 1):
+            if j < len(vars_basicas):
+                var = int(vars_basicas[j])
+                etiquetas_fila.append(etiquetas_var.get(var) or self._etiqueta_variable(var))
+            else:
+                etiquetas_fila.append(f"r{j+1}")
+        etiquetas_fila.append("z")
+        
+        return nuevo_orden, etiquetas_col, etiquetas_fila
 
     def _mostrar_tableau(self, iteracion=None):
         """Muestra el tableau actual en formato tabular"""
         if not self.verbose:
             return
         
-        tableau = self.tableau.copy()
+        titulo = f"Iteración {iteracion}" if iteracion is not None else "Tableau Inicial"
+        print(f"\n{titulo}")
+        print(self._formatear_tableau(self.tableau))
+
+    def _formatear_tableau(self, tableau, vars_basicas=None):
+        """Texto en forma de grilla de un tableau, con filas y columnas etiquetadas"""
+        # tabulate solo se carga cuando hay salida detallada
+        from tabulate import tabulate
+        
         filas, columnas = tableau.shape
         
-        # Reorganizar columnas para mejor visualización
-        idx_orig = self.vars_originales
-        idx_holgura = self.vars_holgura
-        idx_art = self.vars_artificiales_idx
-        idx_rhs = [columnas - 1]
-        
-        nuevo_orden = idx_orig + idx_holgura + idx_art + idx_rhs
-        tableau_reorg = np.zeros((filas, len(nuevo_orden)))
-        
-        for i, idx_anterior in enumerate(nuevo_orden):
-            tableau_reorg[:, i] = tableau[:, idx_anterior]
-        
-        # Crear etiquetas de columnas
-        headers = []
-        for i in idx_orig:
-            headers.append(f"x{i+1}")
-        for i in idx_holgura:
-            headers.append(f"x{i+1}")
-        for i, idx in enumerate(idx_art):
-            headers.append(f"a{i+1}")
-        headers.append("LD")
-        
-        # Crear etiquetas de filas
-        etiquetas_filas = []
-        for j in range(filas - 1):
-            idx_basica = self.vars_basicas[j]
-            if idx_basica in self.vars_originales:
-                etiquetas_filas.append(f"x{idx_basica+1}")
-            elif idx_basica in self.vars_holgura:
-                etiquetas_filas.append(f"x{idx_basica+1}")
-            elif idx_basica in self.vars_artificiales_idx:
-                etiquetas_filas.append(f"a{self.vars_artificiales_idx.index(idx_basica)+1}")
-        etiquetas_filas.append("z")
+        # Reorganizar columnas para mejor visualización (una sola indexación)
+        nuevo_orden, headers, etiquetas_filas = self._etiquetas_tableau(filas, columnas, vars_basicas)
+        tableau_reorg = tableau[:, nuevo_orden]
         
         # Formatear números
         if self.usar_fracciones:
-            tableau_str = np.zeros_like(tableau_reorg, dtype=object)
-            for i in range(filas):
-                for j in range(len(nuevo_orden)):
-                    frac = Fraction(tableau_reorg[i, j]).limit_denominator()
-                    if frac.denominator == 1:
-                        tableau_str[i, j] = str(frac.numerator)
-                    else:
-                        tableau_str[i, j] = f"{frac.numerator}/{frac.denominator}"
+            tableau_str = self._formato_fracciones.formatear(tableau_reorg)
+            # Ya se sabe qué columnas son enteras: tabulate no vuelve a analizar cada texto
+            alineacion = ["left"] + ["decimal" if "/" not in "".join(columna) else "left"
+                                     for columna in tableau_str.T]
             tableau_mostrar = tabulate(tableau_str, headers=headers, 
-                                     showindex=etiquetas_filas, tablefmt="grid")
+                                     showindex=etiquetas_filas, tablefmt="grid",
+                                     disable_numparse=True, colalign=alineacion)
         else:
             tableau_mostrar = tabulate(tableau_reorg, headers=headers, 
                                      showindex=etiquetas_filas, tablefmt="grid")
-        
-        titulo = f"Iteración {iteracion}" if iteracion is not None else "Tableau Inicial"
-        print(f"\n{titulo}")
-        print(tableau_mostrar)
+        return tableau_mostrar
 
     def _seleccionar_columna_pivote(self):
-        """Selecciona la columna pivote usando la regla del más negativo"""
+        """Selecciona la columna pivote con la estrategia de pricing configurada"""
         fila_objetivo = self.tableau[self.num_restricciones, :-1]
-        idx_min = np.argmin(fila_objetivo)
-        
-        if fila_objetivo[idx_min] >= -self.epsilon:
-            return -1  # Solución óptima encontrada
-        
-        return idx_min
+        return self.pricing.seleccionar(fila_objetivo, self.epsilon)  # -1: solución óptima
 
     def _seleccionar_fila_pivote(self, col_pivote):
-        """Selecciona la fila pivote usando la prueba de la razón mínima"""
-        razones = []
+        """
+        Selecciona la fila pivote usando la prueba de la razón mínima (vectorizada)
         
-        for i in range(self.num_restricciones):
-            if self.tableau[i, col_pivote] <= self.epsilon:
-                razones.append(float('inf'))
-            else:
-                razones.append(self.tableau[i, -1] / self.tableau[i, col_pivote])
+        Con cotas superiores también limitan el paso las básicas que suben hasta su
+        cota y la propia variable entrante; en ese último caso devuelve CAMBIO_DE_COTA.
+        """
+        m = self.num_restricciones
+        columna = self.tableau[:m, col_pivote]
+        lado_derecho = self.tableau[:m, -1]
+        self._sale_en_cota_superior = False
         
-        if all(r == float('inf') for r in razones):
-            return -1  # Problema no acotado
+        # Solo participan las filas con coeficiente positivo y razón no negativa
+        validos = columna > self.tolerancia_pivote
         
-        # Encontrar la razón mínima no negativa
-        razon_min = float('inf')
-        idx_min = -1
+        # Los lados derechos negativos solo pueden venir del redondeo: se tratan como cero
+        razones = self._buffer_razones
+        razones.fill(np.inf)
+        np.divide(np.maximum(lado_derecho, 0.0), columna, out=razones, where=validos)
         
-        for i, razon in enumerate(razones):
-            if 0 <= razon < razon_min:
-                razon_min = razon
-                idx_min = i
+        idx_min = int(np.argmin(razones))
+        paso = razones[idx_min]
+        
+        if self.cotas_superiores is not None:
+            # Básicas que crecen hasta su cota superior
+            cotas = self._cotas_superiores[self.vars_basicas]
+            hacia_cota = (columna < -self.tolerancia_pivote) & np.isfinite(cotas)
+            if hacia_cota.any():
+                razones_cota = np.full(m, np.inf)
+                np.divide(np.maximum(cotas - lado_derecho, 0.0), -columna,
+                          out=razones_cota, where=hacia_cota)
+                idx_cota = int(np.argmin(razones_cota))
+                if razones_cota[idx_cota] < paso:
+                    idx_min, paso = idx_cota, razones_cota[idx_cota]
+                    self._sale_en_cota_superior = True
+            
+            # La entrante llega a su propia cota antes que cualquier básica
+            if self._cotas_superiores[col_pivote] <= paso and np.isfinite(self._cotas_superiores[col_pivote]):
+                self._sale_en_cota_superior = False
+                return CAMBIO_DE_COTA
+        
+        if paso == np.inf:
+            return -1  # Problema no acotado
         
         return idx_min
 
+    def _invertir_columna(self, col):
+        """
+        Cambio de cota de una no básica: sustituye x_j por u_j - x_j en el tableau
+        (la columna cambia de signo y el lado derecho absorbe u_j veces la columna)
+        """
+        self.tableau[:, -1] -= self._cotas_superiores[col] * self.tableau[:, col]
+        self.tableau[:, col] *= -1
+        self._invertida[col] = not self._invertida[col]
+
     def _pivotear(self, fila_pivote, col_pivote):
-        """Realiza las operaciones de pivoteo en el tableau"""
+        """Realiza las operaciones de pivoteo en el tableau (actualización de rango 1 in situ)"""
         elemento_pivote = self.tableau[fila_pivote, col_pivote]
         
         if self.verbose:
             print(f"  Elemento pivote: {elemento_pivote:.4f}")
         
+        # Actualizar los pesos del pricing con la columna y fila antes del pivoteo
+        m = self.num_restricciones
+        alfa_col = self.tableau[:m, col_pivote]
+        alfa_fila = self.tableau[fila_pivote, :-1] if self.pricing.usa_fila_pivote else None
+        productos = self.tableau[:m, :-1].T @ alfa_col if self.pricing.usa_productos else None
+        self.pricing.actualizar(fila_pivote, col_pivote, int(self.vars_basicas[fila_pivote]),
+                                alfa_col, alfa_fila, productos)
+        
         # Normalizar fila pivote
-        self.tableau[fila_pivote] = self.tableau[fila_pivote] / elemento_pivote
+        fila = self.tableau[fila_pivote]
+        fila /= elemento_pivote
         
-        # Eliminar en otras filas
-        for i in range(self.tableau.shape[0]):
-            if i != fila_pivote:
-                factor = self.tableau[i, col_pivote]
-                self.tableau[i] = self.tableau[i] - factor * self.tableau[fila_pivote]
+        # Eliminar en las demás filas: T -= columna ⊗ fila_pivote
+        columna = self._buffer_columna
+        np.copyto(columna, self.tableau[:, col_pivote])
+        columna[fila_pivote] = 0.0
+        np.multiply(columna[:, np.newaxis], fila, out=self._buffer_pivoteo)
+        self.tableau -= self._buffer_pivoteo
         
-        # Actualizar variables básicas
-        var_saliente = self.vars_basicas[fila_pivote]
-        var_entrante = col_pivote
+        # La columna pivote queda exactamente como vector unitario
+        self.tableau[:, col_pivote] = 0.0
+        self.tableau[fila_pivote, col_pivote] = 1.0
+        
+        var_saliente = int(self.vars_basicas[fila_pivote])
+        self._actualizar_base(fila_pivote, col_pivote)
+        fila_final = self.tableau[fila_pivote].copy()
+        
+        # La básica que llegó a su cota superior sale como no básica en esa cota
+        inversion = None
+        if self._sale_en_cota_superior:
+            inversion = (var_saliente, self._cotas_superiores[var_saliente])
+            self._invertir_columna(var_saliente)
+            self._sale_en_cota_superior = False
+        
+        # Solo la fila y la columna pivote; el historial reconstruye el tableau al pedirlo
+        self.historial_tableaux.registrar_pivote(self.tableau, fila_pivote, col_pivote,
+                                                 fila_final, columna, inversion)
+
+    def _actualizar_base(self, fila_pivote, var_entrante):
+        """Intercambia la variable entrante y la saliente en los arreglos de índices en O(1)"""
+        var_saliente = int(self.vars_basicas[fila_pivote])
+        pos = self._pos_no_basica[var_entrante]
         
         self.vars_basicas[fila_pivote] = var_entrante
+        self.vars_no_basicas[pos] = var_saliente
         
-        if var_saliente in self.vars_artificiales:
-            self.vars_artificiales.remove(var_saliente)
+        self._fila_basica[var_entrante] = fila_pivote
+        self._fila_basica[var_saliente] = -1
+        self._pos_no_basica[var_saliente] = pos
+        self._pos_no_basica[var_entrante] = -1
         
-        self.vars_no_basicas = list(set(range(self.tableau.shape[1] - 1)) - set(self.vars_basicas))
-        self.historial_tableaux.append(self.tableau.copy())
+        if self._es_artificial[var_saliente] and var_saliente in self.vars_artificiales:
+            self.vars_artificiales.remove(var_saliente)
 
-    def resolver(self):
+    def resolver(self, base=None):
         """
         Resuelve el problema de programación lineal usando el método simplex
         
+        Args:
+            base: BaseSimplex de una resolución anterior (ver exportar_base); si es
+                  primal factible se reoptimiza desde ella en lugar de la base de holguras
+        
         Returns:
             tuple: (solución, valor_objetivo)
         """
+        self.presolve = None
+        self._base_final = None
+        self.arranque_en_caliente = False
+        self._calculo_sensibilidad = None
+        self._sensibilidad = None
+        self.motor_usado = None
+        if base is not None and not base.es_compatible(self.num_variables, len(self.b)):
+            if self.verbose:
+                print("La base inicial no corresponde a las dimensiones del modelo; se ignora")
+            base = None
+        
+        try:
+            if self.exacto:
+                resultado = self._resolver_exacto()
+            elif self.usar_presolve:
+                resultado = self._resolver_con_presolve(base)
+            else:
+                resultado = self._resolver_modelo(base)
+                self._base_final = self._base_actual()
+        finally:
+            # Un pedido de cancelación vale para la resolución en curso (o la siguiente)
+            self.cancelacion.clear()
+        if self.al_evento is not None:
+            solucion, valor_objetivo = resultado
+            tipo = self.estado
+            if tipo == "optimo" and self.tiene_artificiales_en_solucion():
+                tipo = INFACTIBLE
+            self._emitir(tipo, solucion=solucion, valor=valor_objetivo)
+        return resultado
+
+    def resolver_eventos(self, base=None):
+        """
+        Resuelve como resolver() pero entrega los pasos a medida que ocurren
+        
+        La resolución corre en un hilo aparte y cada evento se copia (ver
+        EventoSimplex.copiar) antes de pasarlo, así quien consume puede guardarlo
+        mientras el solver sigue. El último evento es el estado final (optimo,
+        no_acotado, infactible o max_iteraciones) con la solución y su valor; las
+        excepciones del solver se vuelven a lanzar aquí.
+        
+        Args:
+            base: BaseSimplex de una resolución anterior (ver resolver)
+        
+        Yields:
+            EventoSimplex: Tableau inicial, pivotes, iteraciones, cambio de fase y estado final
+        """
+        cola = queue.Queue()
+        fin = object()
+        anterior = self.al_evento
+        
+        def trabajar():
+            try:
+                self.resolver(base)
+            except BaseException as error:
+                cola.put(error)
+            finally:
+                cola.put(fin)
+        
+        self.al_evento = lambda evento: cola.put(evento.copiar())
+        hilo = threading.Thread(target=trabajar, daemon=True)
+        hilo.start()
+        try:
+            while True:
+                evento = cola.get()
+                if evento is fin:
+                    break
+                if isinstance(evento, BaseException):
+                    raise evento
+                yield evento
+        finally:
+            if hilo.is_alive():
+                # Se dejó de consumir el generador: no tiene sentido seguir resolviendo
+                self.cancelar()
+            hilo.join()
+            self.al_evento = anterior
+
+    def cancelar(self):
+        """
+        Pide detener la resolución en curso; se puede llamar desde otro hilo
+        
+        El solver termina antes del próximo pivote con estado "cancelado" y
+        devuelve el punto en que quedó (no óptimo). Si no hay una resolución en
+        curso, se detiene la siguiente en cuanto empieza.
+        """
+        self.cancelacion.set()
+
+    def _emitir(self, tipo, **datos):
+        """Pasa un EventoSimplex a self.al_evento (sin oyente no se construye nada)"""
+        if self.al_evento is not None:
+            self.al_evento(EventoSimplex(tipo, self.iteraciones, **datos))
+
+    def _emitir_tableau(self, tipo, fila=None, columna=None):
+        """Evento con el tableau actual y su posición en el historial"""
+        if self.al_evento is not None:
+            self._emitir(tipo, fila=fila, columna=columna, tableau=self.tableau,
+                         indice_historial=len(self.historial_tableaux) - 1)
+
+    def _resolver_exacto(self):
+        """
+        Resuelve con SimplexExacto (tableau entero con pivoteo de Bareiss)
+        
+        Usa siempre dos fases; el presolve, el escalamiento, el arranque en caliente
+        y el análisis de sensibilidad no se aplican en este modo.
+        
+        Returns:
+            tuple: (solución como arreglo de Fraction, valor objetivo Fraction)
+        """
+        motor = SimplexExacto(self.c, self.A, self.b, self.desigualdades,
+                              self.cotas_inferiores, self.cotas_superiores,
+                              max_iteraciones=self.max_iteraciones, verbose=self.verbose,
+                              usar_fracciones=self.usar_fracciones, al_evento=self.al_evento,
+                              cancelacion=self.cancelacion)
+        self._motor_exacto = motor
+        self.algoritmo = "primal"
+        self.motor_usado = "exacto"
+        self.estado = motor.resolver()
+        self.iteraciones = motor.iteraciones
+        self.historial_tableaux = motor.historial
+        # Índices de columnas del tableau exacto para las etiquetas de visualizar_tableaux
+        n = motor.num_variables
+        self.vars_originales = list(range(n))
+        self.vars_holgura = list(range(n, min(motor.indices_artificiales, default=len(motor.etiquetas))))
+        self.vars_artificiales_idx = list(motor.indices_artificiales)
+        self.vars_basicas = np.array(motor.vars_basicas)
+        self._informar_estado()
+        
+        solucion = np.array(motor.solucion(), dtype=object)
+        valor_objetivo = motor.valor_objetivo() if self.estado == "optimo" else sum(self.c * solucion)
+        if self.tipo_problema == "min":
+            valor_objetivo = -valor_objetivo
+        return solucion, valor_objetivo
+
+    def exportar_base(self):
+        """
+        Base final de la última resolución para arrancar en caliente otra
+        
+        Returns:
+            BaseSimplex o None si la última resolución no construyó una base
+        """
+        return self._base_final
+
+    def _base_actual(self):
+        """Construye la BaseSimplex de la base actual en índices del modelo cargado"""
+        n = self.num_variables
+        basicas = np.asarray(self.vars_basicas, dtype=np.intp)
+        logicas = basicas[basicas >= n]
+        logicas = logicas[~self._es_artificial[logicas]]
+        no_basicas = np.setdiff1d(np.arange(n), basicas)
+        filas = self._filas_logicas[logicas - n]
+        if self._fila_original is not None:
+            # Filas del tableau dual (las = aparecen dos veces) a filas del modelo
+            filas = self._fila_original[filas]
+        return BaseSimplex(np.sort(basicas[basicas < n]),
+                           np.unique(filas),
+                           no_basicas[self._invertida[no_basicas]],
+                           n, len(self.desigualdades))
+
+    def _base_estandar(self, base):
+        """
+        Traduce una BaseSimplex a columnas de la forma estándar, una básica por fila
+        
+        Las columnas dependientes se descartan y las filas que quedan sin básica
+        conservan su holgura o artificial inicial, así la base siempre es invertible.
+        
+        Returns:
+            tuple: (vars_basicas, columnas no básicas en cota superior)
+        """
+        n, m = self.num_variables, self.num_restricciones
+        logicas = np.arange(n, n + len(self._filas_logicas))
+        holguras = logicas[~self._es_artificial[logicas]]
+        holgura_de_fila = np.full(len(self.desigualdades), -1, dtype=np.intp)
+        holgura_de_fila[self._filas_logicas[holguras - n]] = holguras
+        
+        candidatas = np.concatenate((base.estructurales, holgura_de_fila[base.filas_holgura]))
+        candidatas = candidatas[candidatas >= 0]
+        columnas = np.zeros((m, len(candidatas)))
+        for k, j in enumerate(candidatas):
+            if j >= n:
+                columnas[self._filas_logicas[j - n], k] = self._signos_logicos[j - n]
+            elif es_dispersa(self.A):
+                columnas[:, k] = self.A.columna(j)
+            else:
+                columnas[:, k] = self.A[:, j]
+        
+        filas_pivote = columnas_independientes(columnas, self.tolerancia_pivote)
+        aceptadas = filas_pivote >= 0
+        vars_basicas = np.array(self.vars_basicas, dtype=np.intp)
+        vars_basicas[filas_pivote[aceptadas]] = candidatas[aceptadas]
+        
+        en_cota = base.en_cota_superior
+        en_cota = en_cota[np.isfinite(self._cotas_superiores[en_cota])]
+        en_cota = np.setdiff1d(en_cota, vars_basicas)
+        
+        if self.verbose:
+            print(f"\nArranque en caliente: {int(aceptadas.sum())} columnas de la base "
+                  f"inicial aceptadas, {len(candidatas) - int(aceptadas.sum())} descartadas")
+        return vars_basicas, en_cota
+
+    def _instalar_base_tableau(self, base):
+        """
+        Reescribe el tableau inicial en términos de la base dada (T = B⁻¹·[A | b])
+        
+        Returns:
+            str: "primal" si la base es primal factible, "dual" si solo es dual factible
+                 (la reoptimiza el simplex dual) o None si no es ninguna de las dos, en
+                 cuyo caso el tableau vuelve a la base de holguras y artificiales
+        """
+        m = self.num_restricciones
+        vars_basicas, en_cota = self._base_estandar(base)
+        tableau_inicial = self.tableau.copy()
+        vars_basicas_iniciales = self.vars_basicas.copy()
+        
+        for col in en_cota:
+            self._invertir_columna(col)
+        self.tableau[:m] = np.linalg.solve(self.tableau[:m, vars_basicas], self.tableau[:m])
+        self.tableau[:m, vars_basicas] = np.eye(m)
+        
+        valores = self.tableau[:m, -1]
+        tol = self.tolerancia_factibilidad
+        factible = not ((valores < -tol).any() or (valores > self._cotas_superiores[vars_basicas] + tol).any())
+        
+        self.vars_basicas = vars_basicas
+        self._inicializar_indices_base(self.tableau.shape[1] - 1)
+        self.vars_artificiales = [v for v in self.indices_artificiales if self._fila_basica[v] >= 0]
+        
+        if not factible:
+            self._establecer_fila_objetivo(self.c)
+            if self._hacer_dual_factible():
+                if self.verbose:
+                    print("La base inicial es dual factible; se reoptimiza con el simplex dual")
+                self._inicializar_pricing()
+                self.historial_tableaux.reemplazar_ultima(self.tableau.copy(), self.vars_basicas)
+                self.arranque_en_caliente = True
+                return "dual"
+            if self.verbose:
+                print("La base inicial no es primal ni dual factible; se resuelve desde la base de holguras")
+            self.tableau = tableau_inicial
+            self._invertida[:] = False
+            self.vars_basicas = vars_basicas_iniciales
+            self._inicializar_indices_base(self.tableau.shape[1] - 1)
+            self.vars_artificiales = [v for v in self.indices_artificiales if self._fila_basica[v] >= 0]
+            return None
+        
+        if self.metodo == "dos_fases" and len(self.indices_artificiales) > 0:
+            costos = np.zeros(self.tableau.shape[1] - 1)
+            costos[self.indices_artificiales] = -1.0
+            self._establecer_fila_objetivo(costos)
+        else:
+            self._establecer_fila_objetivo(self.c)
+        self._inicializar_pricing()
+        self.historial_tableaux.reemplazar_ultima(self.tableau.copy(), self.vars_basicas)
+        self.arranque_en_caliente = True
+        return "primal"
+
+    def _resolver_con_presolve(self, base=None):
+        """
+        Reduce el modelo, resuelve el reducido y reconstruye la solución original
+        
+        Durante la resolución los atributos del problema (c, A, b, ...) son los del
+        modelo reducido; al terminar se restauran los originales.
+        """
+        presolve = Presolve(self.c, self.A, self.b, self.desigualdades,
+                            self.cotas_inferiores, self.cotas_superiores,
+                            tolerancia=self.tolerancia_factibilidad)
+        presolve.reducir()
+        self.presolve = presolve
+        if self.verbose:
+            print(presolve.resumen())
+        
+        original = (self.c, self.A, self.b, self.desigualdades, self.num_variables,
+                    self.num_restricciones, self.cotas_inferiores, self.cotas_superiores)
+        if presolve.estado is None:
+            num_columnas, num_filas = len(presolve.columnas), len(presolve.filas)
+            if base is not None:
+                base = base.traducir(presolve.columnas, presolve.filas, num_columnas, num_filas)
+            self.c = presolve.c
+            self.A = presolve.A
+            self.b = presolve.b
+            self.desigualdades = presolve.desigualdades
+            self.num_variables = num_columnas
+            self.num_restricciones = num_filas
+            self.cotas_inferiores = presolve.inferiores
+            self.cotas_superiores = presolve.superiores
+            try:
+                solucion_reducida, _ = self._resolver_modelo(base)
+                self._base_final = self._base_actual().expandir(
+                    presolve.columnas, presolve.filas, original[4], len(original[3]))
+            finally:
+                (self.c, self.A, self.b, self.desigualdades, self.num_variables,
+                 self.num_restricciones, self.cotas_inferiores, self.cotas_superiores) = original
+        else:
+            # El presolve ya decidió: infactible, no acotado u óptimo sin restricciones
+            solucion_reducida = None
+            self.estado = presolve.estado
+            self.iteraciones = 0
+            self._informar_estado()
+        
+        solucion = presolve.postsolve(solucion_reducida)
+        valor_objetivo = self.c @ solucion
+        if self.tipo_problema == "min":
+            valor_objetivo = -valor_objetivo
+        return solucion, valor_objetivo
+
+    def _escalar_modelo(self):
+        """
+        Reemplaza c, A, b y las cotas por su versión escalada (ver escalamiento.py)
+        
+        La solución se desescala en _extraer_solucion; el valor objetivo no cambia.
+        """
+        escalamiento = Escalamiento().calcular(self.A)
+        (self.c, self.A, self.b,
+         self.cotas_inferiores, self.cotas_superiores) = escalamiento.escalar(
+            self.c, self.A, self.b, self.cotas_inferiores, self.cotas_superiores)
+        self.escalamiento = escalamiento
+        
+        if self.verbose:
+            print(f"Escalamiento: rango de coeficientes {escalamiento.rango_original:.3g} "
+                  f"-> {escalamiento.rango_escalado:.3g}")
+
+    def _resolver_modelo(self, base=None):
+        """Resuelve el modelo cargado con el motor y método configurados"""
+        self.escalamiento = None
+        self._fila_original = None
+        self._signo_filas = None
+        self._filas_activas = None
+        self._b_modelo = np.array(self.b, dtype=float)
+        self._c_modelo = np.array(self.c[:self.num_variables], dtype=float)
+        if self.escalar or (self.escalar is None and debe_escalar(self.A)):
+            self._escalar_modelo()
+        
+        motor = self.motor
+        if es_dispersa(self.A) and motor in ("tableau", "dual"):
+            # El tableau densificaría A; el camino disperso usa el motor revisado
+            # solo para esta resolución (self.motor no cambia)
+            if self.verbose:
+                print("Matriz de restricciones dispersa: se usa el motor revisado")
+            motor = "revisado"
+        self.motor_usado = motor
+        
+        if motor == "revisado":
+            self.algoritmo = "primal"
+            return self._resolver_revisado(base)
+        
+        dual = motor == "dual" or (motor == "tableau" and self.dual_automatico)
+        if dual and base is None and self._es_dual_factible_inicial():
+            self.algoritmo = "dual"
+            return self._resolver_dual()
+        if motor == "dual" and base is None and self.verbose:
+            print("La base de holguras no es dual factible; se usa el simplex primal")
+        
         # Preparar problema
+        self.algoritmo = "primal"
         self._convertir_a_forma_estandar()
         self._crear_tableau_inicial()
+        arranque = self._instalar_base_tableau(base) if base is not None else None
+        self.iteraciones = 0
         self._mostrar_tableau(iteracion=0)
+        self._emitir_tableau(TABLEAU_INICIAL)
+        
+        if arranque == "dual":
+            # Base dual factible pero no primal factible: la reoptimiza el simplex dual
+            self.algoritmo = "dual"
+            self._iterar_simplex_dual()
+            valor_objetivo = self.tableau[self.num_restricciones, -1] if self.estado == "optimo" else None
+            return self._extraer_solucion(valor_objetivo)
+        
+        if self.metodo == "dos_fases" and len(self.indices_artificiales) > 0:
+            # Desde una base factible la Fase I no hace falta: solo se cierra
+            if arranque is None:
+                self._iterar_simplex(fase_uno=True)
+                if self.estado != "optimo":
+                    return self._extraer_solucion(None)
+            if not self._terminar_fase_uno():
+                return self._extraer_solucion(None)
+        
+        self._iterar_simplex()
+        
+        # Calcular valor objetivo
+        valor_objetivo = self.tableau[self.num_restricciones, -1]
+        return self._extraer_solucion(valor_objetivo)
+
+    def _iterar_simplex(self, fase_uno=False):
+        """
+        Ejecuta pivoteos sobre el tableau hasta alcanzar optimalidad, no acotamiento
+        o el límite de iteraciones; deja el resultado en self.estado
         
-        iteracion = 1
-        max_iteraciones = 100
+        Args:
+            fase_uno: Si es True se detiene en cuanto la suma de artificiales llega a cero
+        """
+        self.estado = "max_iteraciones"
         
         # Algoritmo simplex
-        while iteracion <= max_iteraciones:
+        while self.iteraciones < self.max_iteraciones:
+            if self.cancelacion.is_set():
+                self.estado = "cancelado"
+                break
+            
+            if fase_uno and self.tableau[self.num_restricciones, -1] >= -self.tolerancia_factibilidad:
+                self.estado = "optimo"
+                break
+            
             # Seleccionar columna pivote
             col_pivote = self._seleccionar_columna_pivote()
             if col_pivote == -1:
-                print("\n¡Solución óptima encontrada!")
+                self.estado = "optimo"
                 break
             
             # Seleccionar fila pivote
             fila_pivote = self._seleccionar_fila_pivote(col_pivote)
             if fila_pivote == -1:
-                print("\n¡El problema es no acotado!")
+                self.estado = "no_acotado"
                 break
             
+            if fila_pivote == CAMBIO_DE_COTA:
+                # La entrante pasa de una cota a la otra sin cambiar la base
+                if self.verbose:
+                    print(f"\nCambio de cota: {self._etiqueta_variable(col_pivote)} pasa a su otra cota")
+                self._invertir_columna(col_pivote)
+                self.historial_tableaux.registrar_inversion(self.tableau, col_pivote,
+                                                            self._cotas_superiores[col_pivote])
+                self.iteraciones += 1
+                self._mostrar_tableau(iteracion=self.iteraciones)
+                self._emitir_tableau(ITERACION, columna=col_pivote)
+                continue
+            
             if self.verbose:
                 print(f"\nPivote: Fila {fila_pivote+1}, Columna {col_pivote+1}")
+            self._emitir(PIVOTE, fila=fila_pivote, columna=col_pivote,
+                         elemento=self.tableau[fila_pivote, col_pivote])
             
             # Realizar pivoteo
             self._pivotear(fila_pivote, col_pivote)
-            self._mostrar_tableau(iteracion=iteracion)
+            self.iteraciones += 1
+            self._mostrar_tableau(iteracion=self.iteraciones)
+            self._emitir_tableau(ITERACION, fila_pivote, col_pivote)
+
+    def _hacer_dual_factible(self):
+        """
+        Lleva a su cota superior las no básicas con costo reducido negativo
+        
+        Returns:
+            bool: True si la fila z quedó dual factible (ninguna no básica mejora z)
+        """
+        d = self.tableau[self.num_restricciones, :-1]
+        malas = (d < -self.tolerancia_factibilidad) & (self._fila_basica < 0) & ~self._es_artificial
+        acotadas = malas & np.isfinite(self._cotas_superiores)
+        if (malas & ~acotadas).any():
+            return False
+        for col in np.flatnonzero(acotadas):
+            self._invertir_columna(col)
+        return True
+
+    def _seleccionar_fila_dual(self):
+        """
+        Elige la fila saliente del simplex dual: la básica más infactible
+        
+        Una básica por encima de su cota superior se sustituye por u - x, con lo que
+        queda negativa. Las artificiales se tratan como variables fijas en cero.
+        
+        Returns:
+            int: Fila con lado derecho negativo, o -1 si la base es primal factible
+        """
+        m = self.num_restricciones
+        valores = self.tableau[:m, -1]
+        cotas = np.where(self._es_artificial[self.vars_basicas], 0.0,
+                         self._cotas_superiores[self.vars_basicas])
+        violacion = np.maximum(-valores, valores - cotas)
+        fila = int(np.argmax(violacion)) if m > 0 else 0
+        if m == 0 or violacion[fila] <= self.tolerancia_factibilidad:
+            return -1
+        if valores[fila] > cotas[fila]:
+            self._invertir_basica(fila, cotas[fila])
+        return fila
+
+    def _invertir_basica(self, fila, cota):
+        """
+        Sustituye la básica de la fila por u - x: la fila cambia de signo salvo en
+        la columna básica y su lado derecho pasa a u - x (negativo si x > u)
+        """
+        var = int(self.vars_basicas[fila])
+        self.tableau[fila] *= -1
+        self.tableau[fila, var] = 1.0
+        self.tableau[fila, -1] += cota
+        if not self._es_artificial[var]:
+            self._invertida[var] = not self._invertida[var]
+
+    def _seleccionar_columna_dual(self, fila):
+        """
+        Prueba de la razón dual: entre las columnas con coeficiente negativo en la
+        fila saliente, la de menor |d_j / α_rj| (mantiene la fila z dual factible)
+        
+        Returns:
+            int: Columna entrante, o -1 si no hay ninguna (problema infactible)
+        """
+        alfa = self.tableau[fila, :-1]
+        d = self.tableau[self.num_restricciones, :-1]
+        validas = (alfa < -self.tolerancia_pivote) & ~self._es_artificial
+        if not validas.any():
+            return -1
+        razones = np.full(len(alfa), np.inf)
+        np.divide(np.maximum(d, 0.0), -alfa, out=razones, where=validas)
+        return int(np.argmin(razones))
+
+    def _iterar_simplex_dual(self):
+        """
+        Simplex dual sobre el tableau: parte de una fila z dual factible y pivotea
+        hasta que todas las básicas respetan sus cotas; deja el resultado en self.estado
+        """
+        self.estado = "max_iteraciones"
+        while self.iteraciones < self.max_iteraciones:
+            if self.cancelacion.is_set():
+                self.estado = "cancelado"
+                break
+            fila_pivote = self._seleccionar_fila_dual()
+            if fila_pivote == -1:
+                self.estado = "optimo"
+                break
+            
+            col_pivote = self._seleccionar_columna_dual(fila_pivote)
+            if col_pivote == -1:
+                self.estado = "infactible"
+                break
             
-            iteracion += 1
+            if self.verbose:
+                print(f"\nPivote dual: Fila {fila_pivote+1}, Columna {col_pivote+1}")
+            self._emitir(PIVOTE, fila=fila_pivote, columna=col_pivote,
+                         elemento=self.tableau[fila_pivote, col_pivote])
+            
+            self._pivotear(fila_pivote, col_pivote)
+            self.iteraciones += 1
+            self._mostrar_tableau(iteracion=self.iteraciones)
+            self._emitir_tableau(ITERACION, fila_pivote, col_pivote)
+
+    def _resolver_dual(self):
+        """Resuelve con el simplex dual desde la base de holguras, sin artificiales"""
+        if self.verbose:
+            print("\nBase de holguras dual factible: se usa el simplex dual")
+        self._convertir_a_forma_dual()
+        self._crear_tableau_inicial()
+        self._hacer_dual_factible()
+        self.historial_tableaux.reemplazar_ultima(self.tableau.copy(), self.vars_basicas)
+        self.iteraciones = 0
+        self._mostrar_tableau(iteracion=0)
+        self._emitir_tableau(TABLEAU_INICIAL)
+        self._iterar_simplex_dual()
+        valor_objetivo = self.tableau[self.num_restricciones, -1] if self.estado == "optimo" else None
+        return self._extraer_solucion(valor_objetivo)
+
+    def _terminar_fase_uno(self):
+        """
+        Cierra la Fase I: verifica factibilidad, expulsa de la base las artificiales
+        en nivel cero y elimina las columnas artificiales (y filas redundantes)
+        
+        Returns:
+            bool: False si la Fase I demostró que el problema es infactible
+        """
+        m = self.num_restricciones
+        if self.tableau[m, -1] < -self.tolerancia_factibilidad:
+            self.estado = "infactible"
+            return False
+        
+        inicio_artificiales = min(self.indices_artificiales)
+        redundantes = []
+        
+        for fila in np.flatnonzero(self._es_artificial[self.vars_basicas]):
+            coeficientes = np.abs(self.tableau[fila, :inicio_artificiales])
+            col = int(np.argmax(coeficientes))
+            if coeficientes[col] <= self.tolerancia_pivote:
+                # Fila combinación lineal de otras: no aporta nada a la Fase II
+                redundantes.append(int(fila))
+                continue
+            if self.verbose:
+                print(f"\nPivote: Fila {fila+1}, Columna {col+1} (expulsión de artificial)")
+            self._pivotear(fila, col)
+            self.iteraciones += 1
+            self._mostrar_tableau(iteracion=self.iteraciones)
+            self._emitir_tableau(ITERACION, int(fila), col)
+        
+        # Eliminar columnas artificiales y filas redundantes
+        filas = np.setdiff1d(np.arange(m + 1), redundantes)
+        columnas = np.append(np.arange(inicio_artificiales), self.tableau.shape[1] - 1)
+        self.tableau = np.ascontiguousarray(self.tableau[np.ix_(filas, columnas)])
+        self.filas_redundantes = redundantes
         
-        # Verificar límite de iteraciones
-        if iteracion > max_iteraciones:
+        self.vars_basicas = np.delete(self.vars_basicas, redundantes)
+        self._filas_activas = filas[:-1]
+        self.A = self.A[filas[:-1], :inicio_artificiales]
+        self.b = self.b[filas[:-1]]
+        self.c = self.c[:inicio_artificiales]
+        self._cotas_superiores = self._cotas_superiores[:inicio_artificiales]
+        self._invertida = self._invertida[:inicio_artificiales]
+        self.num_restricciones = len(self.vars_basicas)
+        self.vars_artificiales = []
+        self._inicializar_indices_base(inicio_artificiales)
+        self._asignar_buffers()
+        self._inicializar_pricing()
+        
+        # Fase II: función objetivo original expresada en la base factible
+        self._establecer_fila_objetivo(self.c)
+        if self.verbose:
+            print("\nFase II: se eliminan las variables artificiales y se optimiza el objetivo original")
+        self.historial_tableaux.append(self.tableau.copy(), self.vars_basicas)
+        self._mostrar_tableau(iteracion=self.iteraciones)
+        self._emitir_tableau(FASE_DOS)
+        return True
+
+    def _crear_motor_revisado(self, vars_basicas, costos):
+        """Construye el motor revisado sobre la forma estándar implícita"""
+        return SimplexRevisado(
+            self.A, self.b, costos, self._filas_logicas, self._signos_logicos,
+            vars_basicas, epsilon=self.epsilon, tolerancia_pivote=self.tolerancia_pivote,
+            max_iteraciones=self.max_iteraciones, pricing=self.pricing,
+            cotas_superiores=self._cotas_superiores, verbose=self.verbose,
+            al_evento=self.al_evento, cancelacion=self.cancelacion
+        )
+
+    def _resolver_revisado(self, base=None):
+        """Resuelve el problema con el motor simplex revisado (sin tableau)"""
+        self._preparar_forma_estandar()
+        dos_fases = self.metodo == "dos_fases" and len(self.indices_artificiales) > 0
+        
+        en_caliente = False
+        if base is not None:
+            vars_basicas, en_cota = self._base_estandar(base)
+            motor = self._crear_motor_revisado(vars_basicas, self.c)
+            motor.establecer_invertidas(en_cota)
+            en_caliente = motor.base_factible(self.tolerancia_factibilidad)
+            if not en_caliente and self.verbose:
+                print("La base inicial no es primal factible; se resuelve desde la base de holguras")
+        
+        if not en_caliente:
+            if dos_fases:
+                costos = np.zeros(len(self.c))
+                costos[self.indices_artificiales] = -1.0
+            else:
+                costos = self.c
+            motor = self._crear_motor_revisado(self.vars_basicas, costos)
+        self._motor_revisado = motor
+        self.arranque_en_caliente = en_caliente
+        
+        if dos_fases and en_caliente:
+            # La base ya es factible: se pasa directo a la Fase II
+            motor.expulsar_variables(self._es_artificial)
+            motor.cambiar_costos(self.c, excluidas=self._es_artificial)
+            self.estado = motor.resolver()
+        elif dos_fases:
+            if self.verbose:
+                print("\nFase I: minimizando la suma de las variables artificiales")
+            motor.objetivo_meta = -self.tolerancia_factibilidad
+            self.estado = motor.resolver()
+            if self.estado == "optimo" and motor.valor_objetivo() < -self.tolerancia_factibilidad:
+                self.estado = "infactible"
+            if self.estado == "optimo":
+                if self.verbose:
+                    print("\nFase II: se eliminan las variables artificiales y se optimiza el objetivo original")
+                motor.expulsar_variables(self._es_artificial)
+                motor.cambiar_costos(self.c, excluidas=self._es_artificial)
+                motor.objetivo_meta = None
+                self.iteraciones = motor.iteraciones
+                self._emitir(FASE_DOS)
+                self.estado = motor.resolver()
+        else:
+            self.estado = motor.resolver()
+        self.iteraciones = motor.iteraciones
+        
+        # Sincronizar la base final con los arreglos de índices del solucionador
+        self.vars_basicas = motor.vars_basicas
+        self._inicializar_indices_base(len(self.c))
+        self.vars_artificiales = [v for v in self.indices_artificiales if v in self.vars_basicas]
+        
+        self._invertida = motor.invertida
+        
+        valor_objetivo = None if self.estado == "infactible" else motor.valor_objetivo()
+        return self._extraer_solucion(valor_objetivo)
+
+    def analisis_sensibilidad(self):
+        """
+        Análisis post-óptimo de la última resolución, sin volver a resolver
+        
+        Se calcula a partir de la base óptima final la primera vez que se pide. Con
+        presolve no está disponible: la base es del modelo reducido, cuyas filas y
+        cotas ya no son las originales.
+        
+        Returns:
+            AnalisisSensibilidad (ver sensibilidad.py) o None si la última
+            resolución no terminó en una base óptima del modelo original
+        """
+        if self.presolve is not None:
+            return None
+        if self._sensibilidad is None and self._calculo_sensibilidad is not None:
+            self._sensibilidad = self._calculo_sensibilidad()
+        return self._sensibilidad
+
+    def _preparar_sensibilidad(self):
+        """
+        Reúne los datos de la base óptima que necesita calcular_sensibilidad y devuelve
+        el cálculo como función sin argumentos (B⁻¹ se lee o se resuelve solo si se pide)
+        """
+        n, m = self.num_variables, self.num_restricciones
+        total = len(self.c)
+        basicas = np.array(self.vars_basicas, dtype=np.intp)
+        signos = np.where(self._invertida[:total], -1.0, 1.0)
+        es_artificial = self._es_artificial[:total]
+        
+        # Fila del modelo cargado y factor (negación y escala) de cada fila del tableau
+        filas = np.arange(len(self._signo_filas)) if self._filas_activas is None else self._filas_activas
+        factores_filas = self._signo_filas[filas]
+        if self._fila_original is not None:
+            filas = self._fila_original[filas]
+        if self.escalamiento is not None:
+            factores_filas = factores_filas * self.escalamiento.factores_filas[filas]
+            factores_columnas = self.escalamiento.factores_columnas
+        else:
+            factores_columnas = np.ones(n)
+        
+        A = self.A
+        if self.motor_usado == "revisado":
+            filas_logicas, signos_logicos = self._filas_logicas, self._signos_logicos
+            
+            def producto_filas(W):
+                if es_dispersa(A):
+                    estructurales = np.array([A.producto_transpuesto(w) for w in W]).reshape(len(W), n)
+                else:
+                    estructurales = W @ A
+                return np.hstack((estructurales, W[:, filas_logicas] * signos_logicos)) * signos
+            
+            # Se resuelve con la factorización LU (y las etas) con que terminó el motor
+            factorizacion = self._motor_revisado.factorizacion
+            
+            def resolvedores():
+                return (lambda V: np.column_stack([factorizacion.ftran(v) for v in V.T]),
+                        lambda W: np.array([factorizacion.btran(w) for w in W]))
+        else:
+            def producto_filas(W):
+                return (W @ A) * signos
+            
+            tableau = self.tableau[:m, :-1]
+            
+            def resolvedores():
+                # B⁻¹ ya está en el tableau final, en las columnas de holgura, exceso y artificiales
+                inversa = inversa_desde_tableau(A, tableau, basicas, signos)
+                return (lambda V: inversa @ V), (lambda W: W @ inversa)
+        
+        argumentos = dict(
+            producto_filas=producto_filas, costos=self.c * signos, basicas=basicas,
+            valores=np.array(self.valores_basicos(), dtype=float),
+            cotas=np.where(es_artificial, 0.0, self._cotas_superiores[:total]),
+            excluidas=es_artificial, signos=signos, filas=filas, factores_filas=factores_filas,
+            factores_columnas=factores_columnas, b_modelo=self._b_modelo, c_modelo=self._c_modelo,
+            minimizar=self.tipo_problema == "min", tolerancia=self.tolerancia_pivote)
+        return lambda: calcular_sensibilidad(*resolvedores(), **argumentos)
+
+    def valores_basicos(self):
+        """Devuelve el valor de la variable básica de cada fila en la base actual"""
+        if self.motor_usado == "revisado":
+            return self._motor_revisado.x_basicas
+        return self.tableau[:self.num_restricciones, -1]
+
+    def tiene_artificiales_en_solucion(self):
+        """Verifica si alguna variable artificial quedó en la base con valor no cero"""
+        if self.exacto:
+            # Las dos fases exactas informan la infactibilidad en self.estado
+            return False
+        if self.presolve is not None and self.presolve.estado is not None:
+            # El presolve resolvió el problema sin construir una base
+            return False
+        valores = self.valores_basicos()
+        for i, var in enumerate(self.vars_basicas):
+            if var in self.indices_artificiales and abs(valores[i]) > self.epsilon:
+                return True
+        return False
+
+    def _informar_estado(self):
+        """Muestra el mensaje correspondiente al estado final"""
+        if not self.verbose:
+            return
+        if self.estado == "optimo":
+            print("\n¡Solución óptima encontrada!")
+        elif self.estado == "no_acotado":
+            print("\n¡El problema es no acotado!")
+        elif self.estado == "infactible" and self.presolve is not None and self.presolve.estado:
+            print("\n¡El problema es infactible! El presolve encontró restricciones incompatibles.")
+        elif self.estado == "infactible" and self.algoritmo == "dual":
+            print("\n¡El problema es infactible! El simplex dual encontró una fila sin pivote posible.")
+        elif self.estado == "infactible":
+            print("\n¡El problema es infactible! La Fase I terminó con artificiales positivas.")
+        elif self.estado == "cancelado":
+            print("\nResolución cancelada. La solución corresponde a la última base y no es óptima.")
+        else:
             print("\nAdvertencia: Se alcanzó el máximo de iteraciones. La solución puede no ser óptima.")
+
+    def _extraer_solucion(self, valor_objetivo):
+        """
+        Informa el estado final y construye (solución, valor_objetivo) en el sentido original
+        
+        Args:
+            valor_objetivo: Valor en forma de maximización sin la constante de las cotas;
+                            si es None se evalúa el objetivo original en la solución
+        """
+        self._informar_estado()
+        if self.estado == "optimo" and self.presolve is None and not self.tiene_artificiales_en_solucion():
+            self._calculo_sensibilidad = self._preparar_sensibilidad()
         
         # Extraer solución
+        valores = self.valores_basicos()
         solucion = np.zeros(self.num_variables)
         for i, var in enumerate(self.vars_basicas):
             if var < self.num_variables:
-                solucion[var] = self.tableau[i, -1]
+                solucion[var] = valores[i]
         
-        # Verificar factibilidad
-        tiene_artificial_en_solucion = False
-        for i, var in enumerate(self.vars_basicas):
-            if var in self.indices_artificiales and abs(self.tableau[i, -1]) > self.epsilon:
-                tiene_artificial_en_solucion = True
-                break
+        # Deshacer los cambios de cota y el desplazamiento de las cotas inferiores
+        invertidas = self._invertida[:self.num_variables]
+        solucion[invertidas] = self._cotas_superiores[:self.num_variables][invertidas] - solucion[invertidas]
+        if self.cotas_inferiores is not None:
+            solucion += self.cotas_inferiores
         
-        if tiene_artificial_en_solucion:
+        if valor_objetivo is None:
+            valor_objetivo = self.c[:self.num_variables] @ solucion
+        else:
+            valor_objetivo = valor_objetivo + self._constante_objetivo
+        
+        # Verificar factibilidad
+        if self.verbose and self.estado != "infactible" and self.tiene_artificiales_en_solucion():
             print("\nAdvertencia: Variable artificial permanece en la solución final con valor no cero.")
             print("Esto indica que el problema es infactible.")
         
-        # Calcular valor objetivo
-        valor_objetivo = self.tableau[self.num_restricciones, -1]
+        if self.escalamiento is not None:
+            solucion = self.escalamiento.desescalar_solucion(solucion)
+        
         if self.tipo_problema == "min":
             valor_objetivo = -valor_objetivo
         
         return solucion, valor_objetivo
 
-    def visualizar_tableaux(self):
-        """Genera visualizaciones PNG de todos los tableaux"""
+    def base_en_historial(self, indice):
+        """Básica de cada fila en el tableau `indice` del historial (None si no se registró)"""
+        if self.exacto:
+            return self._motor_exacto.historial_bases[indice]
+        return self.historial_tableaux.base(indice)
+
+    def titulo_tableau(self, indice):
+        """Título del tableau `indice` del historial (el mismo de las imágenes exportadas)"""
+        return "Tableau Inicial" if indice == 0 else f"Tableau después de Iteración {indice}"
+
+    def tableau_como_texto(self, indice):
+        """
+        Título y grilla de un tableau del historial, armados solo al pedirlos
+        
+        Permite mostrar el proceso página por página sin resolver con salida
+        detallada: se reconstruye y formatea únicamente el tableau pedido.
+        
+        Args:
+            indice: Posición en historial_tableaux (admite negativos)
+        
+        Returns:
+            str: Texto con el mismo formato de la salida detallada
+        """
+        indice = range(len(self.historial_tableaux))[indice]
+        tableau = self.historial_tableaux[indice]
+        texto = self._formatear_tableau(tableau, self.base_en_historial(indice))
+        return f"{self.titulo_tableau(indice)}\n{texto}"
+
+    def visualizar_tableaux(self, carpeta=".", formato="png", procesos=None):
+        """
+        Genera visualizaciones de todos los tableaux
+        
+        Args:
+            carpeta: Carpeta de destino de los archivos (se escriben ahí directamente)
+            formato: "png" (tableau_i.png por iteración) o "pdf" (un solo tableaux.pdf)
+            procesos: Procesos para renderizar PNG (None = automático según la cantidad)
+        
+        Returns:
+            list: Rutas de los archivos generados
+        """
         if not self.historial_tableaux:
             print("No hay tableaux para visualizar. Ejecute resolver() primero.")
-            return
-        
-        num_tableaux = len(self.historial_tableaux)
+            return []
         
+        # Los textos se preparan aquí (vectorizados); el renderizador solo los dibuja
+        paginas = []
         for i, tableau in enumerate(self.historial_tableaux):
             filas, columnas = tableau.shape
-            fig, ax = plt.subplots(figsize=(12, 8))
-            ax.set_axis_off()
-            
-            # Reorganizar para visualización
-            idx_orig = self.vars_originales
-            idx_holgura = self.vars_holgura
-            idx_art = self.vars_artificiales_idx
-            idx_rhs = [columnas - 1]
-            
-            nuevo_orden = idx_orig + idx_holgura + idx_art + idx_rhs
-            tableau_reorg = np.zeros((filas, len(nuevo_orden)))
-            
-            for j, idx_anterior in enumerate(nuevo_orden):
-                tableau_reorg[:, j] = tableau[:, idx_anterior]
-            
-            # Etiquetas
-            etiquetas_col = []
-            for idx in idx_orig:
-                etiquetas_col.append(f"x{idx+1}")
-            for idx in idx_holgura:
-                etiquetas_col.append(f"x{idx+1}")
-            for j, idx in enumerate(idx_art):
-                etiquetas_col.append(f"a{j+1}")
-            etiquetas_col.append("LD")
-            
-            etiquetas_fila = []
-            for j in range(filas - 1):
-                idx_basica = self.vars_basicas[j]
-                if idx_basica in self.vars_originales:
-                    etiquetas_fila.append(f"x{idx_basica+1}")
-                elif idx_basica in self.vars_holgura:
-                    etiquetas_fila.append(f"x{idx_basica+1}")
-                elif idx_basica in self.vars_artificiales_idx:
-                    etiquetas_fila.append(f"a{self.vars_artificiales_idx.index(idx_basica)+1}")
-            etiquetas_fila.append("z")
-            
-            # Formatear datos
+            nuevo_orden, etiquetas_col, etiquetas_fila = self._etiquetas_tableau(
+                filas, columnas, self.base_en_historial(i))
+            tableau_reorg = tableau[:, nuevo_orden]
             if self.usar_fracciones:
-                datos_str = np.zeros_like(tableau_reorg, dtype=object)
-                for r in range(filas):
-                    for c in range(len(nuevo_orden)):
-                        frac = Fraction(tableau_reorg[r, c]).limit_denominator()
-                        if frac.denominator == 1:
-                            datos_str[r, c] = str(frac.numerator)
-                        else:
-                            datos_str[r, c] = f"{frac.numerator}/{frac.denominator}"
-                datos_mostrar = datos_str
+                datos_mostrar = self._formato_fracciones.formatear(tableau_reorg)
             else:
-                datos_mostrar = np.round(tableau_reorg, 4)
-            
-            # Crear tabla
-            tabla = ax.table(
-                cellText=datos_mostrar,
-                loc='center',
-                cellLoc='center',
-                colLabels=etiquetas_col,
-                rowLabels=etiquetas_fila
-            )
-            
-            tabla.auto_set_font_size(False)
-            tabla.set_fontsize(10)
-            tabla.scale(1.2, 1.5)
-            
-            titulo = f"Tableau Inicial" if i == 0 else f"Tableau después de Iteración {i}"
-            plt.title(titulo)
-            plt.tight_layout()
-            plt.savefig(f"tableau_{i}.png")
-            plt.close()
+                datos_mostrar = np.round(tableau_reorg, 4).astype(str)
+            titulo = self.titulo_tableau(i)
+            paginas.append((datos_mostrar.tolist(), etiquetas_col, etiquetas_fila, titulo))
         
-        print(f"\nVisualizaciones guardadas como tableau_0.png hasta tableau_{num_tableaux-1}.png")
-
+        # matplotlib solo se carga al exportar
+        from render_tableaux import exportar_paginas
+        rutas = exportar_paginas(paginas, carpeta, formato, procesos)
+        if formato == "pdf":
+            print(f"\nVisualizaciones guardadas en {rutas[0]}")
+        else:
+            print(f"\nVisualizaciones guardadas como tableau_0.png hasta tableau_{len(rutas)-1}.png")
+        return rutas
 
-def parsear_fraccion(s):
-    """Convierte string a float, manejando fracciones"""
+def parsear_fraccion(s, exacto=False):
+    """
+    Convierte string a float, manejando fracciones
+    
+    Con exacto=True devuelve una Fraction leída directamente del texto (1/3, 0.1,
+    2.5e-3), sin pasar por float.
+    """
+    if exacto:
+        try:
+            return Fraction(s.strip())
+        except (ValueError, ZeroDivisionError) as e:
+            raise ValueError(f"Número inválido: {s}") from e
     if '/' in s:
         num, denom = s.split('/')
         return float(num) / float(denom)
@@ -0,0 +1,908 @@
+"""
+Lectura y escritura de modelos en formato MPS (libre o fijo) y CPLEX LP
+
+Los archivos se leen línea por línea con un búfer grande y sin cargar el texto
+completo en memoria; las entradas de la matriz se acumulan en arreglos tipados
+(array) en lugar de listas de objetos Python y al final se arma la matriz de
+restricciones, dispersa (MatrizCSR) si conviene. Los archivos terminados en .gz
+se leen y escriben comprimidos.
+
+Las marcas de integralidad (MARKER INTORG, Generals, Integers) se ignoran: se
+resuelve la relajación lineal; Binaries solo fija las cotas 0 <= x <= 1.
+"""
+import contextlib
+import gzip
+import math
+import re
+from array import array
+from fractions import Fraction
+
+import numpy as np
+
+from matriz_dispersa import MatrizCSR, es_dispersa
+from simplex_exacto import a_fraccion
+
+UMBRAL_DISPERSO = 10_000        # Coeficientes (m·n) desde los cuales A puede guardarse dispersa
+DENSIDAD_DISPERSA = 0.1         # Fracción de no nulos por debajo de la cual A se guarda como MatrizCSR
+TAMANO_BUFER = 1 << 20          # Bytes del búfer de lectura y escritura
+TERMINOS_POR_LINEA = 8          # Términos por línea al escribir expresiones LP
+INFINITO = 1e30                 # Por convención, las cotas de este valor absoluto o más son infinitas
+
+_TIPOS_FILA = {"L": "<=", "G": ">=", "E": "="}
+_TIPOS_MPS = {"<=": "L", ">=": "G", "=": "E"}
+_SECCIONES_MPS = {"NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"}
+
+
+class ModeloPL:
+    """
+    Modelo de programación lineal tal como está en un archivo
+
+    Guarda el sentido, los costos, la matriz de restricciones (ndarray o
+    MatrizCSR), los lados derechos, las desigualdades, las cotas y los nombres;
+    cargar_en() lo pasa a un SolucionadorPL.
+    """
+
+    def __init__(self, c, A, b, desigualdades, tipo_problema="min", inferiores=None,
+                 superiores=None, nombres_variables=None, nombres_restricciones=None,
+                 nombre="modelo", constante_objetivo=0.0):
+        """
+        Args:
+            c: Costos de las variables
+            A: Matriz de restricciones (densa, MatrizCSR o MatrizCSC)
+            b: Lado derecho
+            desigualdades: Tipo de cada restricción ("<=", ">=", "=")
+            tipo_problema: "max" o "min"
+            inferiores, superiores: Cotas de las variables (None = 0 e infinito)
+            nombres_variables, nombres_restricciones: Nombres (None = x1.., r1..)
+            constante_objetivo: Término constante del objetivo (el solucionador no lo
+                                suma; valor_original() lo agrega al valor óptimo)
+        """
+        self.c = np.asarray(c, dtype=float)
+        self.A = A if es_dispersa(A) else np.asarray(A, dtype=float).reshape(len(b), len(self.c))
+        self.b = np.asarray(b, dtype=float)
+        self.desigualdades = list(desigualdades)
+        self.tipo_problema = tipo_problema
+        self.inferiores = None if inferiores is None else np.asarray(inferiores, dtype=float)
+        self.superiores = None if superiores is None else np.asarray(superiores, dtype=float)
+        self.nombres_variables = nombres_variables or [f"x{j+1}" for j in range(len(self.c))]
+        self.nombres_restricciones = nombres_restricciones or [f"r{i+1}" for i in range(len(self.b))]
+        self.nombre = nombre
+        self.constante_objetivo = constante_objetivo
+
+    @property
+    def num_variables(self):
+        return len(self.c)
+
+    @property
+    def num_restricciones(self):
+        return len(self.b)
+
+    def columnas_libres(self):
+        """Índices de las variables sin cota inferior finita (libres, MI o UP negativa)"""
+        if self.inferiores is None:
+            return np.zeros(0, dtype=np.intp)
+        return np.flatnonzero(np.isneginf(self.inferiores))
+
+    def cargar_en(self, solver):
+        """
+        Carga el modelo en un SolucionadorPL (establecer_objetivo, agregar_restricciones
+        y, si hay, establecer_cotas)
+
+        El solucionador solo admite cotas inferiores finitas: cada variable x con
+        l = -inf se reemplaza por x⁺ - x⁻ con x⁺ <= max(u, 0) y x⁻ >= max(-u, 0);
+        las columnas x⁻ se agregan al final y solucion_original() deshace el cambio.
+
+        Returns:
+            SolucionadorPL: El mismo solver
+        """
+        c, A = self.c, self.A
+        inferiores, superiores = self.inferiores, self.superiores
+        libres = self.columnas_libres()
+        if len(libres):
+            n = self.num_variables
+            u = np.full(n, np.inf) if superiores is None else superiores
+            c = np.concatenate((c, -c[libres]))
+            A = _agregar_columnas_negadas(A, libres)
+            inferiores = np.concatenate((inferiores, np.maximum(-u[libres], 0.0)))
+            inferiores[libres] = 0.0
+            superiores = np.concatenate((u, np.full(len(libres), np.inf)))
+            superiores[libres] = np.maximum(u[libres], 0.0)
+
+        solver.establecer_objetivo(c, self.tipo_problema)
+        if solver.exacto and es_dispersa(A):
+            # El modo exacto trabaja con un tableau denso de enteros
+            A = A.a_densa()
+        solver.agregar_restricciones(A, self.b, list(self.desigualdades))
+        if inferiores is not None or superiores is not None:
+            solver.establecer_cotas(inferiores, superiores)
+        return solver
+
+    def solucion_original(self, solucion):
+        """
+        Solución en las variables del modelo a partir de la del solucionador
+        cargado con cargar_en() (resta las columnas x⁻ de las variables libres)
+
+        Returns:
+            list: Un valor por variable del modelo (float o Fraction, como la entrada)
+        """
+        n = self.num_variables
+        valores = list(solucion[:n])
+        for k, j in enumerate(self.columnas_libres().tolist()):
+            valores[j] = valores[j] - solucion[n + k]
+        return valores
+
+    def valor_original(self, valor):
+        """
+        Valor del objetivo del modelo a partir del que informa el solucionador
+        (le suma constante_objetivo, exacta si el valor es una Fraction)
+        """
+        if not self.constante_objetivo:
+            return valor
+        if isinstance(valor, Fraction):
+            return valor + a_fraccion(self.constante_objetivo)
+        return valor + self.constante_objetivo
+
+
+class _Constructor:
+    """Acumula un modelo a medida que se lee (índices por nombre y arreglos tipados)"""
+
+    def __init__(self, origen):
+        self.origen = origen
+        self.variables = {}             # nombre -> índice
+        self.filas = {}                 # nombre -> índice (-1 = objetivo, -2 = fila libre ignorada)
+        self.desigualdades = []
+        self.rhs = array("d")
+        self.fil = array("q")
+        self.col = array("q")
+        self.val = array("d")
+        self.obj_col = array("q")
+        self.obj_val = array("d")
+        self.inferiores = {}            # índice -> cota (solo las distintas de 0)
+        self.superiores = {}            # índice -> cota (solo las finitas)
+        self.rangos = {}                # fila -> rango R de la sección RANGES
+        self.constante = 0.0
+        self.tipo_problema = "min"
+        self.nombre = "modelo"
+        self.objetivo = None            # Nombre de la fila objetivo
+
+    def error(self, linea, mensaje):
+        return ValueError(f"{self.origen}, línea {linea}: {mensaje}")
+
+    def variable(self, nombre):
+        indice = self.variables.get(nombre)
+        if indice is None:
+            indice = self.variables[nombre] = len(self.variables)
+        return indice
+
+    def fila(self, nombre, desigualdad, linea):
+        if nombre in self.filas:
+            raise self.error(linea, f"fila repetida: {nombre}")
+        self.filas[nombre] = len(self.desigualdades)
+        self.desigualdades.append(desigualdad)
+        self.rhs.append(0.0)
+
+    def coeficiente(self, fila, col, valor):
+        if fila >= 0:
+            self.fil.append(fila)
+            self.col.append(col)
+            self.val.append(valor)
+        elif fila == -1:
+            self.obj_col.append(col)
+            self.obj_val.append(valor)
+
+    def construir(self):
+        """Arma el ModeloPL (expande los rangos y elige matriz densa o dispersa)"""
+        n, m = len(self.variables), len(self.desigualdades)
+        fil = np.frombuffer(self.fil, dtype=np.int64) if self.fil else np.zeros(0, dtype=np.int64)
+        col = np.frombuffer(self.col, dtype=np.int64) if self.col else np.zeros(0, dtype=np.int64)
+        val = np.frombuffer(self.val, dtype=float) if self.val else np.zeros(0)
+        b = np.array(self.rhs, dtype=float)
+        desigualdades = list(self.desigualdades)
+        nombres_filas = [None] * m
+        for nombre, i in self.filas.items():
+            if i >= 0:
+                nombres_filas[i] = nombre
+
+        if self.rangos:
+            # Cada fila con rango l <= a·x <= u se separa en dos desigualdades
+            extra_filas, extra_b, extra_tipos = [], [], []
+            for i, r in self.rangos.items():
+                tipo = desigualdades[i]
+                if tipo == "<=":
+                    otro, limite = ">=", b[i] - abs(r)
+                elif tipo == ">=":
+                    otro, limite = "<=", b[i] + abs(r)
+                elif r >= 0:
+                    desigualdades[i], otro, limite = ">=", "<=", b[i] + r
+                else:
+                    desigualdades[i], otro, limite = "<=", ">=", b[i] + r
+                extra_filas.append(i)
+                extra_b.append(limite)
+                extra_tipos.append(otro)
+                nombres_filas.append(f"{nombres_filas[i]}_rango")
+            nueva = np.full(m, -1, dtype=np.int64)
+            nueva[extra_filas] = np.arange(m, m + len(extra_filas))
+            copia = nueva[fil] >= 0
+            fil = np.concatenate((fil, nueva[fil[copia]]))
+            col = np.concatenate((col, col[copia]))
+            val = np.concatenate((val, val[copia]))
+            b = np.concatenate((b, extra_b))
+            desigualdades.extend(extra_tipos)
+            m += len(extra_filas)
+
+        A = MatrizCSR.desde_coordenadas(fil, col, val, (m, n))
+        if m * n < UMBRAL_DISPERSO or A.nnz >= DENSIDAD_DISPERSA * m * n:
+            A = A.a_densa()
+
+        c = np.zeros(n)
+        np.add.at(c, np.frombuffer(self.obj_col, dtype=np.int64) if self.obj_col else [],
+                  np.frombuffer(self.obj_val, dtype=float) if self.obj_val else [])
+
+        nombres_variables = list(self.variables)
+        inferiores = superiores = None
+        if self.inferiores:
+            inferiores = np.zeros(n)
+            inferiores[list(self.inferiores)] = list(self.inferiores.values())
+        if self.superiores:
+            superiores = np.full(n, np.inf)
+            superiores[list(self.superiores)] = list(self.superiores.values())
+
+        return ModeloPL(c, A, b, desigualdades, self.tipo_problema, inferiores, superiores,
+                        nombres_variables, nombres_filas, self.nombre, self.constante)
+
+    def cota(self, col, inferior=None, superior=None):
+        if inferior is not None:
+            if inferior == 0.0:
+                self.inferiores.pop(col, None)
+            else:
+                self.inferiores[col] = inferior
+        if superior is not None:
+            if math.isinf(superior) and superior > 0:
+                self.superiores.pop(col, None)
+            else:
+                self.superiores[col] = superior
+
+
+def _es_archivo(ruta):
+    return hasattr(ruta, "read") or hasattr(ruta, "write")
+
+
+def _nombre(ruta):
+    """Nombre para los mensajes de error (la ruta, o el name de un archivo abierto)"""
+    return getattr(ruta, "name", "<archivo>") if _es_archivo(ruta) else ruta
+
+
+def _abrir(ruta, modo="r"):
+    """
+    Abre un archivo de texto con búfer grande (comprimido si termina en .gz); un
+    archivo ya abierto (p. ej. sys.stdin) se usa tal cual y no se cierra
+    """
+    if _es_archivo(ruta):
+        return contextlib.nullcontext(ruta)
+    if str(ruta).endswith(".gz"):
+        return gzip.open(ruta, modo + "t", encoding="utf-8")
+    return open(ruta, modo, encoding="utf-8", buffering=TAMANO_BUFER)
+
+
+def _numero_leido(texto):
+    """Convierte un número leído; los valores de magnitud INFINITO o más son ±inf"""
+    valor = float(texto)
+    if abs(valor) >= INFINITO:
+        return math.copysign(math.inf, valor)
+    return valor
+
+
+def _sentido(texto):
+    texto = texto.lower()
+    if texto.startswith("max"):
+        return "max"
+    if texto.startswith("min"):
+        return "min"
+    raise ValueError(f"Sentido de optimización desconocido: {texto}")
+
+
+# -- MPS ------------------------------------------------------------------
+
+def _campos_fijos(linea):
+    """Campos de una línea MPS fija (columnas 2-3, 5-12, 15-22, 25-36, 40-47, 50-61)"""
+    campos = [linea[1:3], linea[4:12], linea[14:22], linea[24:36], linea[39:47], linea[49:61]]
+    campos = [campo.strip() for campo in campos]
+    while campos and not campos[-1]:
+        campos.pop()
+    return campos
+
+
+def leer_mps(ruta, fijo=False):
+    """
+    Lee un modelo MPS
+
+    Args:
+        ruta: Archivo .mps (o .mps.gz) o un archivo de texto ya abierto
+        fijo: Formato fijo por columnas (admite nombres con espacios); por defecto
+              libre, separado por espacios
+
+    Returns:
+        ModeloPL: Modelo leído (minimización salvo que OBJSENSE diga MAX)
+    """
+    modelo = _Constructor(_nombre(ruta))
+    seccion = None
+    ultima_col, col = None, -1
+    with _abrir(ruta) as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            if not linea.strip() or linea[0] == "*":
+                continue
+            if not linea[0].isspace():
+                partes = linea.split()
+                seccion = partes[0].upper()
+                if seccion not in _SECCIONES_MPS:
+                    raise modelo.error(numero, f"sección desconocida: {partes[0]}")
+                if seccion == "NAME" and len(partes) > 1:
+                    modelo.nombre = partes[1]
+                elif seccion == "OBJSENSE" and len(partes) > 1:
+                    modelo.tipo_problema = _sentido(partes[1])
+                elif seccion == "ENDATA":
+                    break
+                continue
+
+            if fijo:
+                campos = _campos_fijos(linea)
+                # ROWS y BOUNDS usan el campo 1; las demás secciones empiezan en el campo 2
+                if seccion not in ("ROWS", "BOUNDS"):
+                    campos = campos[1:]
+            else:
+                campos = linea.split()
+
+            try:
+                if seccion == "COLUMNS":
+                    if len(campos) > 2 and campos[1] == "'MARKER'":
+                        continue
+                    if campos[0] != ultima_col:
+                        ultima_col, col = campos[0], modelo.variable(campos[0])
+                    for k in range(1, len(campos) - 1, 2):
+                        fila = modelo.filas.get(campos[k])
+                        if fila is None:
+                            raise modelo.error(numero, f"fila desconocida: {campos[k]}")
+                        modelo.coeficiente(fila, col, float(campos[k + 1]))
+                elif seccion in ("RHS", "RANGES"):
+                    # El nombre del conjunto es opcional en el formato libre
+                    inicio = 1 if fijo or len(campos) % 2 == 1 else 0
+                    for k in range(inicio, len(campos) - 1, 2):
+                        fila = modelo.filas.get(campos[k])
+                        if fila is None:
+                            raise modelo.error(numero, f"fila desconocida: {campos[k]}")
+                        valor = float(campos[k + 1])
+                        if seccion == "RANGES":
+                            if fila >= 0:
+                                modelo.rangos[fila] = valor
+                        elif fila >= 0:
+                            modelo.rhs[fila] = valor
+                        elif fila == -1:
+                            # Un lado derecho en la fila objetivo es el opuesto de su constante
+                            modelo.constante = -valor
+                elif seccion == "BOUNDS":
+                    _leer_cota_mps(modelo, campos, fijo, numero)
+                elif seccion == "ROWS":
+                    tipo, nombre = campos[0].upper(), campos[1]
+                    if tipo == "N":
+                        if modelo.objetivo is None:
+                            modelo.objetivo = nombre
+                            modelo.filas[nombre] = -1
+                        else:
+                            modelo.filas[nombre] = -2
+                    elif tipo in _TIPOS_FILA:
+                        modelo.fila(nombre, _TIPOS_FILA[tipo], numero)
+                    else:
+                        raise modelo.error(numero, f"tipo de fila desconocido: {campos[0]}")
+                elif seccion == "OBJSENSE":
+                    modelo.tipo_problema = _sentido(campos[0])
+                else:
+                    raise modelo.error(numero, f"datos fuera de una sección: {linea.strip()}")
+            except (IndexError, ValueError) as e:
+                if isinstance(e, ValueError) and str(e).startswith(str(modelo.origen)):
+                    raise
+                raise modelo.error(numero, f"línea inválida en {seccion}: {linea.strip()}") from e
+
+    return modelo.construir()
+
+
+def _leer_cota_mps(modelo, campos, fijo, numero):
+    tipo = campos[0].upper()
+    sin_valor = tipo in ("FR", "MI", "PL", "BV")
+    # El nombre del conjunto de cotas es opcional en el formato libre
+    if fijo:
+        nombre = campos[2]
+        valor = None if sin_valor else _numero_leido(campos[3])
+    elif sin_valor:
+        nombre = campos[-1]
+        valor = None
+    else:
+        nombre, valor = campos[-2], _numero_leido(campos[-1])
+    col = modelo.variable(nombre)
+    if tipo == "UP":
+        if valor < 0 and col not in modelo.inferiores:
+            # Convención de MPS: una cota superior negativa sin inferior deja x en (-inf, u]
+            modelo.cota(col, inferior=-math.inf)
+        modelo.cota(col, superior=valor)
+    elif tipo in ("LO", "LI"):
+        modelo.cota(col, inferior=valor)
+    elif tipo == "UI":
+        modelo.cota(col, superior=valor)
+    elif tipo == "FX":
+        modelo.cota(col, valor, valor)
+    elif tipo == "FR":
+        modelo.cota(col, -math.inf, math.inf)
+    elif tipo == "MI":
+        modelo.cota(col, inferior=-math.inf)
+    elif tipo == "PL":
+        modelo.cota(col, superior=math.inf)
+    elif tipo == "BV":
+        modelo.cota(col, 0.0, 1.0)
+    else:
+        raise modelo.error(numero, f"tipo de cota no soportado: {campos[0]}")
+
+
+def _numero(valor):
+    """Texto más corto que vuelve a leerse como el mismo float"""
+    valor = float(valor)
+    if math.isinf(valor):
+        return "inf" if valor > 0 else "-inf"
+    if valor.is_integer() and abs(valor) < 1e15:
+        return str(int(valor))
+    return repr(valor)
+
+
+def _numero_fijo(valor):
+    """Número que entra en un campo MPS fijo de 12 caracteres"""
+    texto = _numero(valor)
+    for digitos in range(12, 0, -1):
+        if len(texto) <= 12:
+            return texto
+        texto = f"{float(valor):.{digitos}g}"
+    raise ValueError(f"El número {valor} no entra en un campo MPS fijo")
+
+
+def _linea_fija(f1="", f2="", f3="", f4="", f5="", f6=""):
+    for nombre in (f2, f3, f5):
+        if len(nombre) > 8:
+            raise ValueError(f"El nombre '{nombre}' tiene más de 8 caracteres (formato MPS fijo)")
+    return (f" {f1:<2} {f2:<8}  {f3:<8}  {f4:>12}   {f5:<8}  {f6:>12}".rstrip() + "\n")
+
+
+def _filas_csr(A):
+    """La matriz como MatrizCSR (para recorrerla fila por fila)"""
+    if isinstance(A, MatrizCSR):
+        return A
+    if es_dispersa(A):
+        return A.a_csr()
+    return MatrizCSR.desde_densa(A)
+
+
+def escribir_mps(modelo, ruta, fijo=False):
+    """
+    Escribe un ModeloPL en formato MPS, columna por columna
+
+    Args:
+        fijo: Formato fijo por columnas (nombres de hasta 8 caracteres)
+    """
+    if fijo:
+        def linea(f1="", f2="", f3="", f4="", f5="", f6=""):
+            return _linea_fija(f1, f2, f3, f4 and _numero_fijo(f4), f5, f6 and _numero_fijo(f6))
+    else:
+        def linea(f1="", f2="", f3="", f4="", f5="", f6=""):
+            campos = [f2, f3, "" if f4 == "" else _numero(f4), f5, "" if f6 == "" else _numero(f6)]
+            return " " + " ".join(campo for campo in [f1] + campos if campo != "") + "\n"
+
+    nombres_x, nombres_r = modelo.nombres_variables, modelo.nombres_restricciones
+    if isinstance(modelo.A, MatrizCSR):
+        columnas = modelo.A.a_csc()
+    elif es_dispersa(modelo.A):
+        columnas = modelo.A
+    else:
+        columnas = _filas_csr(np.asarray(modelo.A).T)      # Filas de Aᵀ = columnas de A
+
+    with _abrir(ruta, "w") as archivo:
+        archivo.write(f"NAME          {modelo.nombre}\n")
+        if modelo.tipo_problema == "max":
+            archivo.write("OBJSENSE\n    MAX\n")
+        archivo.write("ROWS\n")
+        archivo.write(linea("N", "obj"))
+        for nombre, tipo in zip(nombres_r, modelo.desigualdades):
+            archivo.write(linea(_TIPOS_MPS[tipo], nombre))
+
+        archivo.write("COLUMNS\n")
+        for j, nombre in enumerate(nombres_x):
+            inicio, fin = columnas.indptr[j], columnas.indptr[j + 1]
+            pares = [("obj", modelo.c[j])] if modelo.c[j] != 0 or inicio == fin else []
+            pares += [(nombres_r[i], v) for i, v in zip(columnas.indices[inicio:fin].tolist(),
+                                                        columnas.datos[inicio:fin].tolist())]
+            for k in range(0, len(pares), 2):
+                extra = pares[k + 1] if k + 1 < len(pares) else ("", "")
+                archivo.write(linea("", nombre, pares[k][0], pares[k][1], extra[0], extra[1]))
+
+        archivo.write("RHS\n")
+        no_nulos = [(nombres_r[i], v) for i, v in enumerate(modelo.b.tolist()) if v != 0]
+        if modelo.constante_objetivo:
+            no_nulos.append(("obj", -modelo.constante_objetivo))
+        for nombre, v in no_nulos:
+            archivo.write(linea("", "RHS", nombre, v))
+
+        cotas = list(_cotas_a_escribir(modelo))
+        if cotas:
+            archivo.write("BOUNDS\n")
+            for tipo, j, valor in cotas:
+                archivo.write(linea(tipo, "BND", nombres_x[j], "" if valor is None else valor))
+        archivo.write("ENDATA\n")
+
+
+def _agregar_columnas_negadas(A, columnas):
+    """A con las columnas indicadas agregadas al final con signo opuesto (densa o dispersa)"""
+    m, n = A.shape
+    if not es_dispersa(A):
+        return np.hstack((A, -A[:, columnas]))
+    if isinstance(A, MatrizCSR):
+        filas, cols = A.filas_de_entradas(), A.indices
+    else:
+        filas, cols = A.indices, A.columnas_de_entradas()
+    nueva = np.full(n, -1, dtype=np.intp)
+    nueva[columnas] = np.arange(n, n + len(columnas))
+    copia = nueva[cols] >= 0
+    return type(A).desde_coordenadas(np.concatenate((filas, filas[copia])),
+                                     np.concatenate((cols, nueva[cols[copia]])),
+                                     np.concatenate((A.datos, -A.datos[copia])),
+                                     (m, n + len(columnas)))
+
+
+def _cotas_a_escribir(modelo):
+    """
+    (tipo MPS, columna, valor) de cada cota distinta de 0 <= x < inf; las variables
+    sin cota inferior se escriben como FR o MI (sin valor), no como LO -inf
+    """
+    n = modelo.num_variables
+    l = modelo.inferiores if modelo.inferiores is not None else np.zeros(n)
+    u = modelo.superiores if modelo.superiores is not None else np.full(n, np.inf)
+    for j in np.flatnonzero((l != 0) | np.isfinite(u)).tolist():
+        if l[j] == u[j]:
+            yield "FX", j, l[j]
+            continue
+        if np.isneginf(l[j]):
+            if not np.isfinite(u[j]):
+                yield "FR", j, None
+                continue
+            yield "MI", j, None
+        elif l[j] != 0:
+            yield "LO", j, l[j]
+        if np.isfinite(u[j]):
+            yield "UP", j, u[j]
+
+
+# -- CPLEX LP -------------------------------------------------------------
+
+_SECCION_LP = re.compile(
+    r"\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.t\.|st|"
+    r"bounds?|generals?|gen|integers?|binar(?:y|ies)|bin|semi-continuous|semis?|end)(?=\s|$)",
+    re.IGNORECASE)
+_TOKEN_LP = re.compile(r"""
+    \s*(?:
+        (?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|(?i:inf(?:inity)?)(?![^\s:+\-<>=*^\[\]]))
+      | (?P<op><=|>=|=<|=>|<|>|=)
+      | (?P<signo>[+-])
+      | (?P<dos_puntos>:)
+      | (?P<nombre>[A-Za-z_!"\#$%&()/,.;?@`'{}|~][^\s:+\-<>=*^\[\]]*)
+    )""", re.VERBOSE)
+_OPERADORES = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+
+
+def _tokens_lp(texto, modelo, numero):
+    """Lista de (tipo, texto) de una línea LP"""
+    tokens, pos = [], 0
+    texto = texto.rstrip()
+    while pos < len(texto):
+        encontrado = _TOKEN_LP.match(texto, pos)
+        if encontrado is None or encontrado.end() == pos:
+            raise modelo.error(numero, f"no se entiende '{texto[pos:].strip()}' (¿término no lineal?)")
+        tokens.append((encontrado.lastgroup, encontrado.group(encontrado.lastgroup)))
+        pos = encontrado.end()
+        while pos < len(texto) and texto[pos].isspace():
+            pos += 1
+    return tokens
+
+
+def _valor_lp(texto):
+    return math.inf if texto.lower().startswith("inf") else _numero_leido(texto)
+
+
+class _ExpresionLP:
+    """Estado de la expresión lineal (objetivo o restricción) que se está leyendo"""
+
+    def __init__(self):
+        self.nombre = None
+        self.col = array("q")
+        self.val = array("d")
+        self.constante = 0.0
+        self.signo = 1.0
+        self.coeficiente = None
+        self.operador = None
+        self.signo_rhs = 1.0
+        self.vacia = True
+
+    def agregar(self, tipo, texto, modelo, numero):
+        """Procesa un token; devuelve el lado derecho cuando la restricción termina"""
+        if self.operador is not None:
+            if tipo == "signo":
+                self.signo_rhs *= -1.0 if texto == "-" else 1.0
+                return None
+            if tipo != "numero":
+                raise modelo.error(numero, "el lado derecho debe ser un número")
+            return self.signo_rhs * _valor_lp(texto)
+        if tipo == "signo":
+            if self.coeficiente is not None:
+                self.constante += self.signo * self.coeficiente
+                self.coeficiente = None
+                self.signo = 1.0
+            self.signo *= -1.0 if texto == "-" else 1.0
+        elif tipo == "numero":
+            if self.coeficiente is not None:
+                raise modelo.error(numero, "dos números seguidos en una expresión")
+            self.coeficiente = _valor_lp(texto)
+        elif tipo == "nombre":
+            self.col.append(modelo.variable(texto))
+            self.val.append(self.signo * (1.0 if self.coeficiente is None else self.coeficiente))
+            self.signo, self.coeficiente = 1.0, None
+        elif tipo == "op":
+            self.cerrar_termino()
+            self.operador = _OPERADORES[texto]
+        self.vacia = False
+        return None
+
+    def cerrar_termino(self):
+        if self.coeficiente is not None:
+            self.constante += self.signo * self.coeficiente
+            self.coeficiente = None
+        self.signo = 1.0
+
+
+def leer_lp(ruta):
+    """
+    Lee un modelo en formato CPLEX LP
+
+    Admite objetivo con constante, restricciones que ocupan varias líneas,
+    nombres "r1:" opcionales, la sección Bounds (x <= u, l <= x <= u, x = v,
+    x free) y Generals/Integers/Binaries (ver el docstring del módulo).
+
+    Args:
+        ruta: Archivo .lp (o .lp.gz) o un archivo de texto ya abierto
+
+    Returns:
+        ModeloPL: Modelo leído
+    """
+    modelo = _Constructor(_nombre(ruta))
+    seccion = None
+    expresion = _ExpresionLP()
+    objetivo_cargado = False
+
+    def terminar_objetivo():
+        expresion.cerrar_termino()
+        modelo.obj_col.extend(expresion.col)
+        modelo.obj_val.extend(expresion.val)
+        modelo.constante = expresion.constante
+
+    with _abrir(ruta) as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            linea = linea.split("\\", 1)[0]
+            if not linea.strip():
+                continue
+            encabezado = _SECCION_LP.match(linea)
+            if encabezado is not None:
+                if seccion == "objetivo":
+                    terminar_objetivo()
+                    objetivo_cargado = True
+                elif seccion == "restricciones" and not expresion.vacia:
+                    raise modelo.error(numero, "restricción incompleta antes de una nueva sección")
+                palabra = encabezado.group(1).lower()
+                if palabra.startswith("max") or palabra.startswith("min"):
+                    if objetivo_cargado:
+                        raise modelo.error(numero, "el modelo tiene más de un objetivo")
+                    modelo.tipo_problema = _sentido(palabra)
+                    seccion = "objetivo"
+                elif palabra[0] == "s":
+                    seccion = "semi" if palabra.startswith("semi") else "restricciones"
+                elif palabra.startswith("bound"):
+                    seccion = "cotas"
+                elif palabra.startswith("bin"):
+                    seccion = "binarias"
+                elif palabra == "end":
+                    seccion = "fin"
+                    break
+                else:
+                    seccion = "enteras"
+                expresion = _ExpresionLP()
+                linea = linea[encabezado.end():]
+                if not linea.strip():
+                    continue
+
+            tokens = _tokens_lp(linea, modelo, numero)
+            if seccion in ("objetivo", "restricciones"):
+                k = 0
+                while k < len(tokens):
+                    tipo, texto = tokens[k]
+                    if (tipo == "nombre" and expresion.vacia and k + 1 < len(tokens)
+                            and tokens[k + 1][0] == "dos_puntos"):
+                        expresion.nombre = texto
+                        k += 2
+                        continue
+                    if seccion == "objetivo":
+                        if tipo == "op":
+                            raise modelo.error(numero, "el objetivo no puede tener desigualdades")
+                        expresion.agregar(tipo, texto, modelo, numero)
+                    else:
+                        rhs = expresion.agregar(tipo, texto, modelo, numero)
+                        if rhs is not None:
+                            _agregar_restriccion_lp(modelo, expresion, rhs, numero)
+                            expresion = _ExpresionLP()
+                    k += 1
+            elif seccion == "cotas":
+                _leer_cota_lp(modelo, tokens, numero)
+            elif seccion == "binarias":
+                for tipo, texto in tokens:
+                    modelo.cota(modelo.variable(texto), 0.0, 1.0)
+            elif seccion == "enteras":
+                for tipo, texto in tokens:
+                    modelo.variable(texto)
+            elif seccion == "semi":
+                raise modelo.error(numero, "las variables semicontinuas no están soportadas")
+            else:
+                raise modelo.error(numero, "datos antes de la sección del objetivo")
+
+    if seccion == "objetivo":
+        terminar_objetivo()
+    elif seccion == "restricciones" and not expresion.vacia:
+        raise ValueError(f"{modelo.origen}: la última restricción está incompleta")
+    return modelo.construir()
+
+
+def _agregar_restriccion_lp(modelo, expresion, rhs, numero):
+    if math.isinf(rhs):
+        if expresion.operador == "=" or (expresion.operador == "<=") != (rhs > 0):
+            raise modelo.error(numero, "restricción con lado derecho infinito imposible de cumplir")
+        return                          # a·x <= inf o a·x >= -inf: fila libre, se descarta
+    nombre = expresion.nombre or f"r{len(modelo.desigualdades) + 1}"
+    modelo.fila(nombre, expresion.operador, numero)
+    fila = modelo.filas[nombre]
+    # Las constantes del lado izquierdo pasan al derecho
+    modelo.rhs[fila] = rhs - expresion.constante
+    modelo.fil.extend([fila] * len(expresion.col))
+    modelo.col.extend(expresion.col)
+    modelo.val.extend(expresion.val)
+
+
+def _leer_cota_lp(modelo, tokens, numero):
+    """Una línea de la sección Bounds"""
+    if len(tokens) == 2 and tokens[0][0] == "nombre" and tokens[1][1].lower() == "free":
+        modelo.cota(modelo.variable(tokens[0][1]), -math.inf, math.inf)
+        return
+
+    # Operandos (número con signo o variable) separados por operadores
+    operandos, operadores, signo = [[]], [], 1.0
+    for tipo, texto in tokens:
+        if tipo == "op":
+            operadores.append(_OPERADORES[texto])
+            operandos.append([])
+        elif tipo == "signo":
+            signo *= -1.0 if texto == "-" else 1.0
+        elif tipo == "numero":
+            operandos[-1].append(("numero", signo * _valor_lp(texto)))
+            signo = 1.0
+        elif tipo == "nombre":
+            operandos[-1].append(("nombre", texto))
+        else:
+            raise modelo.error(numero, "cota inválida")
+    if any(len(operando) != 1 for operando in operandos) or len(operadores) not in (1, 2):
+        raise modelo.error(numero, "cota inválida")
+    operandos = [operando[0] for operando in operandos]
+
+    if len(operadores) == 2:
+        (t1, l), (t2, nombre), (t3, u) = operandos
+        if (t1, t2, t3) != ("numero", "nombre", "numero") or operadores[0] != operadores[1]:
+            raise modelo.error(numero, "cota doble inválida")
+        if operadores[0] == ">=":
+            l, u = u, l
+        modelo.cota(modelo.variable(nombre), l, u)
+        return
+
+    (t1, a), (t2, z) = operandos
+    operador = operadores[0]
+    if t1 == "numero":
+        # v <= x es x >= v
+        (t1, a), (t2, z) = (t2, z), (t1, a)
+        operador = {"<=": ">=", ">=": "<=", "=": "="}[operador]
+    if (t1, t2) != ("nombre", "numero"):
+        raise modelo.error(numero, "cota inválida")
+    col = modelo.variable(a)
+    if operador == "<=":
+        modelo.cota(col, superior=z)
+    elif operador == ">=":
+        modelo.cota(col, inferior=z)
+    else:
+        modelo.cota(col, z, z)
+
+
+def escribir_lp(modelo, ruta):
+    """Escribe un ModeloPL en formato CPLEX LP, fila por fila"""
+    nombres_x = modelo.nombres_variables
+
+    def expresion(columnas, valores):
+        if len(columnas) == 0:
+            return f" 0 {nombres_x[0]}"
+        partes = []
+        for k, (j, v) in enumerate(zip(columnas.tolist(), valores.tolist())):
+            if k and k % TERMINOS_POR_LINEA == 0:
+                partes.append("\n  ")
+            signo = "-" if v < 0 else ("+" if k else "")
+            coeficiente = "" if abs(v) == 1 else _numero(abs(v)) + " "
+            partes.append(f" {signo} {coeficiente}{nombres_x[j]}".replace("  ", " "))
+        return "".join(partes)
+
+    filas = _filas_csr(modelo.A)
+    with _abrir(ruta, "w") as archivo:
+        archivo.write(f"\\ {modelo.nombre}\n")
+        archivo.write("Maximize\n" if modelo.tipo_problema == "max" else "Minimize\n")
+        no_nulos = np.flatnonzero(modelo.c)
+        objetivo = expresion(no_nulos, modelo.c[no_nulos])
+        if modelo.constante_objetivo:
+            constante = modelo.constante_objetivo
+            objetivo += f" {'-' if constante < 0 else '+'} {_numero(abs(constante))}"
+        archivo.write(f" obj:{objetivo}\n")
+
+        archivo.write("Subject To\n")
+        for i, nombre in enumerate(modelo.nombres_restricciones):
+            inicio, fin = filas.indptr[i], filas.indptr[i + 1]
+            lado = expresion(filas.indices[inicio:fin], filas.datos[inicio:fin])
+            archivo.write(f" {nombre}:{lado} {modelo.desigualdades[i]} {_numero(modelo.b[i])}\n")
+
+        cotas = list(_cotas_a_escribir(modelo))
+        if cotas:
+            archivo.write("Bounds\n")
+            for tipo, j, valor in cotas:
+                if tipo == "FR":
+                    archivo.write(f" {nombres_x[j]} free\n")
+                elif tipo == "MI":
+                    archivo.write(f" -inf <= {nombres_x[j]}\n")
+                else:
+                    simbolo = {"FX": "=", "LO": ">=", "UP": "<="}[tipo]
+                    archivo.write(f" {nombres_x[j]} {simbolo} {_numero(valor)}\n")
+        archivo.write("End\n")
+
+
+# -- Por extensión --------------------------------------------------------
+
+def _formato(ruta):
+    nombre = str(ruta).lower()
+    if nombre.endswith(".gz"):
+        nombre = nombre[:-3]
+    if nombre.endswith(".mps"):
+        return "mps"
+    if nombre.endswith(".lp"):
+        return "lp"
+    raise ValueError(f"Formato de modelo desconocido (se espera .mps o .lp): {ruta}")
+
+
+def leer_modelo(ruta, fijo=False):
+    """Lee un .mps o un .lp (opcionalmente .gz) según la extensión"""
+    return leer_mps(ruta, fijo) if _formato(ruta) == "mps" else leer_lp(ruta)
+
+
+def escribir_modelo(modelo, ruta, fijo=False):
+    """Escribe un ModeloPL como .mps o .lp (opcionalmente .gz) según la extensión"""
+    if _formato(ruta) == "mps":
+        escribir_mps(modelo, ruta, fijo)
+    else:
+        escribir_lp(modelo, ruta)
+
+
+def es_archivo_modelo(ruta):
+    """Indica si la ruta tiene extensión de modelo MPS o LP"""
+    try:
+        _formato(ruta)
+        return True
+    except ValueError:
+        return False
@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class BaseSimplex:
+    """
+    Base final de una resolución, reutilizable como punto de partida de otra
+
+    No guarda índices de la forma estándar (dependen de los signos de b y de las
+    artificiales) sino qué variables originales son básicas, qué filas tienen su
+    holgura/exceso en la base y qué no básicas están en su cota superior. Así la
+    base sigue siendo aplicable si cambian c, b o algunos coeficientes de A.
+    """
+
+    def __init__(self, estructurales, filas_holgura, en_cota_superior, num_variables,
+                 num_restricciones):
+        """
+        Args:
+            estructurales: Índices de las variables originales básicas
+            filas_holgura: Filas cuya variable de holgura o exceso es básica
+            en_cota_superior: Variables originales no básicas en su cota superior
+            num_variables: Número de variables del modelo que generó la base
+            num_restricciones: Número de restricciones del modelo que generó la base
+        """
+        self.estructurales = np.asarray(estructurales, dtype=np.intp)
+        self.filas_holgura = np.asarray(filas_holgura, dtype=np.intp)
+        self.en_cota_superior = np.asarray(en_cota_superior, dtype=np.intp)
+        self.num_variables = int(num_variables)
+        self.num_restricciones = int(num_restricciones)
+
+    def es_compatible(self, num_variables, num_restricciones):
+        """Indica si la base corresponde a un modelo de estas dimensiones"""
+        return num_variables == self.num_variables and num_restricciones == self.num_restricciones
+
+    def traducir(self, columnas, filas, num_variables, num_restricciones):
+        """
+        Expresa la base en otro modelo cuyas variables y filas son `columnas` y `filas`
+        del modelo de esta base (por ejemplo, el modelo reducido por el presolve)
+
+        Las variables y filas que no existen en el otro modelo se descartan; la
+        reparación de la base completa lo que falte.
+        """
+        nueva_columna = np.full(self.num_variables, -1, dtype=np.intp)
+        nueva_columna[columnas] = np.arange(len(columnas))
+        nueva_fila = np.full(self.num_restricciones, -1, dtype=np.intp)
+        nueva_fila[filas] = np.arange(len(filas))
+
+        estructurales = nueva_columna[self.estructurales]
+        filas_holgura = nueva_fila[self.filas_holgura]
+        en_cota_superior = nueva_columna[self.en_cota_superior]
+        return BaseSimplex(estructurales[estructurales >= 0], filas_holgura[filas_holgura >= 0],
+                           en_cota_superior[en_cota_superior >= 0], num_variables,
+                           num_restricciones)
+
+    def expandir(self, columnas, filas, num_variables, num_restricciones):
+        """Inversa de traducir: lleva una base de un submodelo al modelo completo"""
+        columnas, filas = np.asarray(columnas), np.asarray(filas)
+        return BaseSimplex(columnas[self.estructurales], filas[self.filas_holgura],
+                           columnas[self.en_cota_superior], num_variables, num_restricciones)
+
+    def a_dict(self):
+        """Representación serializable (por ejemplo, para guardar en JSON)"""
+        return {
+            "estructurales": self.estructurales.tolist(),
+            "filas_holgura": self.filas_holgura.tolist(),
+            "en_cota_superior": self.en_cota_superior.tolist(),
+            "num_variables": self.num_variables,
+            "num_restricciones": self.num_restricciones,
+        }
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """Reconstruye la base a partir de a_dict()"""
+        return cls(datos["estructurales"], datos["filas_holgura"], datos["en_cota_superior"],
+                   datos["num_variables"], datos["num_restricciones"])
+
+
+def columnas_independientes(B, tolerancia=1e-9):
+    """
+    Elige columnas linealmente independientes de B (m×k) en el orden dado
+
+    Eliminación gaussiana por columnas con pivoteo parcial: cada columna aceptada
+    se asocia a la fila donde tiene su pivote.
+
+    Returns:
+        np.ndarray: Fila pivote de cada columna (-1 si la columna es dependiente)
+    """
+    U = np.array(B, dtype=float)
+    m, k = U.shape
+    libres = np.ones(m, dtype=bool)
+    filas_pivote = np.full(k, -1, dtype=np.intp)
+
+    for j in range(k):
+        candidatos = np.where(libres, np.abs(U[:, j]), 0.0)
+        p = int(np.argmax(candidatos)) if m > 0 else 0
+        if m == 0 or candidatos[p] <= tolerancia:
+            continue
+        filas_pivote[j] = p
+        libres[p] = False
+        # Anular la fila p en las columnas siguientes para que no vuelva a elegirse
+        if j + 1 < k:
+            factores = U[p, j + 1:] / U[p, j]
+            U[:, j + 1:] -= np.outer(U[:, j], factores)
+    return filas_pivote
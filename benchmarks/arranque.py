@@ -0,0 +1,86 @@
+"""
+Tiempo de arranque: importación del solucionador sin interfaz y de la aplicación Tk
+
+Cada medición se hace en un intérprete nuevo (como un proceso de trabajo de corta
+vida) y se informa la mediana. Además se verifica qué módulos pesados quedaron
+cargados: una resolución sin salida detallada no debe cargar matplotlib,
+tabulate ni tkinter.
+
+Uso:
+    python benchmarks/arranque.py [--repeticiones N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PESADOS = ("matplotlib", "tabulate", "tkinter")
+
+ESCENARIOS = {
+    "import app": "import app",
+    "import servicio_simplex": "import servicio_simplex",
+    "resolver sin interfaz": (
+        "from app import SolucionadorPL\n"
+        "s = SolucionadorPL(); s.verbose = False\n"
+        "s.establecer_objetivo([3, 5], 'max')\n"
+        "s.agregar_restricciones([[1, 0], [0, 2], [3, 2]], [4, 12, 18], ['<='] * 3)\n"
+        "s.resolver()"
+    ),
+    "import index": "import index",
+    # index.main sin mainloop: construir la ventana y procesar el primer dibujo
+    "index.main (ventana)": (
+        "import index\n"
+        "c = index.SimplexControlador(); c.root.update(); c.root.destroy()"
+    ),
+}
+
+MEDIR = """
+import json, sys, time
+inicio = time.perf_counter()
+try:
+{codigo}
+    error = None
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+print(json.dumps({{"tiempo": time.perf_counter() - inicio, "error": error,
+                  "pesados": [m for m in {pesados} if m in sys.modules]}}))
+"""
+
+
+def medir(codigo):
+    """Ejecuta el código en un intérprete nuevo; devuelve (segundos, módulos pesados, error)"""
+    programa = MEDIR.format(codigo="\n".join("    " + linea for linea in codigo.splitlines()),
+                            pesados=PESADOS)
+    salida = subprocess.run([sys.executable, "-c", programa], cwd=RAIZ,
+                            capture_output=True, text=True, check=True).stdout
+    datos = json.loads(salida.strip().splitlines()[-1])
+    return datos["tiempo"], datos["pesados"], datos["error"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=7)
+    args = parser.parse_args()
+
+    # Intérprete vacío como referencia del costo fijo de Python
+    base = statistics.median(medir("pass")[0] for _ in range(args.repeticiones))
+    print(f"{'escenario':<26} | {'mediana (ms)':>12} | módulos pesados cargados")
+    for nombre, codigo in ESCENARIOS.items():
+        tiempos, pesados, error = [], [], None
+        for _ in range(args.repeticiones):
+            tiempo, pesados, error = medir(codigo)
+            if error:
+                break
+            tiempos.append(tiempo)
+        if error:
+            print(f"{nombre:<26} | {'-':>12} | no disponible ({error})")
+            continue
+        print(f"{nombre:<26} | {(statistics.median(tiempos) - base) * 1000:>12.1f} | "
+              f"{', '.join(pesados) or 'ninguno'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Efecto del escalamiento de filas y columnas en el número de iteraciones
+
+Genera problemas factibles y acotados y les aplica factores de fila y columna
+entre 1e-3 y 1e5, que es lo que ocurre al mezclar unidades en un mismo modelo.
+Cada problema se resuelve sin escalar y escalado, con los dos motores.
+
+Uso:
+    python benchmarks/escalamiento.py [--semilla N] [--repeticiones N]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import SolucionadorPL  # noqa: E402
+
+TAMANOS = [(40, 60), (80, 120), (120, 180)]
+
+
+def generar_problema(m, n, rng):
+    """Problema max c·x, A·x <= b con A >= 0 (siempre factible y acotado) mal escalado"""
+    A = rng.random((m, n)) * (rng.random((m, n)) < 0.3)
+    A[np.arange(m), rng.integers(0, n, size=m)] += 1.0
+    A[rng.integers(0, m, size=n), np.arange(n)] += 1.0
+    b = A.sum(axis=1) * rng.uniform(0.2, 0.6, size=m)
+    c = rng.uniform(0.5, 2.0, size=n)
+
+    escala_filas = 10.0 ** rng.uniform(-3, 5, size=m)
+    escala_columnas = 10.0 ** rng.uniform(-3, 5, size=n)
+    A = A * escala_filas[:, np.newaxis] * escala_columnas
+    b = b * escala_filas
+    c = c * escala_columnas
+    return c, A, b
+
+
+def resolver(c, A, b, motor, escalar):
+    """Devuelve (estado, valor, iteraciones, segundos) de una resolución"""
+    solver = SolucionadorPL()
+    solver.verbose = False
+    solver.motor = motor
+    solver.escalar = escalar
+    solver.max_iteraciones = 10_000
+    solver.establecer_objetivo(list(c), "max")
+    solver.agregar_restricciones(A.copy(), b.copy(), ["<="] * len(b))
+    inicio = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        _, valor = solver.resolver()
+    return solver.estado, valor, solver.iteraciones, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.semilla)
+
+    print(f"{'tamaño':>10} {'motor':>9} | {'iter sin':>8} {'iter con':>8} | "
+          f"{'t sin (s)':>9} {'t con (s)':>9} | {'dif. relativa objetivo':>22}")
+    for m, n in TAMANOS:
+        for motor in ("tableau", "revisado"):
+            totales = np.zeros(4)
+            diferencia = 0.0
+            for _ in range(args.repeticiones):
+                c, A, b = generar_problema(m, n, rng)
+                _, valor_sin, iter_sin, t_sin = resolver(c, A, b, motor, False)
+                _, valor_con, iter_con, t_con = resolver(c, A, b, motor, True)
+                totales += (iter_sin, iter_con, t_sin, t_con)
+                diferencia = max(diferencia, abs(valor_sin - valor_con) / max(1.0, abs(valor_con)))
+            totales /= args.repeticiones
+            print(f"{m:>4}x{n:<5} {motor:>9} | {totales[0]:>8.1f} {totales[1]:>8.1f} | "
+                  f"{totales[2]:>9.3f} {totales[3]:>9.3f} | {diferencia:>22.2e}")
+
+
+if __name__ == "__main__":
+    main()
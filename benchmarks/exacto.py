@@ -0,0 +1,86 @@
+"""
+Modo exacto: pivoteo entero de Bareiss frente a un tableau ingenuo de Fraction
+
+Genera problemas max c·x, A·x <= b con coeficientes racionales (denominadores
+pequeños), los resuelve con SimplexExacto y con un simplex de Dantzig que guarda
+cada entrada como Fraction, y compara el tiempo y que el valor óptimo coincida.
+
+Uso:
+    python benchmarks/exacto.py [--semilla N] [--problemas K]
+"""
+import argparse
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from simplex_exacto import SimplexExacto  # noqa: E402
+
+TAMANOS = [(10, 15), (20, 30), (40, 60)]
+
+
+def generar_problema(m, n, rng):
+    """A y c con fracciones de denominador hasta 7; b positivo para que el origen sea factible"""
+    def fraccion():
+        return Fraction(int(rng.integers(0, 20)), int(rng.integers(1, 8)))
+    A = [[fraccion() if rng.random() < 0.6 else Fraction(0) for _ in range(n)] for _ in range(m)]
+    b = [Fraction(int(rng.integers(10, 100)), int(rng.integers(1, 5))) for _ in range(m)]
+    c = [fraccion() + 1 for _ in range(n)]
+    return c, A, b
+
+
+def resolver_ingenuo(c, A, b):
+    """Simplex de Dantzig sobre un tableau de Fraction (holguras como base inicial)"""
+    m, n = len(A), len(c)
+    T = [A[i] + [Fraction(int(i == k)) for k in range(m)] + [b[i]] for i in range(m)]
+    T.append([-v for v in c] + [Fraction(0)] * (m + 1))
+    while True:
+        col = min(range(n + m), key=lambda j: T[m][j])
+        if T[m][col] >= 0:
+            return T[m][-1]
+        filas = [i for i in range(m) if T[i][col] > 0]
+        if not filas:
+            return None
+        fila = min(filas, key=lambda i: T[i][-1] / T[i][col])
+        p = T[fila][col]
+        T[fila] = [v / p for v in T[fila]]
+        for i in range(m + 1):
+            if i != fila and T[i][col] != 0:
+                f = T[i][col]
+                T[i] = [v - f * w for v, w in zip(T[i], T[fila])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--problemas", type=int, default=5)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.semilla)
+
+    print(f"{'tamaño':>10} {'k':>4} | {'t Fraction (s)':>14} {'t Bareiss (s)':>13} "
+          f"{'aceleración':>11} | {'coinciden':>9}")
+    for m, n in TAMANOS:
+        problemas = [generar_problema(m, n, rng) for _ in range(args.problemas)]
+
+        inicio = time.perf_counter()
+        valores_ingenuos = [resolver_ingenuo(c, A, b) for c, A, b in problemas]
+        t_ingenuo = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        valores_exactos = []
+        for c, A, b in problemas:
+            motor = SimplexExacto(c, A, b, ["<="] * m, max_iteraciones=10000)
+            motor.resolver()
+            valores_exactos.append(motor.valor_objetivo())
+        t_exacto = time.perf_counter() - inicio
+
+        coinciden = sum(u == v for u, v in zip(valores_ingenuos, valores_exactos))
+        print(f"{m:>4}x{n:<5} {args.problemas:>4} | {t_ingenuo:>14.3f} {t_exacto:>13.3f} "
+              f"{t_ingenuo / t_exacto:>10.1f}x | {coinciden:>5}/{args.problemas}")
+
+
+if __name__ == "__main__":
+    main()
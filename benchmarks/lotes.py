@@ -0,0 +1,82 @@
+"""
+Lote de problemas pequeños: SimplexLotes frente a un SolucionadorPL por problema
+
+Genera k problemas de reposición con la misma forma (mín c·x, A·x >= b) que
+solo difieren en la demanda b y los costos c, y compara el tiempo total y los
+valores objetivo de ambos caminos.
+
+Uso:
+    python benchmarks/lotes.py [--semilla N] [--problemas K]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import SolucionadorPL  # noqa: E402
+from simplex_lotes import ESTADOS, OPTIMO, resolver_lote  # noqa: E402
+
+TAMANOS = [(5, 8), (10, 15), (20, 30)]
+
+
+def generar_lote(k, m, n, rng):
+    """A común con entradas no negativas; b y c distintos en cada problema"""
+    A = rng.random((m, n)) * (rng.random((m, n)) < 0.5)
+    A[np.arange(m), rng.integers(0, n, size=m)] += 1.0
+    b = rng.uniform(1.0, 10.0, size=(k, m))
+    c = rng.uniform(0.5, 2.0, size=(k, n))
+    return c, A, b
+
+
+def resolver_uno_a_uno(c, A, b):
+    """Resuelve cada problema con su propio SolucionadorPL; devuelve (valores, estados)"""
+    valores, estados = [], []
+    for c_p, b_p in zip(c, b):
+        solver = SolucionadorPL()
+        solver.verbose = False
+        solver.dual_automatico = False
+        solver.max_iteraciones = 1000
+        solver.establecer_objetivo(list(c_p), "min")
+        solver.agregar_restricciones(A.copy(), b_p.copy(), [">="] * len(b_p))
+        with redirect_stdout(io.StringIO()):
+            _, valor = solver.resolver()
+        valores.append(valor)
+        estados.append(solver.estado)
+    return np.array(valores), estados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--problemas", type=int, default=1000)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.semilla)
+
+    print(f"{'tamaño':>10} {'k':>6} | {'t uno a uno (s)':>15} {'t lote (s)':>10} "
+          f"{'aceleración':>11} | {'dif. máx. objetivo':>18}")
+    for m, n in TAMANOS:
+        c, A, b = generar_lote(args.problemas, m, n, rng)
+
+        inicio = time.perf_counter()
+        valores_uno, estados_uno = resolver_uno_a_uno(c, A, b)
+        t_uno = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        _, valores_lote, estados_lote = resolver_lote(c, A, b, [">="] * m, "min", 1000)
+        t_lote = time.perf_counter() - inicio
+
+        if [ESTADOS[e] for e in estados_lote] != estados_uno:
+            print("  Advertencia: los estados no coinciden")
+        optimos = estados_lote == OPTIMO
+        diferencia = np.max(np.abs(valores_lote[optimos] - valores_uno[optimos]), initial=0.0)
+        print(f"{m:>4}x{n:<5} {args.problemas:>6} | {t_uno:>15.3f} {t_lote:>10.3f} "
+              f"{t_uno / t_lote:>10.1f}x | {diferencia:>18.2e}")
+
+
+if __name__ == "__main__":
+    main()
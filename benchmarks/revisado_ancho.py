@@ -0,0 +1,86 @@
+"""
+Simplex revisado contra el tableau en problemas anchos (n mucho mayor que m)
+
+Genera problemas aleatorios de maximización con restricciones <= y los resuelve
+con los dos motores y la misma regla de pricing. El tableau actualiza m·(n+m)
+elementos por pivote; el revisado hace ftran/btran en O(m²) y, con pricing
+parcial, calcula yᵀ·a_j solo para los segmentos de columnas que revisa. Se
+informa la mediana del tiempo total (con la preparación y el escalamiento, que
+son comunes a ambos motores) y de los milisegundos por iteración, medidos entre
+el primer y el último evento de iteración.
+
+Uso:
+    python benchmarks/revisado_ancho.py [--repeticiones N] [--pricing parcial]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SolucionadorPL  # noqa: E402
+from eventos_simplex import ITERACION  # noqa: E402
+
+TAMANOS = [(50, 2000), (100, 5000), (200, 10000), (300, 600)]
+
+
+def generar(m, n, semilla=0):
+    """Problema aleatorio denso y acotado: max c·x sujeto a A·x <= b, x >= 0"""
+    rng = np.random.default_rng(semilla)
+    A = rng.random((m, n))
+    b = rng.random(m) * 100 + 1
+    c = rng.random(n)
+    return A, b, c
+
+
+def resolver(A, b, c, motor, pricing):
+    """Devuelve (segundos totales, segundos por iteración, iteraciones, valor)"""
+    marcas = []
+
+    def marcar(evento):
+        if evento.tipo == ITERACION:
+            marcas.append(time.perf_counter())
+
+    solver = SolucionadorPL(pricing=pricing)
+    solver.verbose = False
+    solver.motor = motor
+    solver.max_iteraciones = 100000
+    solver.al_evento = marcar
+    solver.establecer_objetivo(c, "max")
+    solver.agregar_restricciones(A.copy(), b.copy(), ["<="] * len(b))
+    inicio = time.perf_counter()
+    _, valor = solver.resolver()
+    total = time.perf_counter() - inicio
+    por_iteracion = (marcas[-1] - marcas[0]) / (len(marcas) - 1) if len(marcas) > 1 else 0.0
+    return total, por_iteracion, solver.iteraciones, float(valor)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--pricing", default="parcial",
+                        choices=["dantzig", "parcial", "devex", "steepest_edge"])
+    args = parser.parse_args()
+
+    print(f"pricing: {args.pricing}")
+    print(f"{'m×n':>10} | {'motor':<9} | {'iter.':>6} | {'total (ms)':>10} | "
+          f"{'ms/iter.':>8} | objetivo")
+    for m, n in TAMANOS:
+        A, b, c = generar(m, n)
+        for motor in ("tableau", "revisado"):
+            totales, por_iteracion = [], []
+            for _ in range(args.repeticiones):
+                total, tiempo, iteraciones, valor = resolver(A, b, c, motor, args.pricing)
+                totales.append(total)
+                por_iteracion.append(tiempo)
+            print(f"{f'{m}×{n}':>10} | {motor:<9} | {iteraciones:>6} | "
+                  f"{statistics.median(totales) * 1000:>10.1f} | "
+                  f"{statistics.median(por_iteracion) * 1000:>8.3f} | {valor:.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Solucionador sin interfaz gráfica para scripts, pipelines y contenedores
+
+Lee uno o varios problemas (.json con el formato de resolucion_paralela, .mps o
+.lp, también comprimidos con .gz) o uno desde la entrada estándar ("-"), los
+resuelve uno tras otro en el mismo proceso y escribe en la salida estándar una
+línea JSON por problema (o CSV con --salida csv). La salida detallada del
+solucionador (-v) va a la salida de errores para no mezclarse con los datos.
+
+Códigos de salida:
+    0  todos los problemas tienen solución óptima
+    1  algún problema no se pudo leer o resolver
+    2  argumentos inválidos
+    3  infactible
+    4  no acotado
+    5  límite de iteraciones alcanzado
+Con varios problemas se devuelve 1 si alguno falló y, si no, el mayor código.
+
+Uso:
+    python cli_simplex.py MODELO [MODELO ...] [--motor revisado] [--exacto] [--fracciones]
+    cat problema.lp | python cli_simplex.py - --formato lp --salida csv
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from contextlib import redirect_stdout
+from fractions import Fraction
+
+from app import SolucionadorPL
+from archivos_modelo import leer_lp, leer_mps
+from resolucion_paralela import cargar_datos, cargar_en_solver
+
+CODIGOS_SALIDA = {"optimo": 0, "error": 1, "infactible": 3, "no_acotado": 4,
+                  "max_iteraciones": 5}
+COLUMNAS_CSV = ["archivo", "estado", "iteraciones", "tiempo", "variable", "valor", "error"]
+
+
+def crear_solver(args):
+    """SolucionadorPL silencioso configurado con las opciones de la línea de comandos"""
+    solver = SolucionadorPL(pricing=args.pricing)
+    solver.verbose = args.verbose
+    solver.exacto = args.exacto
+    solver.usar_fracciones = args.fracciones
+    solver.usar_presolve = args.presolve
+    if args.motor:
+        solver.motor = args.motor
+    if args.metodo:
+        solver.metodo = args.metodo
+    if args.tolerancia is not None:
+        solver.epsilon = args.tolerancia
+    if args.max_iteraciones is not None:
+        solver.max_iteraciones = args.max_iteraciones
+    return solver
+
+
+def cargar(solver, ruta, formato):
+    """
+    Carga un problema de un archivo o de la entrada estándar (ruta "-")
+
+    Returns:
+        ModeloPL: El modelo de un .mps o .lp, o None si era JSON
+    """
+    if ruta != "-":
+        return cargar_en_solver(solver, ruta)
+    if formato == "json":
+        cargar_datos(solver, json.load(sys.stdin))
+        return None
+    modelo = leer_lp(sys.stdin) if formato == "lp" else leer_mps(sys.stdin, fijo=formato == "mps-fijo")
+    modelo.cargar_en(solver)
+    return modelo
+
+
+def _numero(valor, args):
+    """Número para la salida: float, o texto "p/q" con --fracciones"""
+    if not args.fracciones:
+        return float(valor)
+    fraccion = Fraction(valor)
+    return str(fraccion if args.exacto else fraccion.limit_denominator())
+
+
+def resolver(ruta, args):
+    """
+    Resuelve un problema
+
+    Returns:
+        dict: archivo, estado, valor, iteraciones, tiempo (s), variables, solucion y
+        error; valor y solucion son None si el problema no tiene óptimo
+    """
+    resultado = {"archivo": ruta, "estado": "error", "valor": None, "iteraciones": 0,
+                 "tiempo": 0.0, "variables": None, "solucion": None, "error": None}
+    inicio = time.perf_counter()
+    try:
+        solver = crear_solver(args)
+        # El reporte detallado va a stderr: stdout queda solo para los resultados
+        with redirect_stdout(sys.stderr):
+            modelo = cargar(solver, ruta, args.formato)
+            solucion, valor = solver.resolver()
+
+        estado = solver.estado
+        if estado == "optimo" and solver.tiene_artificiales_en_solucion():
+            estado = "infactible"
+        resultado["estado"] = estado
+        resultado["iteraciones"] = solver.iteraciones
+        if modelo is not None:
+            resultado["variables"] = modelo.nombres_variables
+        else:
+            resultado["variables"] = [f"x{j + 1}" for j in range(solver.num_variables)]
+        if estado == "optimo":
+            if modelo is not None:
+                valor = modelo.valor_original(valor)
+                solucion = modelo.solucion_original(solucion)
+            resultado["valor"] = _numero(valor, args)
+            resultado["solucion"] = [_numero(v, args) for v in solucion[:solver.num_variables]]
+    except Exception as e:
+        resultado["error"] = f"{type(e).__name__}: {e}"
+    resultado["tiempo"] = time.perf_counter() - inicio
+    return resultado
+
+
+def codigo_salida(estados):
+    """Código de salida para los estados de todos los problemas resueltos"""
+    codigos = [CODIGOS_SALIDA.get(estado, CODIGOS_SALIDA["max_iteraciones"]) for estado in estados]
+    if CODIGOS_SALIDA["error"] in codigos:
+        return CODIGOS_SALIDA["error"]
+    return max(codigos, default=0)
+
+
+class EscritorCSV:
+    """Resultados en CSV largo: una fila por variable más una fila "objetivo" """
+
+    def __init__(self, salida):
+        self.escritor = csv.writer(salida, lineterminator="\n")
+        self.escritor.writerow(COLUMNAS_CSV)
+
+    def escribir(self, resultado):
+        comunes = [resultado["archivo"], resultado["estado"], resultado["iteraciones"],
+                   f"{resultado['tiempo']:.6f}"]
+        if resultado["solucion"] is None:
+            self.escritor.writerow(comunes + ["", "", resultado["error"] or ""])
+            return
+        self.escritor.writerow(comunes + ["objetivo", resultado["valor"], ""])
+        for nombre, valor in zip(resultado["variables"], resultado["solucion"]):
+            self.escritor.writerow(comunes + [nombre, valor, ""])
+
+
+class EscritorJSON:
+    """Resultados en JSON Lines: un objeto por problema"""
+
+    def __init__(self, salida):
+        self.salida = salida
+
+    def escribir(self, resultado):
+        self.salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        description="Resuelve problemas de PL sin interfaz gráfica",
+        epilog="Códigos de salida: 0 óptimo, 1 error, 2 argumentos inválidos, 3 infactible, "
+               "4 no acotado, 5 límite de iteraciones")
+    parser.add_argument("modelos", nargs="+", metavar="MODELO",
+                        help="Archivos .json, .mps o .lp (opcionalmente .gz); - lee la entrada estándar")
+    parser.add_argument("--formato", default="json", choices=["json", "mps", "mps-fijo", "lp"],
+                        help="Formato de la entrada estándar (los archivos se reconocen por su extensión)")
+    parser.add_argument("--salida", default="json", choices=["json", "csv"])
+    parser.add_argument("--motor", default=None, choices=["tableau", "dual", "revisado"])
+    parser.add_argument("--metodo", default=None, choices=["big_m", "dos_fases"])
+    parser.add_argument("--pricing", default=None,
+                        choices=["dantzig", "parcial", "devex", "steepest_edge"])
+    parser.add_argument("--tolerancia", type=float, default=None,
+                        help="Tolerancia numérica del solucionador (epsilon)")
+    parser.add_argument("--max-iteraciones", type=int, default=None)
+    parser.add_argument("--presolve", action="store_true")
+    parser.add_argument("--exacto", action="store_true",
+                        help="Aritmética racional exacta (implica resultados exactos con --fracciones)")
+    parser.add_argument("--fracciones", action="store_true",
+                        help="Escribir los valores como fracciones \"p/q\"")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Proceso detallado del solucionador en la salida de errores")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos
+
+    Returns:
+        int: Código de salida (ver el docstring del módulo)
+    """
+    args = crear_parser().parse_args(argv)
+    if args.modelos.count("-") > 1:
+        crear_parser().error("la entrada estándar (-) solo puede leerse una vez")
+
+    escritor = EscritorCSV(sys.stdout) if args.salida == "csv" else EscritorJSON(sys.stdout)
+    estados = []
+    for ruta in args.modelos:
+        resultado = resolver(ruta, args)
+        escritor.escribir(resultado)
+        sys.stdout.flush()
+        estados.append(resultado["estado"])
+    return codigo_salida(estados)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+import numpy as np
+from matriz_dispersa import MatrizCSC, es_dispersa, a_csc
+
+# Tamaño (filas × columnas) a partir del cual el solucionador escala por defecto
+UMBRAL_ESCALAMIENTO = 10_000
+
+
+class Escalamiento:
+    """
+    Escalamiento de filas y columnas: Ã = R·A·C, b̃ = R·b, c̃ = C·c, x = C·x̃
+
+    Primero hace pasadas de media geométrica (cada fila y columna se divide por
+    √(max|a|·min|a|)) y después equilibra para que el mayor coeficiente de cada
+    fila y columna sea 1. Los factores se redondean a potencias de 2, así que
+    escalar y desescalar no introduce errores de redondeo. El valor del objetivo
+    no cambia: c̃·x̃ = c·x.
+    """
+
+    def __init__(self, pasadas_geometricas=4, equilibrar=True, tolerancia_mejora=0.1):
+        """
+        Args:
+            pasadas_geometricas: Máximo de pasadas de media geométrica
+            equilibrar: Normalizar al final el máximo de filas y columnas a 1
+            tolerancia_mejora: Mejora relativa mínima del rango para seguir iterando
+        """
+        self.pasadas_geometricas = pasadas_geometricas
+        self.equilibrar = equilibrar
+        self.tolerancia_mejora = tolerancia_mejora
+        self.factores_filas = None
+        self.factores_columnas = None
+        self.rango_original = 1.0     # max|a| / min|a| antes de escalar
+        self.rango_escalado = 1.0     # max|a| / min|a| después de escalar
+
+    def calcular(self, A):
+        """Calcula los factores de fila y columna para la matriz A (densa o dispersa)"""
+        if es_dispersa(A):
+            A = a_csc(A)
+            filas, columnas, valores = A.indices, A.columnas_de_entradas(), A.datos
+        else:
+            A = np.asarray(A, dtype=float)
+            filas, columnas = np.nonzero(A)
+            valores = A[filas, columnas]
+        m, n = A.shape
+        valores = np.abs(valores)
+
+        # Entradas agrupadas por fila y por columna para reducir con reduceat
+        orden_filas = np.argsort(filas, kind="stable")
+        orden_columnas = np.argsort(columnas, kind="stable")
+        grupos_filas = _grupos(filas[orden_filas], m)
+        grupos_columnas = _grupos(columnas[orden_columnas], n)
+
+        r, s = np.ones(m), np.ones(n)
+
+        def escalados():
+            return valores * r[filas] * s[columnas]
+
+        self.rango_original = _rango(valores)
+        rango = self.rango_original
+        for _ in range(self.pasadas_geometricas):
+            actuales = escalados()
+            r /= np.sqrt(_reducir(np.maximum, actuales[orden_filas], grupos_filas)
+                         * _reducir(np.minimum, actuales[orden_filas], grupos_filas))
+            actuales = escalados()
+            s /= np.sqrt(_reducir(np.maximum, actuales[orden_columnas], grupos_columnas)
+                         * _reducir(np.minimum, actuales[orden_columnas], grupos_columnas))
+            nuevo_rango = _rango(escalados())
+            if nuevo_rango > rango * (1.0 - self.tolerancia_mejora):
+                break
+            rango = nuevo_rango
+
+        if self.equilibrar:
+            r /= _reducir(np.maximum, escalados()[orden_filas], grupos_filas)
+            s /= _reducir(np.maximum, escalados()[orden_columnas], grupos_columnas)
+
+        self.factores_filas = _potencia_de_dos(r)
+        self.factores_columnas = _potencia_de_dos(s)
+        self.rango_escalado = _rango(valores * self.factores_filas[filas]
+                                     * self.factores_columnas[columnas])
+        return self
+
+    def escalar(self, c, A, b, inferiores=None, superiores=None):
+        """
+        Devuelve copias escaladas de (c, A, b, inferiores, superiores)
+
+        Las cotas se dividen por el factor de su columna porque x̃ = x / C.
+        """
+        r, s = self.factores_filas, self.factores_columnas
+        if es_dispersa(A):
+            A = a_csc(A)
+            A = MatrizCSC(A.datos * r[A.indices] * s[A.columnas_de_entradas()],
+                          A.indices.copy(), A.indptr.copy(), A.shape)
+        else:
+            A = np.asarray(A, dtype=float) * r[:, np.newaxis] * s
+        c = np.asarray(c, dtype=float).copy()
+        c[:len(s)] *= s
+        b = np.asarray(b, dtype=float) * r
+        if inferiores is not None:
+            inferiores = np.asarray(inferiores, dtype=float) / s
+        if superiores is not None:
+            superiores = np.asarray(superiores, dtype=float) / s
+        return c, A, b, inferiores, superiores
+
+    def desescalar_solucion(self, x):
+        """Convierte una solución del modelo escalado a las variables originales"""
+        return x * self.factores_columnas
+
+
+def debe_escalar(A):
+    """Criterio automático: escalar los modelos de al menos UMBRAL_ESCALAMIENTO coeficientes"""
+    m, n = A.shape
+    return m * n >= UMBRAL_ESCALAMIENTO
+
+
+def _grupos(claves_ordenadas, tamano):
+    """Inicio de cada grupo y cuántos elementos tiene, para claves ya ordenadas"""
+    conteos = np.bincount(claves_ordenadas, minlength=tamano)
+    inicios = np.zeros(tamano, dtype=np.intp)
+    np.cumsum(conteos[:-1], out=inicios[1:])
+    return inicios, conteos
+
+
+def _reducir(ufunc, valores, grupos):
+    """Reduce cada grupo con ufunc; los grupos vacíos dan 1 (factor neutro)"""
+    inicios, conteos = grupos
+    resultado = np.ones(len(conteos))
+    no_vacios = conteos > 0
+    if valores.size > 0:
+        resultado[no_vacios] = ufunc.reduceat(valores, inicios[no_vacios])
+    return resultado
+
+
+def _rango(valores):
+    """Cociente entre el mayor y el menor valor absoluto no nulo"""
+    if valores.size == 0:
+        return 1.0
+    return float(valores.max() / valores.min())
+
+
+def _potencia_de_dos(factores):
+    """Redondea cada factor a la potencia de 2 más cercana (en escala logarítmica)"""
+    return np.exp2(np.round(np.log2(factores)))
@@ -0,0 +1,240 @@
+import numpy as np
+
+
+class EstrategiaPricing:
+    """
+    Regla base para elegir la columna entrante del simplex
+
+    Los motores entregan los costos reducidos con la convención del tableau
+    (negativo = mejora el objetivo, cero en las básicas) y, después de elegir
+    la fila pivote, llaman a actualizar() antes de modificar la base.
+    """
+
+    nombre = "base"
+    usa_fila_pivote = False      # Necesita la fila pivote α_r en actualizar()
+    usa_productos = False        # Necesita α_jᵀ·α_q para todas las columnas
+    usa_normas = False           # Necesita 1 + ||α_j||² al inicializar
+    por_columnas = False         # Puede elegir sin conocer todos los costos reducidos
+
+    def __init__(self):
+        self.iteraciones = 0
+        self.pesos = None
+
+    def inicializar(self, num_columnas, normas=None):
+        """Prepara la estrategia para un tableau con num_columnas variables"""
+        self.pesos = np.ones(num_columnas)
+
+    def seleccionar(self, costos, epsilon):
+        """
+        Elige la columna entrante
+
+        Returns:
+            int: Índice de la columna o -1 si ningún costo reducido mejora
+        """
+        raise NotImplementedError
+
+    def actualizar(self, fila, entrante, saliente, alfa_col, alfa_fila=None, productos=None):
+        """
+        Actualiza el estado interno con los datos del pivote (antes de aplicarlo)
+
+        Args:
+            fila: Fila pivote r
+            entrante: Columna entrante q
+            saliente: Variable que sale de la base
+            alfa_col: Columna pivote α_q (filas de restricciones)
+            alfa_fila: Fila pivote α_r para todas las columnas
+            productos: α_jᵀ·α_q para todas las columnas
+        """
+        self.iteraciones += 1
+
+    def estadisticas(self):
+        """Resumen de uso de la regla para los reportes"""
+        return {f"iteraciones con {self.nombre}": self.iteraciones}
+
+
+class PricingDantzig(EstrategiaPricing):
+    """Regla de Dantzig: costo reducido más negativo (primer índice en empates)"""
+
+    nombre = "dantzig"
+
+    def seleccionar(self, costos, epsilon):
+        j = int(np.argmin(costos))
+        if costos[j] >= -epsilon:
+            return -1
+        return j
+
+
+class PricingParcial(EstrategiaPricing):
+    """
+    Pricing parcial y múltiple
+
+    Recorre las columnas por segmentos de forma cíclica y elige la mejor del
+    primer segmento que tenga costos negativos. Además conserva una lista de
+    candidatos del último recorrido y los prueba primero (pricing múltiple).
+    """
+
+    nombre = "parcial"
+    por_columnas = True
+
+    def __init__(self, tam_segmento=None, num_candidatos=8):
+        """
+        Args:
+            tam_segmento: Columnas por segmento; por defecto ~10% de las columnas
+            num_candidatos: Tamaño de la lista de candidatos del pricing múltiple
+        """
+        super().__init__()
+        self.tam_segmento = tam_segmento
+        self.num_candidatos = num_candidatos
+        self.candidatos = np.empty(0, dtype=np.intp)
+        self.inicio = 0
+        self.recorridos_completos = 0
+
+    def inicializar(self, num_columnas, normas=None):
+        super().inicializar(num_columnas, normas)
+        self.candidatos = np.empty(0, dtype=np.intp)
+        self.inicio = 0
+
+    def seleccionar(self, costos, epsilon):
+        return self.seleccionar_por_columnas(costos.__getitem__, len(costos), epsilon)
+
+    def seleccionar_por_columnas(self, costos_de, num_columnas, epsilon):
+        """
+        Igual que seleccionar(), pero pide los costos reducidos solo de las
+        columnas que revisa (el simplex revisado no calcula los demás)
+
+        Args:
+            costos_de: Función que recibe un arreglo de índices y devuelve sus costos
+            num_columnas: Cantidad total de columnas
+        """
+        # Pricing múltiple: reutilizar candidatos que siguen siendo atractivos
+        if len(self.candidatos) > 0:
+            valores = costos_de(self.candidatos)
+            k = int(np.argmin(valores))
+            if valores[k] < -epsilon:
+                return int(self.candidatos[k])
+
+        n = num_columnas
+        tam = self.tam_segmento or max(1, n // 10)
+        for desplazamiento in range(0, n, tam):
+            inicio = (self.inicio + desplazamiento) % n
+            segmento = np.arange(inicio, min(inicio + tam, n))
+            valores = costos_de(segmento)
+            negativos = valores < -epsilon
+            if negativos.any():
+                self.inicio = (inicio + tam) % n
+                orden = np.argsort(valores[negativos])[:self.num_candidatos]
+                self.candidatos = segmento[negativos][orden]
+                return int(self.candidatos[0])
+
+        self.recorridos_completos += 1
+        self.candidatos = np.empty(0, dtype=np.intp)
+        return -1
+
+    def estadisticas(self):
+        estadisticas = super().estadisticas()
+        estadisticas["recorridos completos"] = self.recorridos_completos
+        return estadisticas
+
+
+class PricingDevex(EstrategiaPricing):
+    """
+    Pricing Devex (Forrest–Goldfarb): aproxima las normas de las aristas con
+    pesos de referencia y elige el máximo de d_j² / w_j
+    """
+
+    nombre = "devex"
+    usa_fila_pivote = True
+
+    def __init__(self, limite_reinicio=1e6):
+        super().__init__()
+        self.limite_reinicio = limite_reinicio
+        self.reinicios = 0
+
+    def seleccionar(self, costos, epsilon):
+        candidatos = costos < -epsilon
+        if not candidatos.any():
+            return -1
+        puntajes = np.where(candidatos, costos * costos / self.pesos, -1.0)
+        return int(np.argmax(puntajes))
+
+    def actualizar(self, fila, entrante, saliente, alfa_col, alfa_fila=None, productos=None):
+        super().actualizar(fila, entrante, saliente, alfa_col)
+        alfa_rq = alfa_fila[entrante]
+        peso_q = self.pesos[entrante]
+
+        razon = alfa_fila / alfa_rq
+        np.maximum(self.pesos, razon * razon * peso_q, out=self.pesos)
+        self.pesos[saliente] = max(peso_q / (alfa_rq * alfa_rq), 1.0)
+        self.pesos[entrante] = 1.0
+
+        # Reiniciar el marco de referencia si los pesos crecen demasiado
+        if self.pesos.max() > self.limite_reinicio:
+            self.pesos.fill(1.0)
+            self.reinicios += 1
+
+    def estadisticas(self):
+        estadisticas = super().estadisticas()
+        estadisticas["reinicios de pesos"] = self.reinicios
+        return estadisticas
+
+
+class PricingSteepestEdge(EstrategiaPricing):
+    """
+    Steepest edge exacto (Goldfarb–Reid): γ_j = 1 + ||B⁻¹·a_j||², actualizado
+    de forma incremental en cada pivote; elige el máximo de d_j² / γ_j
+    """
+
+    nombre = "steepest_edge"
+    usa_fila_pivote = True
+    usa_productos = True
+    usa_normas = True
+
+    def inicializar(self, num_columnas, normas=None):
+        if normas is None:
+            self.pesos = np.ones(num_columnas)
+        else:
+            self.pesos = np.array(normas, dtype=float)
+
+    def seleccionar(self, costos, epsilon):
+        candidatos = costos < -epsilon
+        if not candidatos.any():
+            return -1
+        puntajes = np.where(candidatos, costos * costos / self.pesos, -1.0)
+        return int(np.argmax(puntajes))
+
+    def actualizar(self, fila, entrante, saliente, alfa_col, alfa_fila=None, productos=None):
+        super().actualizar(fila, entrante, saliente, alfa_col)
+        alfa_rq = alfa_fila[entrante]
+        gamma_q = self.pesos[entrante]
+
+        # γ_j ← γ_j - 2·θ_j·α_jᵀα_q + θ_j²·γ_q, con θ_j = α_rj / α_rq
+        theta = alfa_fila / alfa_rq
+        self.pesos += theta * (theta * gamma_q - 2.0 * productos)
+        np.maximum(self.pesos, 1.0 + theta * theta, out=self.pesos)
+        self.pesos[saliente] = max(gamma_q / (alfa_rq * alfa_rq), 1.0)
+        self.pesos[entrante] = 1.0
+
+
+ESTRATEGIAS = {
+    "dantzig": PricingDantzig,
+    "parcial": PricingParcial,
+    "devex": PricingDevex,
+    "steepest_edge": PricingSteepestEdge,
+}
+
+
+def crear_estrategia(estrategia=None):
+    """
+    Devuelve una estrategia de pricing a partir de un nombre o instancia
+
+    Args:
+        estrategia: None (Dantzig), nombre en ESTRATEGIAS o instancia de EstrategiaPricing
+    """
+    if estrategia is None:
+        return PricingDantzig()
+    if isinstance(estrategia, EstrategiaPricing):
+        return estrategia
+    try:
+        return ESTRATEGIAS[estrategia]()
+    except KeyError:
+        raise ValueError(f"Estrategia de pricing desconocida: {estrategia}")
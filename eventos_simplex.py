@@ -0,0 +1,77 @@
+import numpy as np
+
+# Tipos de evento que emite SolucionadorPL durante una resolución
+TABLEAU_INICIAL = "tableau_inicial"     # tableau, indice_historial
+PIVOTE = "pivote"                       # fila, columna, elemento (antes de pivotear)
+ITERACION = "iteracion"                 # fila, columna y tableau/indice_historial o direccion
+FASE_DOS = "fase_dos"                   # tableau, indice_historial (fin de la Fase I)
+OPTIMO = "optimo"                       # solucion, valor
+NO_ACOTADO = "no_acotado"
+INFACTIBLE = "infactible"
+MAX_ITERACIONES = "max_iteraciones"
+CANCELADO = "cancelado"                 # Se pidió detener la resolución (ver SolucionadorPL.cancelar)
+
+FINALES = (OPTIMO, NO_ACOTADO, INFACTIBLE, MAX_ITERACIONES, CANCELADO)
+
+
+class EventoSimplex:
+    """
+    Un paso de la resolución con solo los índices y arreglos involucrados
+
+    Los arreglos (tableau, direccion) son los del solucionador en ese momento y
+    solo son válidos durante la llamada; quien los guarde debe usar copiar().
+    En un cambio de cota la fila es None (la base no cambia).
+    """
+
+    __slots__ = ("tipo", "iteracion", "fila", "columna", "elemento", "tableau",
+                 "indice_historial", "direccion", "solucion", "valor")
+
+    def __init__(self, tipo, iteracion, fila=None, columna=None, elemento=None, tableau=None,
+                 indice_historial=None, direccion=None, solucion=None, valor=None):
+        self.tipo = tipo
+        self.iteracion = iteracion
+        self.fila = fila
+        self.columna = columna
+        self.elemento = elemento
+        self.tableau = tableau
+        self.indice_historial = indice_historial
+        self.direccion = direccion
+        self.solucion = solucion
+        self.valor = valor
+
+    @property
+    def es_final(self):
+        return self.tipo in FINALES
+
+    def copiar(self):
+        """Copia con arreglos propios (para pasar el evento a otro hilo o guardarlo)"""
+        copia = EventoSimplex(self.tipo, self.iteracion)
+        for atributo in self.__slots__[2:]:
+            valor = getattr(self, atributo)
+            setattr(copia, atributo, valor.copy() if isinstance(valor, np.ndarray) else valor)
+        return copia
+
+    def describir(self):
+        """Texto corto del evento (solo se arma si alguien lo pide)"""
+        if self.tipo == TABLEAU_INICIAL:
+            return "Tableau inicial"
+        if self.tipo == FASE_DOS:
+            return f"Iteración {self.iteracion}: fin de la Fase I, se optimiza el objetivo original"
+        if self.tipo == PIVOTE:
+            return f"Pivote: Fila {self.fila+1}, Columna {self.columna+1}"
+        if self.tipo == ITERACION:
+            if self.fila is None:
+                return f"Iteración {self.iteracion}: x{self.columna+1} pasa a su otra cota"
+            return f"Iteración {self.iteracion}: entra la columna {self.columna+1} en la fila {self.fila+1}"
+        if self.tipo == OPTIMO:
+            return f"Solución óptima encontrada en {self.iteracion} iteraciones (valor {float(self.valor):.6g})"
+        if self.tipo == NO_ACOTADO:
+            return "El problema no está acotado"
+        if self.tipo == INFACTIBLE:
+            return "El problema no tiene solución factible"
+        if self.tipo == CANCELADO:
+            return f"Resolución cancelada tras {self.iteracion} iteraciones"
+        return f"Se alcanzó el límite de {self.iteracion} iteraciones"
+
+    def __repr__(self):
+        return f"EventoSimplex({self.tipo!r}, iteracion={self.iteracion})"
@@ -0,0 +1,105 @@
+from fractions import Fraction
+
+import numpy as np
+
+MAX_DENOMINADOR = 1_000_000     # El mismo límite por defecto que Fraction.limit_denominator
+
+
+def racionalizar(valores, max_denominador=MAX_DENOMINADOR, max_pasos=40):
+    """
+    Fracción más cercana con denominador acotado para todo un arreglo a la vez
+
+    Desarrolla en fracción continua todos los valores en paralelo y se detiene,
+    valor por valor, en cuanto el convergente p/q cumple |x - p/q| < 1/(2·q·max_den):
+    entonces ninguna otra fracción con denominador <= max_den está más cerca, así
+    que p/q es exactamente lo que daría Fraction(x).limit_denominator(max_den).
+    Los valores que no llegan a esa garantía (ruido numérico, no finitos) quedan
+    marcados para resolverlos uno a uno con Fraction.
+
+    Returns:
+        tuple: (numeradores, denominadores, garantizados) con la forma de `valores`
+    """
+    x = np.asarray(valores, dtype=float)
+    plano = x.ravel()
+    p0, q0 = np.zeros_like(plano), np.ones_like(plano)
+    p1, q1 = np.ones_like(plano), np.zeros_like(plano)
+    resto = np.where(np.isfinite(plano), plano, 0.0)
+    activos = np.isfinite(plano) & (np.abs(plano) < 2.0**52)
+    garantizados = np.zeros(plano.shape, dtype=bool)
+    margen = 4.0 * np.finfo(float).eps * np.abs(resto)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_pasos):
+            a = np.floor(resto)
+            p2 = a * p1 + p0
+            q2 = a * q1 + q0
+            avanza = activos & (q2 <= max_denominador)
+            p0, q0 = np.where(avanza, p1, p0), np.where(avanza, q1, q0)
+            p1, q1 = np.where(avanza, p2, p1), np.where(avanza, q2, q1)
+
+            # El margen cubre el redondeo de p/q y de la resta (unos pocos ulp de x)
+            error = np.abs(plano - p1 / q1) + margen
+            garantizados |= avanza & (error * q1 * (2.0 * max_denominador) < 1.0)
+            fraccion = resto - a
+            activos = avanza & ~garantizados & (fraccion > 0.0)
+            if not activos.any():
+                break
+            resto = np.where(activos, 1.0 / fraccion, resto)
+
+    forma = x.shape
+    return (p1.astype(np.int64).reshape(forma), np.maximum(q1, 1).astype(np.int64).reshape(forma),
+            garantizados.reshape(forma))
+
+
+class FormatoFracciones:
+    """
+    Convierte tableaux completos a texto "p/q" con una sola pasada vectorizada
+
+    Los valores repetidos de un tableau se formatean una sola vez (np.unique) y
+    los textos ya calculados se guardan entre iteraciones, así en una resolución
+    solo se racionalizan los valores nuevos.
+    """
+
+    def __init__(self, max_denominador=MAX_DENOMINADOR, max_cache=100_000):
+        self.max_denominador = max_denominador
+        self.max_cache = max_cache
+        self._cache = {}                # valor float -> texto
+
+    def formatear(self, valores):
+        """
+        Args:
+            valores: Arreglo de floats de cualquier forma
+
+        Returns:
+            np.ndarray: Arreglo de objetos (str) con la misma forma
+        """
+        valores = np.asarray(valores, dtype=float)
+        unicos, inversa = np.unique(valores, return_inverse=True)
+        textos = np.empty(len(unicos), dtype=object)
+
+        pendientes = []
+        for k, valor in enumerate(unicos.tolist()):
+            texto = self._cache.get(valor)
+            if texto is None:
+                pendientes.append(k)
+            else:
+                textos[k] = texto
+
+        if pendientes:
+            if len(self._cache) + len(pendientes) > self.max_cache:
+                self._cache.clear()
+            nuevos = unicos[pendientes]
+            numeradores, denominadores, garantizados = racionalizar(nuevos, self.max_denominador)
+            for k, valor, p, q, exacto in zip(pendientes, nuevos.tolist(), numeradores.tolist(),
+                                              denominadores.tolist(), garantizados.tolist()):
+                if not exacto:
+                    if not np.isfinite(valor):
+                        texto = str(valor)
+                        textos[k] = self._cache[valor] = texto
+                        continue
+                    fraccion = Fraction(valor).limit_denominator(self.max_denominador)
+                    p, q = fraccion.numerator, fraccion.denominator
+                texto = str(p) if q == 1 else f"{p}/{q}"
+                textos[k] = self._cache[valor] = texto
+
+        return textos[inversa.reshape(valores.shape)]
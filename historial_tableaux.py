@@ -0,0 +1,238 @@
+import os
+import weakref
+
+import numpy as np
+
+
+class HistorialTableaux:
+    """
+    Historial de tableaux codificado por diferencias
+
+    En lugar de una copia completa del tableau por iteración se guarda el tableau
+    inicial y, por cada pivoteo, solo la fila pivote normalizada y la columna
+    pivote (más los cambios de cota). Cada `cada` entradas se toma una foto
+    completa para que el acceso aleatorio no tenga que repetir más de `cada`
+    pivoteos; cuando las fotos en memoria superan `limite_memoria` bytes las
+    siguientes se escriben en un archivo temporal que se lee con np.memmap.
+
+    Se usa como una lista de solo lectura (len, índices, iteración); el tableau
+    de cada iteración se reconstruye al pedirlo repitiendo exactamente las mismas
+    operaciones del solver, así se obtienen los mismos valores. Si las fotos se
+    registran con su base, también se puede pedir la base de cada entrada (base()).
+    """
+
+    def __init__(self, cada=20, limite_memoria=256 * 2**20, carpeta=None):
+        """
+        Args:
+            cada: Entradas entre fotos completas (acceso aleatorio en O(cada) pivoteos)
+            limite_memoria: Bytes de fotos en memoria antes de pasar a disco
+            carpeta: Carpeta del archivo temporal (None = la del sistema)
+        """
+        self.cada = max(1, int(cada))
+        self.limite_memoria = limite_memoria
+        self.carpeta = carpeta
+        self._entradas = []             # ("foto", id) o ("cambios", operaciones)
+        self._fotos = []                # ndarray en memoria o (desplazamiento, forma, dtype) en disco
+        self._bytes_en_memoria = 0
+        self._desde_foto = 0            # Entradas desde la última foto
+        self._archivo = None            # Archivo temporal de las fotos en disco
+        self._ruta = None
+        self._cache = None              # (índice, tableau) de la última reconstrucción
+        self._bases = {}                # Índice de entrada de cada foto -> variables básicas
+        self._base = None               # Variables básicas de la última entrada (None = sin registrar)
+
+    # -- Registro ----------------------------------------------------------
+
+    def append(self, tableau, base=None):
+        """
+        Agrega una copia completa del tableau (inicio, cambio de fase, etc.)
+        
+        Args:
+            base: Variable básica de cada fila; None = la misma de la entrada anterior
+        """
+        if base is not None:
+            self._base = np.array(base, dtype=np.intp)
+        if self._base is not None:
+            self._bases[len(self._entradas)] = self._base.copy()
+        self._entradas.append(("foto", self._guardar_foto(tableau)))
+        self._desde_foto = 0
+
+    def registrar_pivote(self, tableau, fila, col, fila_pivote, columna, inversion=None):
+        """
+        Agrega la entrada de un pivoteo
+
+        Args:
+            tableau: Tableau después del pivoteo (solo se copia si toca una foto)
+            fila, col: Posición del pivote
+            fila_pivote: Fila pivote ya normalizada
+            columna: Columna pivote antes de eliminar, con cero en la fila pivote
+            inversion: (columna, cota) si la saliente quedó en su cota superior
+        """
+        operaciones = [("pivote", fila, col, fila_pivote.copy(), columna.copy())]
+        if inversion is not None:
+            operaciones.append(("inversion",) + tuple(inversion))
+        self._registrar(tableau, operaciones)
+
+    def registrar_inversion(self, tableau, col, cota):
+        """Agrega la entrada de un cambio de cota de la no básica `col`"""
+        self._registrar(tableau, [("inversion", col, cota)])
+
+    def _registrar(self, tableau, operaciones):
+        if not self._entradas:
+            raise ValueError("El historial necesita un tableau inicial completo")
+        if self._base is not None:
+            for op in operaciones:
+                if op[0] == "pivote":
+                    self._base[op[1]] = op[2]
+        self._desde_foto += 1
+        if self._desde_foto >= self.cada:
+            self.append(tableau)
+        else:
+            self._entradas.append(("cambios", operaciones))
+
+    def __setitem__(self, indice, tableau):
+        """Solo se admite reemplazar la última entrada (por una copia completa)"""
+        if indice not in (-1, len(self._entradas) - 1):
+            raise IndexError("Solo se puede reemplazar la última entrada del historial")
+        self.reemplazar_ultima(tableau)
+
+    def reemplazar_ultima(self, tableau, base=None):
+        """Reemplaza la última entrada por una copia completa (con su base si cambió)"""
+        tipo, dato = self._entradas.pop()
+        if tipo == "foto" and dato == len(self._fotos) - 1 and isinstance(self._fotos[-1], np.ndarray):
+            self._bytes_en_memoria -= self._fotos.pop().nbytes
+        self._cache = None
+        self.append(tableau, base)
+
+    # -- Fotos -------------------------------------------------------------
+
+    def _guardar_foto(self, tableau):
+        if self._bytes_en_memoria + tableau.nbytes <= self.limite_memoria:
+            self._fotos.append(np.array(tableau, copy=True))
+            self._bytes_en_memoria += tableau.nbytes
+        else:
+            if self._archivo is None:
+                import tempfile
+                descriptor, self._ruta = tempfile.mkstemp(prefix="historial_", suffix=".bin",
+                                                          dir=self.carpeta)
+                self._archivo = os.fdopen(descriptor, "w+b")
+                self._finalizador = weakref.finalize(self, _eliminar_archivo, self._archivo, self._ruta)
+            self._archivo.seek(0, os.SEEK_END)
+            desplazamiento = self._archivo.tell()
+            self._archivo.write(np.ascontiguousarray(tableau).tobytes())
+            self._fotos.append((desplazamiento, tableau.shape, tableau.dtype))
+        return len(self._fotos) - 1
+
+    def _leer_foto(self, id_foto):
+        foto = self._fotos[id_foto]
+        if isinstance(foto, np.ndarray):
+            return foto.copy()
+        desplazamiento, forma, dtype = foto
+        self._archivo.flush()
+        mapa = np.memmap(self._ruta, dtype=dtype, mode="r", offset=desplazamiento, shape=forma)
+        return np.array(mapa)
+
+    @property
+    def fotos_en_disco(self):
+        """Número de fotos guardadas en el archivo temporal"""
+        return sum(not isinstance(foto, np.ndarray) for foto in self._fotos)
+
+    def memoria_en_uso(self):
+        """Bytes en memoria de fotos y diferencias (sin contar las fotos en disco)"""
+        diferencias = sum(op[3].nbytes + op[4].nbytes
+                          for tipo, ops in self._entradas if tipo == "cambios"
+                          for op in ops if op[0] == "pivote")
+        return self._bytes_en_memoria + diferencias
+
+    def cerrar(self):
+        """Libera el archivo temporal (el historial queda vacío)"""
+        if self._archivo is not None:
+            self._finalizador()
+            self._archivo = None
+        self._entradas, self._fotos, self._cache = [], [], None
+        self._bases, self._base = {}, None
+        self._bytes_en_memoria = 0
+        self._desde_foto = 0
+
+    # -- Reconstrucción ----------------------------------------------------
+
+    @staticmethod
+    def _aplicar(tableau, operaciones):
+        """Repite sobre `tableau` (in situ) las operaciones del solver"""
+        for op in operaciones:
+            if op[0] == "pivote":
+                _, fila, col, fila_pivote, columna = op
+                tableau -= columna[:, np.newaxis] * fila_pivote
+                tableau[fila] = fila_pivote
+                tableau[:, col] = 0.0
+                tableau[fila, col] = 1.0
+            else:
+                _, col, cota = op
+                tableau[:, -1] -= cota * tableau[:, col]
+                tableau[:, col] *= -1
+
+    def _reconstruir(self, indice):
+        inicio = indice
+        while self._entradas[inicio][0] != "foto":
+            inicio -= 1
+        if self._cache is not None and inicio <= self._cache[0] <= indice:
+            inicio, tableau = self._cache[0], self._cache[1].copy()
+        else:
+            tableau = self._leer_foto(self._entradas[inicio][1])
+        for i in range(inicio + 1, indice + 1):
+            self._aplicar(tableau, self._entradas[i][1])
+        self._cache = (indice, tableau.copy())
+        return tableau
+
+    def base(self, indice):
+        """
+        Variable básica de cada fila en la entrada `indice` (sin reconstruir el tableau)
+        
+        Returns:
+            np.ndarray: Índices de columna por fila, o None si la foto no tiene base
+        """
+        if indice < 0:
+            indice += len(self._entradas)
+        if not 0 <= indice < len(self._entradas):
+            raise IndexError("Índice de historial fuera de rango")
+        inicio = indice
+        while self._entradas[inicio][0] != "foto":
+            inicio -= 1
+        if inicio not in self._bases:
+            return None
+        base = self._bases[inicio].copy()
+        for i in range(inicio + 1, indice + 1):
+            for op in self._entradas[i][1]:
+                if op[0] == "pivote":
+                    base[op[1]] = op[2]
+        return base
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __bool__(self):
+        return bool(self._entradas)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self._entradas)
+        if not 0 <= indice < len(self._entradas):
+            raise IndexError("Índice de historial fuera de rango")
+        return self._reconstruir(indice)
+
+    def __iter__(self):
+        tableau = None
+        for tipo, dato in self._entradas:
+            if tipo == "foto":
+                tableau = self._leer_foto(dato)
+            else:
+                self._aplicar(tableau, dato)
+            yield tableau.copy()
+
+
+def _eliminar_archivo(archivo, ruta):
+    archivo.close()
+    if os.path.exists(ruta):
+        os.remove(ruta)
@@ -1,20 +1,35 @@
+import queue
+import threading
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
+from eventos_simplex import ITERACION, FASE_DOS
 from vista_simplex import SimplexVista
 from servicio_simplex import SimplexServicio
 
+INTERVALO_SONDEO = 100      # ms entre revisiones del progreso de una resolución en curso
+
 class SimplexControlador:
     def __init__(self):
         self.root = tk.Tk()
         self.vista = SimplexVista(self.root)
         self.servicio = SimplexServicio()
+        self._hilo_resolucion = None      # Hilo de trabajo de la resolución en curso
+        self._mensajes = queue.Queue()    # Progreso y resultado que deja el hilo de trabajo
+        self._cancelando = False          # Se pidió cancelar la resolución en curso
+        self._proceso_pendiente = False   # Hay un proceso nuevo que todavía no se cargó en el visor
+        
+        # El visor arma cada tableau al mostrarlo: no hace falta imprimirlos al resolver.
+        # Sin salida detallada el servicio tampoco redirige stdout desde el hilo de trabajo
+        self.servicio.salida_detallada = False
         
         # Configurar callbacks de la vista
         self.vista.set_callback_configurar_objetivo(self.configurar_objetivo)
         self.vista.set_callback_agregar_restriccion(self.agregar_restriccion)
         self.vista.set_callback_eliminar_restriccion(self.eliminar_restriccion)
         self.vista.set_callback_limpiar_restricciones(self.limpiar_restricciones)
+        self.vista.set_callback_importar_csv(self.importar_csv)
         self.vista.set_callback_resolver(self.resolver_problema)
+        self.vista.set_callback_cancelar(self.cancelar_resolucion)
         self.vista.set_callback_exportar_imagenes(self.exportar_imagenes)
         self.vista.set_callback_update_result_tab(self.actualizar_tab_resultado)
     
@@ -57,10 +72,10 @@ class SimplexControlador:
         except Exception as e:
             messagebox.showerror("Error", f"Error agregando restricción: {str(e)}")
     
-    def eliminar_restriccion(self, fila_frame):
+    def eliminar_restriccion(self, fila):
         """Elimina una restricción específica"""
         try:
-            self.vista.eliminar_restriccion_especifica(fila_frame)
+            self.vista.eliminar_restriccion_especifica(fila)
         except Exception as e:
             messagebox.showerror("Error", f"Error eliminando restricción: {str(e)}")
     
@@ -75,8 +90,36 @@ class SimplexControlador:
         except Exception as e:
             messagebox.showerror("Error", f"Error limpiando restricciones: {str(e)}")
     
+    def importar_csv(self):
+        """Reemplaza las restricciones por las de un archivo CSV elegido por el usuario"""
+        try:
+            if not self.vista.tiene_coeficientes_objetivo():
+                messagebox.showwarning("Advertencia", 
+                    "Primero debe configurar la función objetivo")
+                return
+            
+            ruta = filedialog.askopenfilename(
+                title="Importar restricciones",
+                filetypes=[("CSV", "*.csv"), ("Texto", "*.txt"), ("Todos los archivos", "*.*")])
+            if not ruta:
+                return
+            
+            cantidad = self.vista.cargar_csv_restricciones(ruta)
+            messagebox.showinfo("Éxito", f"Se cargaron {cantidad} restricciones.\n\n"
+                "Cada línea: coeficientes, desigualdad (opcional) y lado derecho; "
+                "las celdas inválidas quedan marcadas en rojo.")
+        except Exception as e:
+            messagebox.showerror("Error", f"Error importando restricciones: {str(e)}")
+    
     def resolver_problema(self):
-        """Resuelve el problema de programación lineal"""
+        """
+        Valida el problema y lo resuelve en un hilo de trabajo
+        
+        La ventana sigue respondiendo: el hilo solo deja mensajes en una cola que
+        se revisa con root.after (tkinter no admite tocar widgets desde otro hilo).
+        """
+        if self.resolviendo():
+            return
         try:
             # Validar que se haya configurado todo
             if not self.vista.tiene_coeficientes_objetivo():
@@ -97,30 +140,104 @@ class SimplexControlador:
             # Configurar preferencias del servicio
             self.servicio.configurar_fracciones(True)  # Usar fracciones por defecto
             
-            # Resolver el problema
-            resumen, proceso_completo, solucion_data, error = self.servicio.resolver_problema(
-                coeficientes_str, tipo_problema, restricciones_data
-            )
-            
+            # Validar y configurar en este hilo (lee los campos de la vista)
+            error = self.servicio.preparar_problema(coeficientes_str, tipo_problema, restricciones_data)
             if error:
                 messagebox.showerror("Error", error)
                 return
             
-            # Mostrar resultados en la vista
-            self.vista.mostrar_resultado_principal(resumen)
-            
-            # Mostrar mensaje de éxito
-            messagebox.showinfo("Éxito", 
-                "Problema resuelto exitosamente.\n\n"
-                "Vea los resultados en el área de resultados y\n"
-                "el proceso detallado en la pestaña 'Proceso de Resolución'.")
+            # Resolver en segundo plano
+            self._mensajes = queue.Queue()
+            self._cancelando = False
+            self._hilo_resolucion = threading.Thread(target=self._resolver_en_segundo_plano,
+                                                     args=(self._mensajes,), daemon=True)
+            self.vista.iniciar_progreso()
+            self._hilo_resolucion.start()
+            self.root.after(INTERVALO_SONDEO, self._revisar_resolucion)
             
         except Exception as e:
             messagebox.showerror("Error", f"Error resolviendo problema: {str(e)}")
     
+    def _resolver_en_segundo_plano(self, mensajes):
+        """Hilo de trabajo: resuelve y deja el progreso y el resultado en la cola"""
+        # Solo se envía el texto de cada evento: los arreglos del solver cambian en el próximo pivote
+        def al_evento(evento):
+            if evento.tipo in (ITERACION, FASE_DOS):
+                mensajes.put(("progreso", evento.describir()))
+        
+        try:
+            resultado = self.servicio.resolver_preparado(al_evento)
+        except Exception as e:
+            resultado = (None, None, None, f"Error resolviendo problema: {str(e)}")
+        mensajes.put(("fin", resultado))
+    
+    def _revisar_resolucion(self):
+        """Vacía la cola de mensajes del hilo de trabajo (corre en el hilo de Tk)"""
+        progreso, resultado = None, None
+        while True:
+            try:
+                tipo, dato = self._mensajes.get_nowait()
+            except queue.Empty:
+                break
+            if tipo == "progreso":
+                progreso = dato
+            else:
+                resultado = dato
+        
+        if resultado is None:
+            if progreso is not None and not self._cancelando:
+                self.vista.mostrar_progreso(progreso)
+            self.root.after(INTERVALO_SONDEO, self._revisar_resolucion)
+            return
+        
+        self._hilo_resolucion = None
+        self.vista.terminar_progreso()
+        self._mostrar_resultado(*resultado)
+    
+    def _mostrar_resultado(self, resumen, proceso_completo, solucion_data, error):
+        """Muestra el resultado de una resolución terminada"""
+        if error:
+            messagebox.showerror("Error", error)
+            return
+        
+        # Mostrar resultados en la vista
+        self.vista.mostrar_resultado_principal(resumen)
+        self._proceso_pendiente = True
+        if self.vista.pestana_actual() == "Proceso de Resolución":
+            self._cargar_proceso()
+        
+        if self.servicio.solver.estado == "cancelado":
+            messagebox.showinfo("Cancelado", 
+                "La resolución se canceló.\n\n"
+                "El resultado muestra la última base alcanzada, que no es óptima.")
+            return
+        
+        # Mostrar mensaje de éxito
+        messagebox.showinfo("Éxito", 
+            "Problema resuelto exitosamente.\n\n"
+            "Vea los resultados en el área de resultados y\n"
+            "el proceso detallado en la pestaña 'Proceso de Resolución'.")
+    
+    def resolviendo(self):
+        """Indica si hay una resolución en curso"""
+        return self._hilo_resolucion is not None
+    
+    def cancelar_resolucion(self):
+        """Pide detener la resolución en curso; el solver para antes del próximo pivote"""
+        if not self.resolviendo():
+            return
+        self._cancelando = True
+        self.servicio.cancelar_resolucion()
+        self.vista.marcar_cancelando()
+    
     def exportar_imagenes(self):
         """Exporta los tableaux como imágenes"""
         try:
+            if self.resolviendo():
+                messagebox.showwarning("Advertencia", 
+                    "Espere a que termine la resolución en curso")
+                return
+            
             if not self.servicio.tiene_solucion():
                 messagebox.showwarning("Advertencia", 
                     "Debe resolver un problema primero antes de exportar")
@@ -144,14 +261,27 @@ class SimplexControlador:
             tab_seleccionada = notebook.select()
             tab_nombre = notebook.tab(tab_seleccionada, "text")
             
-            # Si se selecciona la pestaña de proceso, actualizar el contenido
-            if tab_nombre == "Proceso de Resolución":
-                proceso_completo = self.servicio.obtener_proceso_completo()
-                self.vista.mostrar_proceso_completo(proceso_completo)
+            # Solo se carga el visor cuando hay una resolución nueva; al volver a la
+            # pestaña se conserva la página que se estaba viendo
+            if tab_nombre == "Proceso de Resolución" and self._proceso_pendiente:
+                self._cargar_proceso()
                 
         except Exception as e:
             print(f"Error actualizando pestaña de resultado: {str(e)}")
     
+    def _cargar_proceso(self):
+        """Carga en el visor paginado el proceso de la última resolución"""
+        self._proceso_pendiente = False
+        num_tableaux = self.servicio.numero_tableaux()
+        resumen = self.servicio.obtener_proceso_completo()
+        if num_tableaux:
+            resumen += (f"\n\n📄 {num_tableaux} tableaux guardados: use los botones de "
+                        f"navegación o escriba un número y presione 'Ir'.")
+        # El visor queda ligado a este solucionador aunque después se resuelva otro problema
+        solver = self.servicio.solver
+        self.vista.mostrar_proceso_paginado(resumen, num_tableaux,
+                                            lambda indice: self.servicio.texto_tableau(indice, solver))
+    
     def ejecutar(self):
         """Inicia la aplicación"""
         # Configurar el cierre de la aplicación
@@ -175,6 +305,8 @@ class SimplexControlador:
         respuesta = messagebox.askyesnocancel("Salir", 
             "¿Está seguro de que desea salir de la aplicación?")
         if respuesta:
+            if self.resolviendo():
+                self.servicio.cancelar_resolucion()
             self.root.destroy()
 
 
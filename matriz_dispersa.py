@@ -0,0 +1,201 @@
+import numpy as np
+
+
+class MatrizCSR:
+    """
+    Matriz dispersa en formato CSR (filas comprimidas) implementada solo con NumPy
+
+    Es el formato natural para construir restricciones fila por fila; el
+    solucionador la convierte a MatrizCSC para acceder a las columnas.
+    """
+
+    def __init__(self, datos, indices, indptr, forma):
+        """
+        Args:
+            datos: Valores no nulos, fila por fila
+            indices: Columna de cada valor en datos
+            indptr: Inicio de cada fila dentro de datos (longitud filas + 1)
+            forma: Tupla (filas, columnas)
+        """
+        self.datos = np.asarray(datos, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = (int(forma[0]), int(forma[1]))
+
+    @property
+    def nnz(self):
+        """Número de elementos no nulos almacenados"""
+        return len(self.datos)
+
+    @classmethod
+    def desde_coordenadas(cls, filas, columnas, valores, forma):
+        """Construye la matriz desde tripletas (fila, columna, valor); suma duplicados"""
+        filas, columnas, valores = _ordenar_y_sumar(filas, columnas, valores, forma[1])
+        indptr = np.zeros(forma[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(filas, minlength=forma[0]), out=indptr[1:])
+        return cls(valores, columnas, indptr, forma)
+
+    @classmethod
+    def desde_densa(cls, A):
+        """Construye la matriz a partir de un arreglo denso"""
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        return cls.desde_coordenadas(filas, columnas, A[filas, columnas], A.shape)
+
+    def filas_de_entradas(self):
+        """Fila a la que pertenece cada elemento de datos"""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def a_csc(self):
+        """Convierte la matriz a formato CSC"""
+        return MatrizCSC.desde_coordenadas(self.filas_de_entradas(), self.indices,
+                                           self.datos, self.shape)
+
+    def a_densa(self):
+        """Devuelve la matriz como arreglo denso (solo para depuración o visualización)"""
+        densa = np.zeros(self.shape)
+        densa[self.filas_de_entradas(), self.indices] = self.datos
+        return densa
+
+
+class MatrizCSC:
+    """
+    Matriz dispersa en formato CSC (columnas comprimidas) implementada solo con NumPy
+
+    Es el formato que usa el simplex disperso: extrae columnas en O(nnz de la
+    columna) y calcula Aᵀ·y en O(nnz) para el pricing.
+    """
+
+    def __init__(self, datos, indices, indptr, forma):
+        """
+        Args:
+            datos: Valores no nulos, columna por columna
+            indices: Fila de cada valor en datos
+            indptr: Inicio de cada columna dentro de datos (longitud columnas + 1)
+            forma: Tupla (filas, columnas)
+        """
+        self.datos = np.asarray(datos, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = (int(forma[0]), int(forma[1]))
+        self._columnas = None
+
+    @property
+    def nnz(self):
+        """Número de elementos no nulos almacenados"""
+        return len(self.datos)
+
+    @classmethod
+    def desde_coordenadas(cls, filas, columnas, valores, forma):
+        """Construye la matriz desde tripletas (fila, columna, valor); suma duplicados"""
+        columnas, filas, valores = _ordenar_y_sumar(columnas, filas, valores, forma[0])
+        indptr = np.zeros(forma[1] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(columnas, minlength=forma[1]), out=indptr[1:])
+        return cls(valores, filas, indptr, forma)
+
+    @classmethod
+    def desde_densa(cls, A):
+        """Construye la matriz a partir de un arreglo denso"""
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        return cls.desde_coordenadas(filas, columnas, A[filas, columnas], A.shape)
+
+    def columnas_de_entradas(self):
+        """Columna a la que pertenece cada elemento de datos (se calcula una sola vez)"""
+        if self._columnas is None:
+            self._columnas = np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+        return self._columnas
+
+    def columna_dispersa(self, j):
+        """Devuelve (filas, valores) de los elementos no nulos de la columna j"""
+        inicio, fin = self.indptr[j], self.indptr[j + 1]
+        return self.indices[inicio:fin], self.datos[inicio:fin]
+
+    def columna(self, j):
+        """Devuelve la columna j como vector denso de longitud m"""
+        filas, valores = self.columna_dispersa(j)
+        col = np.zeros(self.shape[0])
+        col[filas] = valores
+        return col
+
+    def producto(self, x):
+        """Calcula A·x"""
+        return np.bincount(self.indices, weights=self.datos * x[self.columnas_de_entradas()],
+                           minlength=self.shape[0])
+
+    def producto_transpuesto(self, y):
+        """Calcula Aᵀ·y recorriendo solo los elementos no nulos"""
+        return np.bincount(self.columnas_de_entradas(), weights=self.datos * y[self.indices],
+                           minlength=self.shape[1])
+
+    def producto_transpuesto_columnas(self, y, columnas):
+        """Calcula a_jᵀ·y solo para las columnas indicadas"""
+        inicios = self.indptr[columnas]
+        largos = self.indptr[columnas + 1] - inicios
+        # Posición en datos de cada elemento de las columnas pedidas, en orden
+        desplazamientos = np.arange(int(largos.sum())) - np.repeat(np.cumsum(largos) - largos, largos)
+        posiciones = np.repeat(inicios, largos) + desplazamientos
+        return np.bincount(np.repeat(np.arange(len(columnas)), largos),
+                           weights=self.datos[posiciones] * y[self.indices[posiciones]],
+                           minlength=len(columnas))
+
+    def negar_filas(self, mascara):
+        """Multiplica por -1 las filas indicadas por la máscara booleana"""
+        self.datos[mascara[self.indices]] *= -1
+
+    def max_abs(self):
+        """Mayor valor absoluto almacenado (0 si la matriz está vacía)"""
+        return float(np.max(np.abs(self.datos))) if self.nnz > 0 else 0.0
+
+    def apilar(self, otra):
+        """Devuelve una nueva matriz con las filas de `otra` debajo de las de esta"""
+        filas = np.concatenate((self.indices, otra.indices + self.shape[0]))
+        columnas = np.concatenate((self.columnas_de_entradas(), otra.columnas_de_entradas()))
+        valores = np.concatenate((self.datos, otra.datos))
+        forma = (self.shape[0] + otra.shape[0], self.shape[1])
+        return MatrizCSC.desde_coordenadas(filas, columnas, valores, forma)
+
+    def a_csr(self):
+        """Convierte la matriz a formato CSR"""
+        return MatrizCSR.desde_coordenadas(self.indices, self.columnas_de_entradas(),
+                                           self.datos, self.shape)
+
+    def a_densa(self):
+        """Devuelve la matriz como arreglo denso (solo para depuración o visualización)"""
+        densa = np.zeros(self.shape)
+        densa[self.indices, self.columnas_de_entradas()] = self.datos
+        return densa
+
+
+def es_dispersa(A):
+    """Indica si A es una de las matrices dispersas de este módulo"""
+    return isinstance(A, (MatrizCSR, MatrizCSC))
+
+
+def a_csc(A):
+    """Convierte cualquier matriz (densa, CSR o CSC) a MatrizCSC"""
+    if isinstance(A, MatrizCSC):
+        return A
+    if isinstance(A, MatrizCSR):
+        return A.a_csc()
+    return MatrizCSC.desde_densa(A)
+
+
+def _ordenar_y_sumar(principal, secundario, valores, tam_secundario):
+    """Ordena tripletas por (principal, secundario), suma duplicados y descarta ceros"""
+    principal = np.asarray(principal, dtype=np.intp)
+    secundario = np.asarray(secundario, dtype=np.intp)
+    valores = np.asarray(valores, dtype=float)
+
+    clave = principal * tam_secundario + secundario
+    orden = np.argsort(clave, kind="stable")
+    clave, valores = clave[orden], valores[orden]
+
+    if len(clave) > 0:
+        inicio = np.concatenate(([True], clave[1:] != clave[:-1]))
+        valores = np.add.reduceat(valores, np.flatnonzero(inicio))
+        clave = clave[inicio]
+
+    no_nulos = valores != 0
+    clave, valores = clave[no_nulos], valores[no_nulos]
+    return clave // max(tam_secundario, 1), clave % max(tam_secundario, 1), valores
@@ -0,0 +1,228 @@
+"""
+Datos de la grilla de restricciones de la interfaz, sin widgets
+
+Guarda el texto de cada celda en un arreglo de NumPy (una fila por restricción,
+una columna por variable y la última para el lado derecho) junto con las
+desigualdades y una máscara de celdas inválidas que se actualiza al editar o
+pegar. La vista solo dibuja las celdas visibles a partir de estos arreglos y el
+servicio los convierte de una vez con como_arreglos().
+"""
+import csv
+import math
+
+import numpy as np
+
+from app import parsear_fraccion
+
+DESIGUALDADES = ("<=", ">=", "=")
+_OPERADORES = {"<=": "<=", "=<": "<=", "<": "<=", "≤": "<=",
+               ">=": ">=", "=>": ">=", ">": ">=", "≥": ">=",
+               "=": "=", "==": "="}
+
+
+def es_numero(texto):
+    """Indica si el texto es un número finito que parsear_fraccion acepta"""
+    try:
+        return math.isfinite(parsear_fraccion(texto))
+    except (ValueError, ZeroDivisionError):
+        return False
+
+
+_es_numero = np.frompyfunc(es_numero, 1, 1)
+
+
+def dividir_linea(linea):
+    """Campos de una línea pegada o de un CSV (tabulador, punto y coma, coma o espacios)"""
+    for separador in ("\t", ";", ","):
+        if separador in linea:
+            campos = [campo.strip() for campo in linea.split(separador)]
+            break
+    else:
+        campos = linea.split()
+    while campos and not campos[-1]:
+        campos.pop()
+    return campos
+
+
+class ModeloRestricciones:
+    """
+    Restricciones ingresadas en la grilla: textos, desigualdades y celdas inválidas
+
+    La columna num_variables de textos es el lado derecho.
+    """
+
+    def __init__(self, num_variables=0):
+        self.num_variables = num_variables
+        self.textos = np.empty((0, num_variables + 1), dtype=object)
+        self.desigualdades = np.empty(0, dtype="<U2")
+        self.invalidas = np.zeros((0, num_variables + 1), dtype=bool)
+
+    @property
+    def num_filas(self):
+        return len(self.textos)
+
+    def redimensionar(self, num_variables):
+        """Cambia el número de variables conservando los coeficientes y el lado derecho"""
+        if num_variables == self.num_variables:
+            return
+        textos = np.full((self.num_filas, num_variables + 1), "0", dtype=object)
+        invalidas = np.zeros(textos.shape, dtype=bool)
+        comunes = min(num_variables, self.num_variables)
+        textos[:, :comunes] = self.textos[:, :comunes]
+        textos[:, -1] = self.textos[:, -1]
+        invalidas[:, :comunes] = self.invalidas[:, :comunes]
+        invalidas[:, -1] = self.invalidas[:, -1]
+        self.num_variables = num_variables
+        self.textos, self.invalidas = textos, invalidas
+
+    def agregar_filas(self, cantidad=1):
+        """
+        Agrega restricciones en cero (<=) al final
+
+        Returns:
+            int: Índice de la primera fila agregada
+        """
+        inicio = self.num_filas
+        self.textos = np.concatenate(
+            (self.textos, np.full((cantidad, self.num_variables + 1), "0", dtype=object)))
+        self.desigualdades = np.concatenate((self.desigualdades, np.full(cantidad, "<=")))
+        self.invalidas = np.concatenate(
+            (self.invalidas, np.zeros((cantidad, self.num_variables + 1), dtype=bool)))
+        return inicio
+
+    def eliminar_fila(self, fila):
+        self.textos = np.delete(self.textos, fila, axis=0)
+        self.desigualdades = np.delete(self.desigualdades, fila)
+        self.invalidas = np.delete(self.invalidas, fila, axis=0)
+
+    def limpiar(self):
+        self.textos = self.textos[:0]
+        self.desigualdades = self.desigualdades[:0]
+        self.invalidas = self.invalidas[:0]
+
+    def establecer_texto(self, fila, columna, texto):
+        """Cambia una celda (columna num_variables = lado derecho) y la valida"""
+        texto = texto.strip()
+        self.textos[fila, columna] = texto
+        self.invalidas[fila, columna] = not es_numero(texto)
+
+    def establecer_desigualdad(self, fila, desigualdad):
+        self.desigualdades[fila] = _OPERADORES[desigualdad]
+
+    def pegar(self, texto, fila=0, columna=0):
+        """
+        Pega un bloque de texto (copiado de una planilla o leído de un CSV)
+
+        Cada línea es una restricción a partir de `fila`; sus campos ocupan las
+        columnas desde `columna`. Un campo con una desigualdad (<=, >=, =, ≤, ≥)
+        fija la de la fila y el siguiente campo pasa al lado derecho, así que
+        "2 3 <= 12" y "2 3 12" cargan lo mismo. Si faltan filas se agregan.
+
+        Returns:
+            int: Cantidad de filas pegadas
+        """
+        lineas = [campos for campos in map(dividir_linea, texto.splitlines()) if campos]
+        if not lineas:
+            return 0
+
+        celdas_fila, celdas_col, valores, desigualdades = [], [], [], {}
+        for k, campos in enumerate(lineas):
+            j = columna
+            for campo in campos:
+                operador = _OPERADORES.get(campo)
+                if operador is not None:
+                    desigualdades[fila + k] = operador
+                    j = self.num_variables
+                    continue
+                if j > self.num_variables:
+                    raise ValueError(f"La línea {k + 1} tiene más valores que columnas "
+                                     f"({self.num_variables} variables y el lado derecho)")
+                celdas_fila.append(fila + k)
+                celdas_col.append(j)
+                valores.append(campo)
+                j += 1
+
+        faltan = fila + len(lineas) - self.num_filas
+        if faltan > 0:
+            self.agregar_filas(faltan)
+        celdas_fila = np.asarray(celdas_fila, dtype=np.intp)
+        celdas_col = np.asarray(celdas_col, dtype=np.intp)
+        textos = np.empty(len(valores), dtype=object)
+        textos[:] = valores
+        self.textos[celdas_fila, celdas_col] = textos
+        self.invalidas[celdas_fila, celdas_col] = ~_es_numero(textos).astype(bool)
+        for i, operador in desigualdades.items():
+            self.desigualdades[i] = operador
+        return len(lineas)
+
+    def cargar_csv(self, ruta):
+        """
+        Reemplaza las restricciones por las de un archivo CSV (mismo formato que
+        pegar); una primera línea sin ningún número se toma como encabezado
+
+        Returns:
+            int: Cantidad de restricciones leídas
+        """
+        with open(ruta, encoding="utf-8-sig", newline="") as archivo:
+            filas = [[campo.strip() for campo in fila] for fila in csv.reader(archivo, _dialecto(ruta))]
+        filas = [fila for fila in filas if any(fila)]
+        if filas and not any(es_numero(campo) for campo in filas[0]):
+            filas = filas[1:]
+        self.limpiar()
+        return self.pegar("\n".join("\t".join(fila) for fila in filas))
+
+    def primera_invalida(self):
+        """(fila, columna) de la primera celda inválida, o None"""
+        posiciones = np.argwhere(self.invalidas)
+        return tuple(posiciones[0]) if len(posiciones) else None
+
+    def como_arreglos(self, exacto=False):
+        """
+        Convierte todas las celdas de una vez
+
+        Args:
+            exacto: Devolver Fraction leídas del texto (modo exacto) en lugar de floats
+
+        Returns:
+            tuple: (A, b, desigualdades) como listas
+
+        Raises:
+            ValueError: Si alguna celda no es un número (indica cuál)
+        """
+        invalida = self.primera_invalida()
+        if invalida is None:
+            try:
+                if exacto:
+                    valores = np.frompyfunc(lambda s: parsear_fraccion(s, True), 1, 1)(self.textos)
+                else:
+                    # float() directo sobre todo el arreglo; las fracciones a/b van celda por celda
+                    try:
+                        valores = self.textos.astype(float)
+                    except ValueError:
+                        valores = np.frompyfunc(parsear_fraccion, 1, 1)(self.textos).astype(float)
+                return (valores[:, :-1].tolist(), valores[:, -1].tolist(),
+                        self.desigualdades.tolist())
+            except (ValueError, ZeroDivisionError):
+                invalida = next((i, j) for (i, j), texto in np.ndenumerate(self.textos)
+                                if not _convertible(texto, exacto))
+        i, j = invalida
+        columna = "lado derecho" if j == self.num_variables else f"x{j + 1}"
+        raise ValueError(f"Restricción {i + 1}, {columna}: '{self.textos[i, j]}' no es un número")
+
+
+def _convertible(texto, exacto):
+    try:
+        parsear_fraccion(texto, exacto)
+        return True
+    except (ValueError, ZeroDivisionError):
+        return False
+
+
+def _dialecto(ruta):
+    """Separador del CSV según sus primeras líneas (coma por defecto)"""
+    with open(ruta, encoding="utf-8-sig", newline="") as archivo:
+        muestra = archivo.read(4096)
+    try:
+        return csv.Sniffer().sniff(muestra, delimiters=",;\t ")
+    except csv.Error:
+        return csv.excel
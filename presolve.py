@@ -0,0 +1,461 @@
+import time
+import numpy as np
+from matriz_dispersa import MatrizCSC, es_dispersa, a_csc
+
+
+class Presolve:
+    """
+    Reducciones previas a la forma estándar y postsolve de la solución
+
+    Trabaja sobre el modelo en forma de maximización (c ya negado si es min) con
+    cotas l <= x <= u. La matriz se guarda como tripletas (fila, columna, valor)
+    que nunca se modifican: las reducciones solo desactivan filas y columnas y
+    ajustan b, c, las desigualdades y las cotas. Cada eliminación que necesita
+    reconstruir una variable se apila para el postsolve.
+    """
+
+    def __init__(self, c, A, b, desigualdades, inferiores=None, superiores=None,
+                 tolerancia=1e-9, max_pasadas=10):
+        """
+        Args:
+            c: Costos en forma de maximización
+            A: Matriz de restricciones (densa, MatrizCSR o MatrizCSC)
+            b: Lado derecho
+            desigualdades: Lista de "<=", ">=" o "="
+            inferiores: Cotas inferiores finitas (None = todas en 0)
+            superiores: Cotas superiores (None = sin cota)
+            tolerancia: Tolerancia para factibilidad y comparaciones
+            max_pasadas: Máximo de rondas de reducciones
+        """
+        self.es_dispersa = es_dispersa(A)
+        if self.es_dispersa:
+            A = a_csc(A)
+            filas, columnas, valores = A.indices, A.columnas_de_entradas(), A.datos
+        else:
+            A = np.asarray(A, dtype=float)
+            filas, columnas = np.nonzero(A)
+            valores = A[filas, columnas]
+        self.num_restricciones, self.num_variables = A.shape
+        m, n = A.shape
+
+        # Tripletas ordenadas por fila; orden_columnas permite recorrerlas por columna
+        orden = np.lexsort((columnas, filas))
+        self._filas = np.asarray(filas, dtype=np.intp)[orden]
+        self._columnas = np.asarray(columnas, dtype=np.intp)[orden]
+        self._valores = np.asarray(valores, dtype=float)[orden]
+        self._inicio_fila = np.zeros(m + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self._filas, minlength=m), out=self._inicio_fila[1:])
+        self._orden_columnas = np.argsort(self._columnas, kind="stable")
+        self._inicio_columna = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self._columnas, minlength=n), out=self._inicio_columna[1:])
+
+        self._c = np.array(c, dtype=float)
+        self._b = np.array(b, dtype=float)
+        self._desigualdades = np.array(desigualdades, dtype=object)
+        self._inferiores = np.zeros(n) if inferiores is None else np.array(inferiores, dtype=float)
+        self._superiores = (np.full(n, np.inf) if superiores is None
+                            else np.array(superiores, dtype=float))
+        self._fila_activa = np.ones(m, dtype=bool)
+        self._columna_activa = np.ones(n, dtype=bool)
+        self._valores_fijos = np.zeros(n)
+        self._pila_postsolve = []
+
+        self.tolerancia = tolerancia
+        self.max_pasadas = max_pasadas
+        self.constante = 0.0          # Término constante acumulado del objetivo
+        self.estado = None            # "infactible", "no_acotado" u "optimo" si presolve decide
+        self.tiempo = 0.0
+        self.pasadas = 0
+        self.conteos = {
+            "filas vacías": 0,
+            "filas duplicadas": 0,
+            "filas singleton": 0,
+            "filas redundantes": 0,
+            "variables fijas": 0,
+            "columnas singleton libres": 0,
+            "columnas dominadas": 0,
+            "cotas ajustadas": 0,
+        }
+
+        # Modelo reducido (se completa en reducir)
+        self.filas = None
+        self.columnas = None
+        self.c = self.A = self.b = self.desigualdades = None
+        self.inferiores = self.superiores = None
+
+    def reducir(self):
+        """
+        Aplica las reducciones hasta que ninguna cambie el modelo y construye el reducido
+
+        Returns:
+            str o None: Estado si el presolve resolvió el problema, None si hay que resolverlo
+        """
+        inicio = time.perf_counter()
+        reducciones = (
+            self._quitar_filas_vacias,
+            self._fijar_variables,
+            self._filas_singleton,
+            self._filas_duplicadas,
+            self._columnas_singleton_libres,
+            self._columnas_dominadas,
+            self._ajustar_cotas,
+        )
+        while self.pasadas < self.max_pasadas and self.estado is None:
+            self.pasadas += 1
+            cambios = 0
+            for reduccion in reducciones:
+                cambios += reduccion()
+                if self.estado is not None:
+                    break
+            if cambios == 0:
+                break
+
+        if self.estado is None:
+            self._construir_reducido()
+        self.tiempo = time.perf_counter() - inicio
+        return self.estado
+
+    # ------------------------------------------------------------------
+    # Utilidades
+    # ------------------------------------------------------------------
+
+    def _entradas_vivas(self):
+        """Máscara de las tripletas con fila y columna activas"""
+        return self._fila_activa[self._filas] & self._columna_activa[self._columnas]
+
+    def _conteo_filas(self, vivas):
+        return np.bincount(self._filas[vivas], minlength=self.num_restricciones)
+
+    def _conteo_columnas(self, vivas):
+        return np.bincount(self._columnas[vivas], minlength=self.num_variables)
+
+    def _fijar(self, mascara, valores):
+        """Elimina las columnas de la máscara fijándolas en los valores dados"""
+        self._valores_fijos[mascara] = valores
+        entradas = mascara[self._columnas] & self._fila_activa[self._filas]
+        self._b -= np.bincount(self._filas[entradas],
+                               weights=self._valores[entradas] * self._valores_fijos[self._columnas[entradas]],
+                               minlength=self.num_restricciones)
+        self.constante += float(self._c[mascara] @ self._valores_fijos[mascara])
+        self._columna_activa[mascara] = False
+
+    def _infactible(self):
+        self.estado = "infactible"
+        return 1
+
+    # ------------------------------------------------------------------
+    # Reducciones (cada una devuelve cuántos cambios hizo)
+    # ------------------------------------------------------------------
+
+    def _quitar_filas_vacias(self):
+        """Filas sin coeficientes activos: se verifican contra su lado derecho y se quitan"""
+        vacias = self._fila_activa & (self._conteo_filas(self._entradas_vivas()) == 0)
+        if not vacias.any():
+            return 0
+        b, d, tol = self._b[vacias], self._desigualdades[vacias], self.tolerancia
+        violadas = (((d == "<=") & (b < -tol)) | ((d == ">=") & (b > tol))
+                    | ((d == "=") & (np.abs(b) > tol)))
+        if violadas.any():
+            return self._infactible()
+        self._fila_activa[vacias] = False
+        self.conteos["filas vacías"] += int(vacias.sum())
+        return int(vacias.sum())
+
+    def _fijar_variables(self):
+        """Variables con l = u: se sustituye su valor en b y en el objetivo"""
+        fijas = self._columna_activa & (self._superiores - self._inferiores <= self.tolerancia)
+        if not fijas.any():
+            return 0
+        self._fijar(fijas, self._inferiores[fijas])
+        self.conteos["variables fijas"] += int(fijas.sum())
+        return int(fijas.sum())
+
+    def _filas_singleton(self):
+        """Filas con una sola variable: se convierten en cotas de esa variable"""
+        vivas = self._entradas_vivas()
+        singleton = self._fila_activa & (self._conteo_filas(vivas) == 1)
+        if not singleton.any():
+            return 0
+        entradas = vivas & singleton[self._filas]
+        i, j, a = self._filas[entradas], self._columnas[entradas], self._valores[entradas]
+        d, cota = self._desigualdades[i], self._b[i] / a
+
+        superior = (d == "=") | ((d == "<=") & (a > 0)) | ((d == ">=") & (a < 0))
+        inferior = (d == "=") | ((d == ">=") & (a > 0)) | ((d == "<=") & (a < 0))
+        np.minimum.at(self._superiores, j[superior], cota[superior])
+        np.maximum.at(self._inferiores, j[inferior], cota[inferior])
+        self._fila_activa[singleton] = False
+        self.conteos["filas singleton"] += int(singleton.sum())
+        if not self._corregir_cotas(j):
+            return self._infactible()
+        return int(singleton.sum())
+
+    def _corregir_cotas(self, columnas):
+        """Detecta cotas cruzadas; las que se cruzan solo por redondeo se igualan"""
+        l, u = self._inferiores[columnas], self._superiores[columnas]
+        if (l > u + self.tolerancia).any():
+            return False
+        cruzadas = columnas[l > u]
+        self._superiores[cruzadas] = self._inferiores[cruzadas]
+        return True
+
+    def _filas_duplicadas(self):
+        """Filas proporcionales: se intersectan sus intervalos y se conserva una sola"""
+        vivas = self._entradas_vivas()
+        candidatas = np.flatnonzero(self._fila_activa & (self._conteo_filas(vivas) >= 2))
+        grupos = {}
+        for i in candidatas:
+            inicio, fin = self._inicio_fila[i], self._inicio_fila[i + 1]
+            mascara = vivas[inicio:fin]
+            columnas, valores = self._columnas[inicio:fin][mascara], self._valores[inicio:fin][mascara]
+            escala = valores[0]
+            clave = columnas.tobytes() + np.round(valores / escala, 12).tobytes()
+            grupos.setdefault(clave, []).append((i, escala))
+
+        eliminadas = 0
+        for filas in grupos.values():
+            if len(filas) < 2:
+                continue
+            # Intervalo de r·x, con r la fila normalizada por su primer coeficiente
+            inferior, superior = -np.inf, np.inf
+            for i, escala in filas:
+                lado = self._b[i] / escala
+                d = self._desigualdades[i]
+                if escala < 0 and d != "=":
+                    d = ">=" if d == "<=" else "<="
+                if d in ("<=", "="):
+                    superior = min(superior, lado)
+                if d in (">=", "="):
+                    inferior = max(inferior, lado)
+            if inferior > superior + self.tolerancia:
+                return self._infactible()
+            if np.isfinite(inferior) and np.isfinite(superior) and superior - inferior > self.tolerancia:
+                # Intervalo con dos lados distintos: no cabe en una sola fila
+                continue
+
+            i, escala = filas[0]
+            if np.isfinite(inferior) and np.isfinite(superior):
+                self._desigualdades[i], lado = "=", inferior
+            elif np.isfinite(superior):
+                self._desigualdades[i], lado = ("<=" if escala > 0 else ">="), superior
+            else:
+                self._desigualdades[i], lado = (">=" if escala > 0 else "<="), inferior
+            self._b[i] = lado * escala
+            for k, _ in filas[1:]:
+                self._fila_activa[k] = False
+            eliminadas += len(filas) - 1
+
+        self.conteos["filas duplicadas"] += eliminadas
+        return eliminadas
+
+    def _columnas_singleton_libres(self):
+        """
+        Columnas con un único coeficiente en una igualdad y sin cota superior
+
+        La variable se despeja de la igualdad, que pasa a ser una desigualdad
+        (x_j >= l_j), y su costo se reparte entre las demás variables de la fila.
+        """
+        vivas = self._entradas_vivas()
+        candidatas = np.flatnonzero(self._columna_activa & (self._conteo_columnas(vivas) == 1)
+                                    & np.isinf(self._superiores))
+        eliminadas = 0
+        for j in candidatas:
+            posiciones = self._orden_columnas[self._inicio_columna[j]:self._inicio_columna[j + 1]]
+            e = posiciones[vivas[posiciones]][0]
+            i, a = self._filas[e], self._valores[e]
+            if not self._fila_activa[i] or self._desigualdades[i] != "=":
+                continue
+            inicio, fin = self._inicio_fila[i], self._inicio_fila[i + 1]
+            otras = self._columna_activa[self._columnas[inicio:fin]] & (self._columnas[inicio:fin] != j)
+            if not otras.any():
+                continue
+            columnas, valores = self._columnas[inicio:fin][otras], self._valores[inicio:fin][otras]
+
+            # x_j = (b_i - Σ a_ik·x_k) / a_ij
+            self._pila_postsolve.append((j, a, self._b[i], columnas, valores))
+            self.constante += self._c[j] * self._b[i] / a
+            self._c[columnas] -= self._c[j] * valores / a
+            self._b[i] -= a * self._inferiores[j]
+            self._desigualdades[i] = "<=" if a > 0 else ">="
+            self._columna_activa[j] = False
+            vivas[e] = False
+            eliminadas += 1
+
+        self.conteos["columnas singleton libres"] += eliminadas
+        return eliminadas
+
+    def _columnas_dominadas(self):
+        """
+        Columnas cuyo movimiento en un sentido nunca ayuda a la factibilidad
+
+        Si subir x_j no relaja ninguna restricción y c_j <= 0, x_j = l_j es óptimo;
+        si bajarla no relaja ninguna y c_j >= 0 con u_j finita, x_j = u_j.
+        """
+        vivas = self._entradas_vivas()
+        j, a = self._columnas[vivas], self._valores[vivas]
+        d = self._desigualdades[self._filas[vivas]]
+        igualdad = d == "="
+        ayuda_subir = igualdad | ((d == "<=") & (a < 0)) | ((d == ">=") & (a > 0))
+        ayuda_bajar = igualdad | ((d == "<=") & (a > 0)) | ((d == ">=") & (a < 0))
+        sin_subir = np.bincount(j[ayuda_subir], minlength=self.num_variables) == 0
+        sin_bajar = np.bincount(j[ayuda_bajar], minlength=self.num_variables) == 0
+
+        abajo = self._columna_activa & sin_subir & (self._c <= 0)
+        arriba = (self._columna_activa & ~abajo & sin_bajar & (self._c >= 0)
+                  & np.isfinite(self._superiores))
+        if abajo.any():
+            self._fijar(abajo, self._inferiores[abajo])
+        if arriba.any():
+            self._fijar(arriba, self._superiores[arriba])
+        eliminadas = int(abajo.sum() + arriba.sum())
+        self.conteos["columnas dominadas"] += eliminadas
+        return eliminadas
+
+    def _ajustar_cotas(self):
+        """
+        Ajuste de cotas por actividad de fila
+
+        Con las cotas de las demás variables de la fila se deduce una cota para cada
+        variable; de paso se detectan filas redundantes (siempre satisfechas) e
+        infactibles (nunca satisfechas).
+        """
+        vivas = self._entradas_vivas()
+        i, j, a = self._filas[vivas], self._columnas[vivas], self._valores[vivas]
+        l, u = self._inferiores[j], self._superiores[j]
+        m, tol = self.num_restricciones, self.tolerancia
+        d = self._desigualdades
+
+        def actividad(aportes):
+            finitos = np.isfinite(aportes)
+            suma = np.bincount(i[finitos], weights=aportes[finitos], minlength=m)
+            infinitos = np.bincount(i[~finitos], minlength=m)
+            return suma, infinitos, finitos
+
+        aporte_min = np.where(a > 0, a * l, a * u)
+        aporte_max = np.where(a > 0, a * u, a * l)
+        suma_min, inf_min, finito_min = actividad(aporte_min)
+        suma_max, inf_max, finito_max = actividad(aporte_max)
+        act_min = np.where(inf_min > 0, -np.inf, suma_min)
+        act_max = np.where(inf_max > 0, np.inf, suma_max)
+
+        menor, mayor, igual = (d == "<="), (d == ">="), (d == "=")
+        if (self._fila_activa & (menor | igual) & (act_min > self._b + tol)).any():
+            return self._infactible()
+        if (self._fila_activa & (mayor | igual) & (act_max < self._b - tol)).any():
+            return self._infactible()
+
+        # Filas que se cumplen para cualquier x dentro de las cotas
+        redundantes = self._fila_activa & (
+            (menor & (act_max <= self._b + tol)) | (mayor & (act_min >= self._b - tol))
+            | (igual & (act_max <= self._b + tol) & (act_min >= self._b - tol)))
+
+        # a_ij·x_j <= b_i - (act_min sin j) en filas <= e igualdades (y simétrico en >=)
+        limite_sup = menor[i] | igual[i]
+        resto_min = inf_min[i] - ~finito_min
+        r_sup = self._b[i] - (suma_min[i] - np.where(finito_min, aporte_min, 0.0))
+        usar_sup = limite_sup & (resto_min == 0)
+        limite_inf = mayor[i] | igual[i]
+        resto_max = inf_max[i] - ~finito_max
+        r_inf = self._b[i] - (suma_max[i] - np.where(finito_max, aporte_max, 0.0))
+        usar_inf = limite_inf & (resto_max == 0)
+
+        nuevas_sup = np.full(self.num_variables, np.inf)
+        nuevas_inf = np.full(self.num_variables, -np.inf)
+        cota = r_sup / a
+        np.minimum.at(nuevas_sup, j[usar_sup & (a > 0)], cota[usar_sup & (a > 0)])
+        np.maximum.at(nuevas_inf, j[usar_sup & (a < 0)], cota[usar_sup & (a < 0)])
+        cota = r_inf / a
+        np.maximum.at(nuevas_inf, j[usar_inf & (a > 0)], cota[usar_inf & (a > 0)])
+        np.minimum.at(nuevas_sup, j[usar_inf & (a < 0)], cota[usar_inf & (a < 0)])
+
+        # Solo cuentan las mejoras significativas: el ajuste repetido converge de
+        # forma geométrica y daría cotas con ruido de redondeo sin ganar nada
+        umbral = 1e-3 * np.maximum(1.0, np.abs(np.where(np.isfinite(self._superiores),
+                                                        self._superiores, 0.0)))
+        mejora_sup = self._columna_activa & (nuevas_sup < self._superiores - umbral)
+        umbral = 1e-3 * np.maximum(1.0, np.abs(self._inferiores))
+        mejora_inf = self._columna_activa & (nuevas_inf > self._inferiores + umbral)
+        self._superiores[mejora_sup] = nuevas_sup[mejora_sup]
+        self._inferiores[mejora_inf] = nuevas_inf[mejora_inf]
+        if not self._corregir_cotas(np.flatnonzero(mejora_sup | mejora_inf)):
+            return self._infactible()
+
+        self._fila_activa[redundantes] = False
+        ajustes = int(mejora_sup.sum() + mejora_inf.sum())
+        self.conteos["cotas ajustadas"] += ajustes
+        self.conteos["filas redundantes"] += int(redundantes.sum())
+        return ajustes + int(redundantes.sum())
+
+    # ------------------------------------------------------------------
+    # Modelo reducido y postsolve
+    # ------------------------------------------------------------------
+
+    def _construir_reducido(self):
+        """Arma c, A, b, desigualdades y cotas del modelo con las filas y columnas activas"""
+        self.filas = np.flatnonzero(self._fila_activa)
+        if len(self.filas) == 0:
+            # Sin restricciones toda columna con c_j <= 0 o u_j finita se fija en una
+            # cota; las que quedan pueden crecer sin límite
+            self._columnas_dominadas()
+            self.estado = "no_acotado" if self._columna_activa.any() else "optimo"
+        self.columnas = np.flatnonzero(self._columna_activa)
+
+        nueva_fila = np.full(self.num_restricciones, -1, dtype=np.intp)
+        nueva_fila[self.filas] = np.arange(len(self.filas))
+        nueva_columna = np.full(self.num_variables, -1, dtype=np.intp)
+        nueva_columna[self.columnas] = np.arange(len(self.columnas))
+        vivas = self._entradas_vivas()
+        filas = nueva_fila[self._filas[vivas]]
+        columnas = nueva_columna[self._columnas[vivas]]
+        forma = (len(self.filas), len(self.columnas))
+
+        if self.es_dispersa:
+            self.A = MatrizCSC.desde_coordenadas(filas, columnas, self._valores[vivas], forma)
+        else:
+            self.A = np.zeros(forma)
+            self.A[filas, columnas] = self._valores[vivas]
+        self.c = self._c[self.columnas]
+        self.b = self._b[self.filas]
+        self.desigualdades = list(self._desigualdades[self.filas])
+        self.inferiores = self._inferiores[self.columnas]
+        self.superiores = self._superiores[self.columnas]
+
+    def postsolve(self, x_reducida=None):
+        """
+        Reconstruye la solución del modelo original
+
+        Args:
+            x_reducida: Solución del modelo reducido (None = en sus cotas inferiores)
+        """
+        x = self._valores_fijos.copy()
+        if self.columnas is not None:
+            if x_reducida is None:
+                x_reducida = self.inferiores
+            x[self.columnas] = x_reducida
+        for j, a, lado, columnas, valores in reversed(self._pila_postsolve):
+            x[j] = (lado - valores @ x[columnas]) / a
+        return x
+
+    def reporte(self):
+        """Resumen de las reducciones: conteos, filas y columnas eliminadas y tiempo"""
+        filas = self.num_restricciones - int(self._fila_activa.sum())
+        columnas = self.num_variables - int(self._columna_activa.sum())
+        return {
+            "filas eliminadas": filas,
+            "columnas eliminadas": columnas,
+            "pasadas": self.pasadas,
+            "tiempo (s)": self.tiempo,
+            **self.conteos,
+        }
+
+    def resumen(self):
+        """Texto del reporte para la salida detallada"""
+        lineas = [f"Presolve: {self.num_restricciones}x{self.num_variables} -> "
+                  f"{int(self._fila_activa.sum())}x{int(self._columna_activa.sum())} "
+                  f"en {self.tiempo*1000:.2f} ms ({self.pasadas} pasadas)"]
+        for concepto, cantidad in self.conteos.items():
+            if cantidad:
+                lineas.append(f"  - {concepto}: {cantidad}")
+        if self.estado is not None:
+            lineas.append(f"  Estado determinado por presolve: {self.estado}")
+        return "\n".join(lineas)
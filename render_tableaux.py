@@ -0,0 +1,180 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+from matplotlib.transforms import TransformedBbox
+
+UMBRAL_PARALELO = 40            # Tableaux a partir de los cuales se reparte entre procesos
+TABLEAUX_POR_PROCESO = 20       # Mínimo de tableaux por proceso (cada uno arma su propia figura)
+TITULO_REFERENCIA = "ÁÉÍÓÚÑ gjpqy"   # Texto de altura máxima para el diseño de la página
+
+
+class RenderizadorTableaux:
+    """
+    Dibuja tableaux reutilizando una sola figura y una sola tabla de matplotlib
+
+    La figura se arma con la primera página de cada forma (filas, columnas y
+    etiquetas de columnas) y se guarda su fondo ya rasterizado (cuadrícula y
+    encabezados). Para las PNG siguientes solo se restaura ese fondo y se dibujan
+    los textos que cambian: celdas, etiquetas de fila y título. Usa Figure y el
+    canvas Agg directamente (sin pyplot), así no depende del backend de la
+    interfaz y puede usarse desde otros procesos.
+    """
+
+    def __init__(self, figsize=(12, 8), tamano_fuente=10):
+        self.figsize = figsize
+        self.tamano_fuente = tamano_fuente
+        self.figura = None
+        self._canvas = None
+        self._clave = None              # (forma, etiquetas de columnas) de la tabla actual
+        self._textos = None             # Textos que cambian entre páginas: [(fila, col, Text)]
+        self._titulo = None
+        self._fondo = None              # Región rasterizada sin los textos variables
+
+    def _armar(self, datos, etiquetas_col, etiquetas_fila, titulo):
+        self.figura = Figure(figsize=self.figsize)
+        self._canvas = FigureCanvasAgg(self.figura)
+        ax = self.figura.add_subplot()
+        ax.set_axis_off()
+        tabla = ax.table(cellText=datos, loc='center', cellLoc='center', colLabels=etiquetas_col)
+        # Etiquetas de fila con el ancho de una columna: con rowLabels el ancho se
+        # ajustaría a sus textos, que cambian entre páginas que comparten el fondo
+        for fila, etiqueta in enumerate(etiquetas_fila, start=1):
+            tabla.add_cell(fila, -1, width=tabla[0, 0].get_width(), height=tabla[0, 0].get_height(),
+                           text=etiqueta, loc='left')
+        tabla.auto_set_font_size(False)
+        tabla.set_fontsize(self.tamano_fuente)
+        tabla.scale(1.2, 1.5)
+        # El margen superior se calcula con un título de referencia: con el real
+        # dependería de sus acentos y descendentes, que cambian entre páginas
+        self._titulo = ax.set_title(TITULO_REFERENCIA)
+        self.figura.tight_layout()
+        self._titulo.set_text(titulo)
+        self._recortar_textos(tabla)
+        self._clave = (len(datos), len(etiquetas_col), tuple(etiquetas_col))
+        self._textos = [(fila, col, celda.get_text()) for (fila, col), celda in tabla.get_celld().items()
+                        if fila > 0]
+        self._fondo = None
+
+    def _recortar_textos(self, tabla):
+        """
+        Recorta el texto de cada celda a su recuadro
+
+        Sin recorte, un texto más ancho que su celda invade las vecinas y el
+        resultado depende del orden de dibujo (en el fondo guardado se ve entero,
+        en un dibujo completo lo tapan las celdas posteriores). La caja se guarda
+        en coordenadas de la figura para que siga valiendo con otro dpi (PDF).
+        """
+        renderer = self._canvas.get_renderer()
+        tabla.get_window_extent(renderer)       # Ubica las celdas con el diseño final
+        a_figura = self.figura.transFigure
+        for celda in tabla.get_celld().values():
+            # Por dentro del borde, que en un dibujo completo se pinta encima del texto
+            borde = renderer.points_to_pixels(celda.get_linewidth())
+            caja = celda.get_window_extent(renderer).padded(-borde).transformed(a_figura.inverted())
+            texto = celda.get_text()
+            texto.set_clip_box(TransformedBbox(caja, a_figura))
+            texto.set_clip_on(True)
+
+    def _capturar_fondo(self):
+        """Rasteriza la figura sin los textos variables (una vez por forma)"""
+        # Transparentes y no ocultos: siguen contando para la posición del título
+        variables = [texto for _, _, texto in self._textos] + [self._titulo]
+        for texto in variables:
+            texto.set_alpha(0.0)
+        self._canvas.draw()
+        self._fondo = self._canvas.copy_from_bbox(self.figura.bbox)
+        for texto in variables:
+            texto.set_alpha(None)
+
+    def dibujar(self, datos, etiquetas_col, etiquetas_fila, titulo):
+        """
+        Deja en la figura el tableau indicado
+
+        Args:
+            datos: Textos de las celdas (filas × columnas, ya formateados)
+            etiquetas_col, etiquetas_fila: Encabezados de columnas y filas
+            titulo: Título de la página
+        """
+        clave = (len(datos), len(etiquetas_col), tuple(etiquetas_col))
+        if clave != self._clave:
+            self._armar(datos, etiquetas_col, etiquetas_fila, titulo)
+            return self.figura
+        for fila, col, texto in self._textos:
+            texto.set_text(etiquetas_fila[fila - 1] if col == -1 else datos[fila - 1][col])
+        self._titulo.set_text(titulo)
+        return self.figura
+
+    def _guardar_png(self, ruta):
+        """Fondo guardado más los textos variables, sin volver a dibujar la tabla"""
+        if self._fondo is None:
+            self._capturar_fondo()
+        self._canvas.restore_region(self._fondo)
+        renderer = self._canvas.get_renderer()
+        for _, _, texto in self._textos:
+            texto.draw(renderer)
+        self._titulo.draw(renderer)
+        imsave(ruta, np.asarray(self._canvas.buffer_rgba()), dpi=self.figura.dpi)
+
+    def guardar(self, paginas, rutas):
+        """Dibuja y guarda cada página como PNG"""
+        for (datos, etiquetas_col, etiquetas_fila, titulo), ruta in zip(paginas, rutas):
+            self.dibujar(datos, etiquetas_col, etiquetas_fila, titulo)
+            self._guardar_png(ruta)
+        return list(rutas)
+
+    def guardar_pdf(self, paginas, ruta):
+        """Guarda todas las páginas en un único PDF de varias páginas"""
+        from matplotlib.backends.backend_pdf import PdfPages
+        with PdfPages(ruta) as pdf:
+            for datos, etiquetas_col, etiquetas_fila, titulo in paginas:
+                pdf.savefig(self.dibujar(datos, etiquetas_col, etiquetas_fila, titulo))
+        return [ruta]
+
+
+def _renderizar_bloque(paginas, rutas):
+    """Trabajo de un proceso: un bloque contiguo de páginas con una sola figura"""
+    return RenderizadorTableaux().guardar(paginas, rutas)
+
+
+def exportar_paginas(paginas, carpeta, formato="png", procesos=None, prefijo="tableau",
+                     archivo_pdf="tableaux.pdf"):
+    """
+    Escribe las páginas directamente en `carpeta`
+
+    Args:
+        paginas: Lista de (datos, etiquetas_col, etiquetas_fila, titulo)
+        carpeta: Carpeta de destino (se crea si no existe)
+        formato: "png" (un archivo por tableau, {prefijo}_i.png) o "pdf" (un solo
+                 archivo_pdf con una página por tableau)
+        procesos: Procesos para PNG (None = automático según la cantidad; 1 = sin pool)
+
+    Returns:
+        list: Rutas de los archivos escritos
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    if formato == "pdf":
+        return RenderizadorTableaux().guardar_pdf(paginas, os.path.join(carpeta, archivo_pdf))
+    if formato != "png":
+        raise ValueError(f"Formato de exportación no soportado: {formato}")
+
+    rutas = [os.path.join(carpeta, f"{prefijo}_{i}.png") for i in range(len(paginas))]
+    if procesos is None:
+        procesos = 1 if len(paginas) < UMBRAL_PARALELO else min(
+            os.cpu_count() or 1, len(paginas) // TABLEAUX_POR_PROCESO)
+    if procesos <= 1:
+        return RenderizadorTableaux().guardar(paginas, rutas)
+
+    # Bloques contiguos, uno por proceso; "spawn" evita heredar el estado de Tk o de pyplot
+    tamano = -(-len(paginas) // procesos)
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as ejecutor:
+        futuros = [ejecutor.submit(_renderizar_bloque, paginas[k:k + tamano], rutas[k:k + tamano])
+                   for k in range(0, len(paginas), tamano)]
+        for futuro in futuros:
+            futuro.result()
+    return rutas
@@ -0,0 +1,195 @@
+"""
+Resolución en paralelo de muchos problemas guardados en archivos
+
+Cada problema es un archivo JSON con las claves "objetivo", "A", "b" y
+"desigualdades" y, opcionalmente, "tipo" ("max" o "min", por defecto "max"),
+"inferiores" y "superiores"; también se aceptan modelos .mps y .lp (ver
+archivos_modelo). El origen puede ser un directorio (se toman sus archivos
+.json, .mps y .lp en orden alfabético) o un manifiesto de texto con una ruta por
+línea, relativa al manifiesto; las líneas vacías y las que empiezan con # se
+ignoran.
+
+Uso:
+    python resolucion_paralela.py ORIGEN [--procesos N] [--salida resultados.jsonl]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from app import SolucionadorPL
+from archivos_modelo import es_archivo_modelo, leer_modelo
+
+
+def listar_problemas(origen):
+    """Rutas de los problemas de un directorio o de un manifiesto"""
+    if os.path.isdir(origen):
+        return [os.path.join(origen, nombre) for nombre in sorted(os.listdir(origen))
+                if nombre.endswith(".json") or es_archivo_modelo(nombre)]
+    carpeta = os.path.dirname(os.path.abspath(origen))
+    with open(origen, encoding="utf-8") as manifiesto:
+        lineas = (linea.strip() for linea in manifiesto)
+        return [os.path.join(carpeta, linea) for linea in lineas
+                if linea and not linea.startswith("#")]
+
+
+def cargar_problema(ruta):
+    """Lee un problema en formato JSON"""
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def cargar_datos(solver, datos):
+    """Carga en el solver un problema JSON ya leído (un diccionario)"""
+    solver.establecer_objetivo(datos["objetivo"], datos.get("tipo", "max"))
+    solver.agregar_restricciones(datos["A"], datos["b"], list(datos["desigualdades"]))
+    if "inferiores" in datos or "superiores" in datos:
+        solver.establecer_cotas(datos.get("inferiores"), datos.get("superiores"))
+
+
+def cargar_en_solver(solver, ruta):
+    """
+    Carga en el solver el problema de un archivo .json, .mps o .lp
+
+    Returns:
+        ModeloPL: El modelo leído de un .mps o .lp (nombres, constante del
+        objetivo), o None si el archivo era JSON
+    """
+    if es_archivo_modelo(ruta):
+        modelo = leer_modelo(ruta)
+        modelo.cargar_en(solver)
+        return modelo
+    cargar_datos(solver, cargar_problema(ruta))
+    return None
+
+
+def resolver_con(cargar, opciones=None):
+    """
+    Resuelve con un SolucionadorPL silencioso el problema que carga `cargar`
+
+    Args:
+        cargar: Función que recibe el solver y le carga el problema; si devuelve un
+                ModeloPL, el valor incluye su constante y la solución se informa en
+                las variables del modelo
+        opciones: Atributos del solucionador a fijar antes de cargar (motor, metodo,
+                  max_iteraciones, usar_presolve...)
+
+    Returns:
+        dict: estado, valor, iteraciones, tiempo (s), solucion y error
+    """
+    resultado = {"estado": "error", "valor": None, "iteraciones": 0,
+                 "tiempo": 0.0, "solucion": None, "error": None}
+    inicio = time.perf_counter()
+    try:
+        solver = SolucionadorPL(pricing=(opciones or {}).get("pricing"))
+        solver.verbose = False
+        for atributo, valor in (opciones or {}).items():
+            if atributo != "pricing":
+                setattr(solver, atributo, valor)
+        modelo = cargar(solver)
+        solucion, valor = solver.resolver()
+
+        estado = solver.estado
+        if estado == "optimo" and solver.tiene_artificiales_en_solucion():
+            estado = "infactible"
+        resultado["estado"] = estado
+        resultado["iteraciones"] = solver.iteraciones
+        if estado == "optimo":
+            if modelo is not None:
+                valor = modelo.valor_original(valor)
+                solucion = modelo.solucion_original(solucion)
+            resultado["valor"] = float(valor)
+            resultado["solucion"] = np.asarray(solucion, dtype=float).tolist()
+    except Exception as e:
+        resultado["error"] = f"{type(e).__name__}: {e}"
+    resultado["tiempo"] = time.perf_counter() - inicio
+    return resultado
+
+
+def resolver_archivo(ruta, opciones=None):
+    """
+    Resuelve un archivo (se ejecuta en el proceso hijo)
+
+    Args:
+        ruta: Archivo del problema
+        opciones: Atributos del solucionador (ver resolver_con)
+
+    Returns:
+        dict: archivo, estado, valor, iteraciones, tiempo (s), solucion y error
+    """
+    return {"archivo": ruta, **resolver_con(lambda solver: cargar_en_solver(solver, ruta), opciones)}
+
+
+def resolver_en_paralelo(origen, procesos=None, opciones=None, pendientes_por_proceso=4):
+    """
+    Resuelve todos los problemas de `origen` con un ProcessPoolExecutor
+
+    Los resultados se entregan a medida que terminan (no en el orden de entrada).
+    Solo se mantienen `pendientes_por_proceso` tareas por proceso en vuelo, así
+    un origen con decenas de miles de archivos no llena la memoria de futuros.
+
+    Args:
+        origen: Directorio o manifiesto (ver listar_problemas), o lista de rutas
+        procesos: Número de procesos (None = número de CPU)
+        opciones: Atributos del SolucionadorPL (ver resolver_archivo)
+
+    Yields:
+        dict: Resultado de resolver_archivo de cada problema
+    """
+    rutas = origen if isinstance(origen, (list, tuple)) else listar_problemas(origen)
+    procesos = procesos or os.cpu_count() or 1
+    siguientes = iter(rutas)
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        en_vuelo = set()
+        for ruta in siguientes:
+            en_vuelo.add(ejecutor.submit(resolver_archivo, ruta, opciones))
+            if len(en_vuelo) >= procesos * pendientes_por_proceso:
+                break
+        while en_vuelo:
+            terminados, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                siguiente = next(siguientes, None)
+                if siguiente is not None:
+                    en_vuelo.add(ejecutor.submit(resolver_archivo, siguiente, opciones))
+                yield futuro.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolución en paralelo de problemas de PL")
+    parser.add_argument("origen", help="Directorio con archivos .json, .mps o .lp o manifiesto de rutas")
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--salida", default=None, help="Archivo JSON Lines de resultados")
+    parser.add_argument("--motor", default=None, choices=["tableau", "dual", "revisado"])
+    parser.add_argument("--metodo", default=None, choices=["big_m", "dos_fases"])
+    parser.add_argument("--max-iteraciones", type=int, default=None)
+    parser.add_argument("--presolve", action="store_true")
+    args = parser.parse_args()
+
+    opciones = {"motor": args.motor, "metodo": args.metodo,
+                "max_iteraciones": args.max_iteraciones,
+                "usar_presolve": args.presolve or None}
+    opciones = {clave: valor for clave, valor in opciones.items() if valor is not None}
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    conteo = {}
+    inicio = time.perf_counter()
+    try:
+        for resultado in resolver_en_paralelo(args.origen, args.procesos, opciones):
+            conteo[resultado["estado"]] = conteo.get(resultado["estado"], 0) + 1
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            salida.flush()
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    resumen = ", ".join(f"{estado}: {cantidad}" for estado, cantidad in sorted(conteo.items()))
+    print(f"{sum(conteo.values())} problemas en {time.perf_counter() - inicio:.1f} s ({resumen})",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import numpy as np
+from fractions import Fraction
+
+from base_simplex import columnas_independientes
+
+
+class AnalisisSensibilidad:
+    """
+    Análisis post-óptimo de una base óptima, en el sentido del problema original
+
+    Los precios sombra son ∂z/∂b_i y los costos reducidos c_j - yᵀa_j. Los rangos
+    dicen hasta dónde puede moverse cada b_i o c_j (uno a la vez) sin que la base
+    óptima cambie.
+    """
+
+    def __init__(self, precios_sombra, costos_reducidos, lado_derecho, rango_lado_derecho,
+                 costos, rango_costos):
+        self.precios_sombra = precios_sombra          # m
+        self.costos_reducidos = costos_reducidos      # n
+        self.lado_derecho = lado_derecho              # m: b del modelo
+        self.rango_lado_derecho = rango_lado_derecho  # m×2: [mínimo, máximo] de cada b_i
+        self.costos = costos                          # n: c del modelo
+        self.rango_costos = rango_costos              # n×2: [mínimo, máximo] de cada c_j
+
+    def a_dict(self):
+        """Representación serializable (listas; los infinitos quedan como float)"""
+        return {
+            "precios_sombra": self.precios_sombra.tolist(),
+            "costos_reducidos": self.costos_reducidos.tolist(),
+            "rango_lado_derecho": self.rango_lado_derecho.tolist(),
+            "rango_costos": self.rango_costos.tolist(),
+        }
+
+    def resumen(self, usar_fracciones=False):
+        """Líneas de texto para el reporte de la solución"""
+        def numero(valor):
+            if np.isinf(valor):
+                return "∞" if valor > 0 else "-∞"
+            if usar_fracciones:
+                return str(Fraction(float(valor)).limit_denominator())
+            return f"{valor:.6g}"
+
+        lineas = ["   Restricciones (precio sombra; rango del lado derecho):"]
+        for i, (precio, (minimo, maximo)) in enumerate(zip(self.precios_sombra, self.rango_lado_derecho)):
+            lineas.append(f"       R{i+1}: y = {numero(precio)}; "
+                          f"b ∈ [{numero(minimo)}, {numero(maximo)}]")
+        lineas.append("   Variables (costo reducido; rango del coeficiente objetivo):")
+        for j, (reducido, (minimo, maximo)) in enumerate(zip(self.costos_reducidos, self.rango_costos)):
+            lineas.append(f"       x{j+1}: d = {numero(reducido)}; "
+                          f"c ∈ [{numero(minimo)}, {numero(maximo)}]")
+        return lineas
+
+
+def calcular_sensibilidad(ftran, btran, producto_filas, costos, basicas, valores, cotas, excluidas,
+                          signos, filas, factores_filas, factores_columnas, b_modelo,
+                          c_modelo, minimizar=False, tolerancia=1e-9):
+    """
+    Calcula el análisis de sensibilidad a partir de la base óptima final
+
+    Todo se expresa en la representación del tableau final (columnas invertidas
+    x' = u - x incluidas) y se traduce al modelo cargado: filas negadas o partidas,
+    escalamiento de filas y columnas y sentido del objetivo.
+
+    Args:
+        ftran: Función V -> B⁻¹·V (V m×k) con la base final ya factorizada o invertida
+        btran: Función W -> W·B⁻¹ (W k×m), ídem
+        producto_filas: Función W -> W·A' (A' = forma estándar con columnas invertidas)
+        costos: Costos de la forma estándar en la representación final (forma max)
+        basicas: Columna básica de cada fila
+        valores: Valor de cada básica
+        cotas: Cota superior de cada columna (las artificiales se tratan como fijas en 0)
+        excluidas: Columnas que no pueden entrar (artificiales)
+        signos: -1 en las columnas invertidas, 1 en las demás
+        filas: Fila del modelo cargado de cada fila del tableau
+        factores_filas: Factor de cada fila del tableau respecto de su fila del modelo
+        factores_columnas: Escala de cada variable original (x = factor·x̃)
+        b_modelo, c_modelo: Lado derecho y costos (forma max) del modelo cargado
+        minimizar: El problema original es de minimización
+
+    Returns:
+        AnalisisSensibilidad
+    """
+    m = len(basicas)
+    n = len(c_modelo)
+    num_filas = len(b_modelo)
+
+    # Fila z (convención del tableau: d' >= 0 en el óptimo) y filas del tableau de
+    # las variables originales básicas, todo con un único producto por A'
+    filas_basicas = np.flatnonzero(basicas < n)
+    W = np.zeros((1 + len(filas_basicas), m))
+    W[0] = costos[basicas]
+    W[np.arange(1, len(filas_basicas) + 1), filas_basicas] = 1.0
+    W = btran(W) if m > 0 else W
+    y = W[0]
+    productos = producto_filas(W)
+    d = productos[0] - costos
+    d[basicas] = 0.0
+    d = np.maximum(d, 0.0)
+    d[excluidas] = np.inf
+
+    # Precios sombra: la fila k del tableau es factores_filas[k] veces su fila del modelo
+    sentido = -1.0 if minimizar else 1.0
+    precios_sombra = sentido * np.bincount(filas, weights=y * factores_filas, minlength=num_filas)
+
+    # Costos reducidos de las variables originales (invariantes a la inversión)
+    reducidos = signos[:n] * np.where(np.isfinite(d[:n]), d[:n], 0.0) / factores_columnas
+    costos_reducidos = -sentido * reducidos
+
+    # Rangos del lado derecho: x'_B(δ) = x'_B + δ·g con g = B⁻¹·(columna de la fila)
+    unitaria = np.zeros((m, num_filas))
+    unitaria[np.arange(m), filas] = factores_filas
+    G = ftran(unitaria) if m > 0 else unitaria
+    holgura_inferior = np.maximum(valores, 0.0)[:, np.newaxis]
+    holgura_superior = np.maximum(cotas[basicas] - valores, 0.0)[:, np.newaxis]
+    sube = G > tolerancia
+    baja = G < -tolerancia
+    with np.errstate(divide="ignore", invalid="ignore"):
+        aumento = np.where(sube, holgura_superior / G, np.where(baja, holgura_inferior / -G, np.inf))
+        disminucion = np.where(sube, holgura_inferior / G, np.where(baja, holgura_superior / -G, np.inf))
+    rango_lado_derecho = np.column_stack((b_modelo - disminucion.min(axis=0, initial=np.inf),
+                                          b_modelo + aumento.min(axis=0, initial=np.inf)))
+
+    # Rangos de costos (en la escala de x̃ y forma max; se traducen al final)
+    delta_min = np.full(n, -np.inf)
+    delta_max = np.full(n, np.inf)
+    no_basicas = np.ones(n, dtype=bool)
+    no_basicas[basicas[basicas < n]] = False
+    # No básica: solo cambia su propio d'_j = d_j - s_j·Δ
+    en_cota_inferior = no_basicas & (signos[:n] > 0)
+    en_cota_superior = no_basicas & (signos[:n] < 0)
+    delta_max[en_cota_inferior] = d[:n][en_cota_inferior]
+    delta_min[en_cota_superior] = -d[:n][en_cota_superior]
+    # Básica en la fila k: d'_l cambia en s_j·Δ·T[k, l] para cada no básica l
+    if len(filas_basicas) > 0:
+        T = productos[1:]
+        T[:, basicas] = 0.0
+        t = signos[basicas[filas_basicas]][:, np.newaxis] * T
+        candidatas = np.isfinite(d)[np.newaxis, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inferior = np.where((t > tolerancia) & candidatas, -d / t, -np.inf)
+            superior = np.where((t < -tolerancia) & candidatas, d / -t, np.inf)
+        columnas = basicas[filas_basicas]
+        delta_min[columnas] = inferior.max(axis=1)
+        delta_max[columnas] = superior.min(axis=1)
+    delta_min /= factores_columnas
+    delta_max /= factores_columnas
+
+    if minimizar:
+        costos_originales = -c_modelo
+        rango_costos = np.column_stack((costos_originales - delta_max, costos_originales - delta_min))
+    else:
+        costos_originales = c_modelo.copy()
+        rango_costos = np.column_stack((costos_originales + delta_min, costos_originales + delta_max))
+
+    return AnalisisSensibilidad(precios_sombra, costos_reducidos, np.asarray(b_modelo, dtype=float),
+                                rango_lado_derecho, costos_originales, rango_costos)
+
+
+def inversa_desde_tableau(A, T, basicas, signos):
+    """
+    Lee B⁻¹ del tableau final T = B⁻¹·A' (A' = A con las columnas invertidas) sin
+    volver a factorizar la base
+
+    Una columna j de A con un único coeficiente a_ij (holgura, exceso o artificial)
+    tiene en el tableau B⁻¹·e_i·a_ij·s_j. Las filas sin una columna así (igualdades
+    cuyas artificiales se eliminaron tras la Fase I) se completan con B⁻¹·B = I en
+    columnas independientes de esas filas, en O(m²·faltantes).
+
+    Args:
+        A: Forma estándar densa m×N del tableau (con holguras y demás columnas lógicas)
+        T: Filas de restricciones del tableau final, sin la columna del lado derecho
+        basicas: Columna básica de cada fila
+        signos: -1 en las columnas invertidas, 1 en las demás
+
+    Returns:
+        np.ndarray: B⁻¹ (m×m) con B = A'[:, basicas]
+    """
+    m = len(basicas)
+    no_nulos = A != 0
+    unitarias = np.flatnonzero(np.count_nonzero(no_nulos, axis=0) == 1)
+    filas = np.argmax(no_nulos[:, unitarias], axis=0)
+    coeficientes = A[filas, unitarias] * signos[unitarias]
+    # Con varias columnas en la misma fila gana la última: la de mayor |a_ij|
+    orden = np.argsort(np.abs(coeficientes), kind="stable")
+    unitarias, filas, coeficientes = unitarias[orden], filas[orden], coeficientes[orden]
+    inversa = np.zeros((m, m))
+    inversa[:, filas] = T[:, unitarias] / coeficientes
+
+    conocidas = np.zeros(m, dtype=bool)
+    conocidas[filas] = True
+    faltantes = np.flatnonzero(~conocidas)
+    if len(faltantes) > 0:
+        # B⁻¹[:, F]·B[F, J] = I[:, J] - B⁻¹[:, C]·B[C, J] con J columnas independientes de B[F, :]
+        B = A[:, basicas] * signos[basicas]
+        J = np.flatnonzero(columnas_independientes(B[faltantes]) >= 0)
+        resto = np.eye(m)[:, J] - inversa[:, conocidas] @ B[np.ix_(conocidas, J)]
+        inversa[:, faltantes] = np.linalg.solve(B[np.ix_(faltantes, J)].T, resto.T).T
+    return inversa
@@ -1,9 +1,7 @@
-import os
 import io
 import sys
 from contextlib import redirect_stdout
 from fractions import Fraction
-from tkinter import messagebox, filedialog
 from app import SolucionadorPL, parsear_fraccion
 
 EXPORT_PATH = "/mnt/data/exportaciones_simplex"
@@ -13,6 +11,14 @@ class SimplexServicio:
         self.solver = SolucionadorPL()
         self.usar_fracciones = True
         self.proceso_completo = ""
+        self.motor = "tableau"
+        self.metodo = "big_m"
+        self.pricing = "dantzig"
+        self.presolve = False
+        self.arranque_en_caliente = False   # Reoptimizar desde la base de la resolución anterior
+        self.ultima_base = None             # Base óptima de la última resolución
+        self.exacto = False                 # Aritmética racional exacta (SimplexExacto)
+        self.salida_detallada = True        # Incluir cada tableau en proceso_completo (ver texto_tableau)
     
     def validar_numero_variables(self, num_vars_str):
         """Valida el número de variables introducido"""
@@ -27,95 +33,183 @@ class SimplexServicio:
     def validar_coeficientes_objetivo(self, coeficientes_str):
         """Valida y convierte los coeficientes de la función objetivo"""
         try:
-            coeficientes = [parsear_fraccion(coef) for coef in coeficientes_str]
+            coeficientes = [parsear_fraccion(coef, self.exacto) for coef in coeficientes_str]
             return coeficientes, None
         except ValueError:
             return None, "Coeficientes de función objetivo inválidos"
     
     def validar_restricciones(self, restricciones_data):
-        """Valida y convierte los datos de las restricciones"""
+        """
+        Valida y convierte los datos de las restricciones
+        
+        Args:
+            restricciones_data: ModeloRestricciones de la grilla (se convierte
+                                completo de una vez, sin leer widgets)
+        """
         try:
-            A, b, d = [], [], []
-            for entradas, desig_var, rhs_entry, _ in restricciones_data:
-                fila = [parsear_fraccion(e.get()) for e in entradas]
-                lado_derecho = parsear_fraccion(rhs_entry.get())
-                A.append(fila)
-                b.append(lado_derecho)
-                d.append(desig_var.get())
+            A, b, d = restricciones_data.como_arreglos(self.exacto)
             return A, b, d, None
-        except ValueError:
-            return None, None, None, "Valores de restricciones inválidos"
+        except ValueError as e:
+            return None, None, None, f"Valores de restricciones inválidos: {e}"
     
-    def configurar_solver(self, coeficientes, tipo_problema, A, b, d):
-        """Configura el solver con los datos del problema"""
-        self.solver = SolucionadorPL()
+    def configurar_solver(self, coeficientes, tipo_problema, A, b, d, motor=None, metodo=None,
+                          pricing=None, presolve=None):
+        """
+        Configura el solver con los datos del problema
+        
+        Args:
+            motor: "tableau", "dual" o "revisado"; si es None se usa self.motor
+            metodo: "big_m" o "dos_fases"; si es None se usa self.metodo
+            pricing: Regla de pricing del solver; si es None se usa self.pricing
+            presolve: Reducir el modelo antes de resolver; si es None se usa self.presolve
+        """
+        self.solver = SolucionadorPL(pricing=pricing or self.pricing)
+        self.solver.motor = motor or self.motor
+        self.solver.metodo = metodo or self.metodo
+        self.solver.usar_presolve = self.presolve if presolve is None else presolve
         self.solver.usar_fracciones = self.usar_fracciones
-        self.solver.verbose = True
+        self.solver.exacto = self.exacto
+        self.solver.verbose = self.salida_detallada
         self.solver.establecer_objetivo(coeficientes, tipo_problema)
         self.solver.agregar_restricciones(A, b, d)
     
-    def capturar_salida_solver(self):
-        """Captura toda la salida del solver incluyendo tableaux y comentarios"""
-        salida_buffer = io.StringIO()
+    def capturar_salida_solver(self, al_evento=None):
+        """
+        Captura toda la salida del solver incluyendo tableaux y comentarios
+        
+        redirect_stdout reemplaza sys.stdout en todo el proceso, así que solo debe
+        usarse en resoluciones sincrónicas; la interfaz resuelve en un hilo de
+        trabajo con resolver_sin_captura.
         
+        Args:
+            al_evento: Función que recibe cada EventoSimplex
+        """
+        salida_buffer = io.StringIO()
         with redirect_stdout(salida_buffer):
-            try:
-                solucion, valor = self.solver.resolver()
-                
-                # Agregar información adicional al final
-                print("\n" + "="*60)
-                print("ANÁLISIS DE LA SOLUCIÓN")
-                print("="*60)
-                
-                # Verificar si hay variables artificiales en la solución
-                tiene_artificiales = False
-                for i, var in enumerate(self.solver.vars_basicas):
-                    if var in self.solver.indices_artificiales and abs(self.solver.tableau[i, -1]) > self.solver.epsilon:
-                        tiene_artificiales = True
-                        break
-                
-                if tiene_artificiales:
-                    print("⚠️  PROBLEMA INFACTIBLE:")
-                    print("   Una o más variables artificiales permanecen en la solución final")
-                    print("   con valores no cero, lo que indica que no existe solución factible.")
-                else:
-                    print("✅ PROBLEMA FACTIBLE:")
-                    print("   Se encontró una solución óptima válida.")
-                
-                print(f"\n📊 ESTADÍSTICAS DEL PROCESO:")
-                print(f"   • Número de iteraciones: {len(self.solver.historial_tableaux) - 1}")
-                print(f"   • Variables originales: {self.solver.num_variables}")
-                print(f"   • Restricciones: {self.solver.num_restricciones}")
-                print(f"   • Variables de holgura: {len(self.solver.vars_holgura)}")
-                print(f"   • Variables artificiales: {len(self.solver.vars_artificiales_idx)}")
-                
-                if self.solver.M:
-                    print(f"   • Valor Big M utilizado: {self.solver.M}")
-                
-                print(f"\n🎯 SOLUCIÓN FINAL:")
-                for i, val in enumerate(solucion):
-                    if abs(val) > self.solver.epsilon:
-                        if self.usar_fracciones:
-                            frac = Fraction(val).limit_denominator()
-                            print(f"   x{i+1} = {frac}")
-                        else:
-                            print(f"   x{i+1} = {val:.6f}")
-                
-                tipo_original = "minimización" if self.solver.tipo_problema == "min" else "maximización"
+            analisis, solucion, valor = self.resolver_sin_captura(al_evento)
+        salida_completa = salida_buffer.getvalue() + analisis
+        salida_buffer.close()
+        
+        return salida_completa, solucion, valor
+    
+    def resolver_sin_captura(self, al_evento=None):
+        """
+        Resuelve el problema configurado sin tocar sys.stdout y arma el análisis
+        después; puede correr en un hilo de trabajo
+        
+        Args:
+            al_evento: Función que recibe cada EventoSimplex (p. ej. para informar el
+                       progreso cuando se resuelve en otro hilo)
+        
+        Returns:
+            tuple: (texto del análisis o del error, solucion, valor); solucion y valor
+            son None si la resolución falló
+        """
+        self.solver.al_evento = al_evento
+        try:
+            base = self.ultima_base if self.arranque_en_caliente else None
+            solucion, valor = self.solver.resolver(base=base)
+            if self.solver.estado == "optimo":
+                self.ultima_base = self.solver.exportar_base()
+            return self.texto_analisis(solucion, valor), solucion, valor
+        except Exception as e:
+            return f"❌ ERROR DURANTE LA RESOLUCIÓN: {str(e)}\n", None, None
+    
+    def texto_analisis(self, solucion, valor):
+        """Informe final de la resolución: factibilidad, estadísticas, solución y sensibilidad"""
+        lineas = ["\n" + "="*60]
+        lineas.append("ANÁLISIS DE LA SOLUCIÓN")
+        lineas.append("="*60)
+        
+        # Verificar si hay variables artificiales en la solución
+        if self.solver.estado == "cancelado":
+            lineas.append("⏹️  RESOLUCIÓN CANCELADA:")
+            lineas.append("   Se detuvo a pedido del usuario; los valores corresponden a la")
+            lineas.append("   última base alcanzada y no son óptimos.")
+        elif self.solver.estado == "infactible" or self.solver.tiene_artificiales_en_solucion():
+            lineas.append("⚠️  PROBLEMA INFACTIBLE:")
+            lineas.append("   Una o más variables artificiales permanecen en la solución final")
+            lineas.append("   con valores no cero, lo que indica que no existe solución factible.")
+        else:
+            lineas.append("✅ PROBLEMA FACTIBLE:")
+            lineas.append("   Se encontró una solución óptima válida.")
+        
+        lineas.append(f"\n📊 ESTADÍSTICAS DEL PROCESO:")
+        lineas.append(f"   • Número de iteraciones: {self.solver.iteraciones}")
+        lineas.append(f"   • Motor utilizado: {'exacto (Bareiss)' if self.solver.exacto else self.solver.motor_usado}")
+        lineas.append(f"   • Algoritmo: simplex {self.solver.algoritmo}")
+        lineas.append(f"   • Método para artificiales: {'dos_fases' if self.solver.exacto else self.solver.metodo}")
+        lineas.append(f"   • Arranque en caliente: {'sí' if self.solver.arranque_en_caliente else 'no'}")
+        lineas.append(f"   • Regla de pricing: {self.solver.pricing.nombre}")
+        for concepto, cantidad in self.solver.pricing.estadisticas().items():
+            lineas.append(f"       - {concepto}: {cantidad}")
+        reporte = self.reporte_presolve()
+        if reporte is not None:
+            lineas.append(f"   • Presolve: {reporte['filas eliminadas']} filas y "
+                          f"{reporte['columnas eliminadas']} columnas eliminadas "
+                          f"en {reporte['tiempo (s)']*1000:.2f} ms")
+            for concepto, cantidad in self.solver.presolve.conteos.items():
+                if cantidad:
+                    lineas.append(f"       - {concepto}: {cantidad}")
+        if self.solver.escalamiento is not None:
+            lineas.append(f"   • Escalamiento: rango de coeficientes "
+                          f"{self.solver.escalamiento.rango_original:.3g} -> "
+                          f"{self.solver.escalamiento.rango_escalado:.3g}")
+        lineas.append(f"   • Variables originales: {self.solver.num_variables}")
+        lineas.append(f"   • Restricciones: {self.solver.num_restricciones}")
+        lineas.append(f"   • Variables de holgura: {len(self.solver.vars_holgura)}")
+        lineas.append(f"   • Variables artificiales: {len(self.solver.vars_artificiales_idx)}")
+        
+        if self.solver.M:
+            lineas.append(f"   • Valor Big M utilizado: {self.solver.M}")
+        
+        lineas.append(f"\n🎯 SOLUCIÓN FINAL:")
+        for i, val in enumerate(solucion):
+            if abs(val) > self.solver.epsilon:
                 if self.usar_fracciones:
-                    obj_frac = Fraction(valor).limit_denominator()
-                    print(f"\n🏆 Valor óptimo de {tipo_original}: {obj_frac}")
+                    frac = self._como_fraccion(val)
+                    lineas.append(f"   x{i+1} = {frac}")
                 else:
-                    print(f"\n🏆 Valor óptimo de {tipo_original}: {valor:.6f}")
-                    
-            except Exception as e:
-                print(f"❌ ERROR DURANTE LA RESOLUCIÓN: {str(e)}")
-                solucion, valor = None, None
+                    lineas.append(f"   x{i+1} = {float(val):.6f}")
         
-        salida_completa = salida_buffer.getvalue()
-        salida_buffer.close()
+        tipo_original = "minimización" if self.solver.tipo_problema == "min" else "maximización"
+        if self.usar_fracciones:
+            obj_frac = self._como_fraccion(valor)
+            lineas.append(f"\n🏆 Valor óptimo de {tipo_original}: {obj_frac}")
+        else:
+            lineas.append(f"\n🏆 Valor óptimo de {tipo_original}: {float(valor):.6f}")
         
-        return salida_completa, solucion, valor
+        analisis = self.solver.analisis_sensibilidad()
+        if analisis is not None:
+            lineas.append("\n📈 ANÁLISIS DE SENSIBILIDAD:")
+            lineas.extend(analisis.resumen(self.usar_fracciones))
+        
+        return "\n".join(lineas) + "\n"
+    
+    def resolver_con_eventos(self):
+        """
+        Resuelve el problema configurado sin redirigir stdout ni armar texto
+        
+        Yields:
+            EventoSimplex: Pasos del solver (ver SolucionadorPL.resolver_eventos); el
+            texto de cada uno se arma solo si se pide con describir()
+        """
+        self.solver.verbose = False
+        base = self.ultima_base if self.arranque_en_caliente else None
+        for evento in self.solver.resolver_eventos(base=base):
+            if evento.tipo == "optimo":
+                self.ultima_base = self.solver.exportar_base()
+            yield evento
+    
+    def reporte_presolve(self):
+        """Reporte del presolve de la última resolución (None si no se usó)"""
+        if self.solver.presolve is None:
+            return None
+        return self.solver.presolve.reporte()
+    
+    def analisis_sensibilidad(self):
+        """Análisis de sensibilidad de la última resolución (None si no hay base óptima)"""
+        return self.solver.analisis_sensibilidad()
     
     def generar_resumen_solucion(self, solucion, valor):
         """Genera un resumen de la solución para mostrar en la interfaz principal"""
@@ -124,44 +218,74 @@ class SimplexServicio:
         
         resultado_resumen = "🎯 RESUMEN DE LA SOLUCIÓN\n"
         resultado_resumen += "="*50 + "\n\n"
+        if self.solver.estado == "cancelado":
+            resultado_resumen += "⏹️ Resolución cancelada: solución parcial, no óptima\n\n"
         
         for i, val in enumerate(solucion):
             if abs(val) > self.solver.epsilon:
                 if self.usar_fracciones:
-                    frac = Fraction(val).limit_denominator()
+                    frac = self._como_fraccion(val)
                     resultado_resumen += f"x{i+1} = {frac}\n"
                 else:
-                    resultado_resumen += f"x{i+1} = {val:.6f}\n"
+                    resultado_resumen += f"x{i+1} = {float(val):.6f}\n"
         
         tipo_original = "minimización" if self.solver.tipo_problema == "min" else "maximización"
         if self.usar_fracciones:
-            obj_frac = Fraction(valor).limit_denominator()
+            obj_frac = self._como_fraccion(valor)
             resultado_resumen += f"\nValor óptimo de {tipo_original}: {obj_frac}\n"
         else:
-            resultado_resumen += f"\nValor óptimo de {tipo_original}: {valor:.6f}\n"
+            resultado_resumen += f"\nValor óptimo de {tipo_original}: {float(valor):.6f}\n"
         
-        resultado_resumen += f"\nIteraciones realizadas: {len(self.solver.historial_tableaux) - 1}\n"
+        resultado_resumen += f"\nIteraciones realizadas: {self.solver.iteraciones}\n"
         resultado_resumen += "\n💡 Para ver el proceso detallado paso a paso,\n   vaya a la pestaña 'Proceso de Resolución'"
         
         return resultado_resumen
     
     def resolver_problema(self, coeficientes_str, tipo_problema, restricciones_data):
         """Resuelve el problema de programación lineal completo"""
+        error = self.preparar_problema(coeficientes_str, tipo_problema, restricciones_data)
+        if error:
+            return None, None, None, error
+        return self.resolver_preparado()
+    
+    def preparar_problema(self, coeficientes_str, tipo_problema, restricciones_data):
+        """
+        Valida los datos y configura el solver sin resolver (lee los widgets, así
+        que debe llamarse desde el hilo de la interfaz)
+        
+        Returns:
+            str: Mensaje de error, o None si el problema quedó listo
+        """
         # Validar coeficientes
         coeficientes, error = self.validar_coeficientes_objetivo(coeficientes_str)
         if error:
-            return None, None, None, error
+            return error
         
         # Validar restricciones
         A, b, d, error = self.validar_restricciones(restricciones_data)
         if error:
-            return None, None, None, error
+            return error
         
         # Configurar solver
         self.configurar_solver(coeficientes, tipo_problema, A, b, d)
+        return None
+    
+    def resolver_preparado(self, al_evento=None):
+        """
+        Resuelve el problema ya configurado; no toca la interfaz, así que puede
+        correr en un hilo de trabajo
         
-        # Resolver y capturar salida
-        proceso_completo, solucion, valor = self.capturar_salida_solver()
+        Args:
+            al_evento: Función que recibe cada EventoSimplex (progreso)
+        
+        Returns:
+            tuple: (resumen, proceso_completo, (solucion, valor), error)
+        """
+        if self.solver.verbose:
+            # La salida detallada del solver va a stdout: hay que capturarla
+            proceso_completo, solucion, valor = self.capturar_salida_solver(al_evento)
+        else:
+            proceso_completo, solucion, valor = self.resolver_sin_captura(al_evento)
         
         if solucion is not None and valor is not None:
             self.proceso_completo = proceso_completo
@@ -170,13 +294,25 @@ class SimplexServicio:
         else:
             return None, None, None, "No se pudo resolver el problema"
     
-    def exportar_tableaux_como_imagenes(self, carpeta_destino=None):
-        """Exporta los tableaux como imágenes"""
+    def cancelar_resolucion(self):
+        """Pide al solver que se detenga antes del próximo pivote (desde cualquier hilo)"""
+        self.solver.cancelar()
+    
+    def exportar_tableaux_como_imagenes(self, carpeta_destino=None, formato="png"):
+        """
+        Exporta los tableaux como imágenes
+        
+        Args:
+            carpeta_destino: Carpeta de destino; si es None se pregunta con un diálogo
+            formato: "png" (una imagen por iteración) o "pdf" (un solo PDF de varias páginas)
+        """
         try:
             if not hasattr(self.solver, 'historial_tableaux') or not self.solver.historial_tableaux:
                 return False, "No hay tableaux para exportar. Primero resuelva un problema."
             
             if carpeta_destino is None:
+                # tkinter solo hace falta para el diálogo de la interfaz gráfica
+                from tkinter import filedialog
                 carpeta_destino = filedialog.askdirectory(
                     initialdir=EXPORT_PATH, 
                     title="Selecciona carpeta de exportación"
@@ -184,17 +320,14 @@ class SimplexServicio:
                 if not carpeta_destino:
                     return False, "Exportación cancelada"
             
-            self.solver.visualizar_tableaux()
-            archivos_movidos = 0
-            
-            for i in range(len(self.solver.historial_tableaux)):
-                src = f"tableau_{i}.png"
-                dst = os.path.join(carpeta_destino, f"tableau_{i}.png")
-                if os.path.exists(src):
-                    os.rename(src, dst)
-                    archivos_movidos += 1
+            # Los archivos se escriben directamente en el destino (sin mover entre sistemas de archivos)
+            with redirect_stdout(io.StringIO()):
+                rutas = self.solver.visualizar_tableaux(carpeta_destino, formato)
             
-            mensaje = f"{archivos_movidos} imágenes guardadas en:\n{carpeta_destino}"
+            if formato == "pdf":
+                mensaje = f"{len(self.solver.historial_tableaux)} tableaux guardados en:\n{rutas[0]}"
+            else:
+                mensaje = f"{len(rutas)} imágenes guardadas en:\n{carpeta_destino}"
             return True, mensaje
             
         except Exception as e:
@@ -204,10 +337,35 @@ class SimplexServicio:
         """Obtiene el proceso completo de resolución"""
         return self.proceso_completo
     
+    def numero_tableaux(self):
+        """Cantidad de tableaux guardados de la última resolución"""
+        if not self.tiene_solucion():
+            return 0
+        return len(self.solver.historial_tableaux)
+    
+    def texto_tableau(self, indice, solver=None):
+        """
+        Texto de un tableau de la última resolución, formateado solo al pedirlo
+        
+        Args:
+            solver: Solucionador del que se lee el historial (None = el actual); permite
+                    seguir mostrando un proceso mientras otra resolución está en curso
+        """
+        try:
+            return (solver or self.solver).tableau_como_texto(indice)
+        except Exception as e:
+            return f"No se pudo mostrar el tableau {indice}: {str(e)}"
+    
     def tiene_solucion(self):
         """Verifica si hay una solución disponible"""
         return hasattr(self.solver, 'historial_tableaux') and self.solver.historial_tableaux
     
+    def _como_fraccion(self, valor):
+        """Fracción para mostrar: exacta en el modo exacto, aproximada en los demás"""
+        if self.solver.exacto:
+            return Fraction(valor)
+        return Fraction(valor).limit_denominator()
+    
     def configurar_fracciones(self, usar_fracciones):
         """Configura el uso de fracciones"""
         self.usar_fracciones = usar_fracciones
\ No newline at end of file
@@ -0,0 +1,453 @@
+"""
+Servidor HTTP/JSON local que resuelve problemas con procesos de trabajo precalentados
+
+Los procesos se inician una vez (importan el solucionador y resuelven un problema
+de prueba) y atienden un pedido tras otro, así cada resolución no paga el arranque
+de Python ni las importaciones. Los pedidos esperan en una cola acotada: si está
+llena se responde 503 de inmediato (contrapresión). Cada pedido tiene un tiempo
+límite que cuenta desde que llega: si se vence en la cola se responde 504 sin
+resolverlo y, si se vence durante la resolución, el proceso se termina y se
+reemplaza por uno nuevo.
+
+Rutas:
+    POST /resolver   Problema en el formato JSON de resolucion_paralela ("objetivo",
+                     "A", "b", "desigualdades", "tipo", "inferiores", "superiores"),
+                     o {"lp": texto} / {"mps": texto}; opcionalmente "opciones" (motor,
+                     metodo, pricing, max_iteraciones, usar_presolve, exacto, epsilon)
+                     y "timeout" en segundos
+    GET  /metricas   Rendimiento, profundidad de la cola y percentiles de latencia
+    GET  /salud      Estado del servidor
+
+Uso:
+    python servidor_simplex.py [--puerto 8765] [--trabajadores N] [--cola N] [--timeout S]
+"""
+import argparse
+import io
+import json
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PUERTO = 8765
+TIMEOUT = 30.0                  # Segundos por pedido si no indica otro
+TIMEOUT_MAXIMO = 300.0          # Tope para el "timeout" que pide un cliente
+MAX_CUERPO = 16 * 1024 * 1024   # Bytes aceptados en el cuerpo de un pedido
+VENTANA_LATENCIAS = 2048        # Latencias recientes usadas para los percentiles
+VENTANA_RENDIMIENTO = 60.0      # Segundos considerados para pedidos por segundo
+OPCIONES_PERMITIDAS = {"motor", "metodo", "pricing", "max_iteraciones", "usar_presolve",
+                       "exacto", "epsilon"}
+VALORES_OPCIONES = {            # Valores admitidos de las opciones con nombre (null = Dantzig)
+    "motor": ["tableau", "dual", "revisado"],
+    "metodo": ["big_m", "dos_fases"],
+    "pricing": [None, "dantzig", "parcial", "devex", "steepest_edge"],
+}
+
+_PROBLEMA_PRUEBA = {"objetivo": [3, 5], "A": [[1, 0], [0, 2], [3, 2]], "b": [4, 12, 18],
+                    "desigualdades": ["<=", "<=", "<="]}
+
+
+def resolver_pedido(pedido):
+    """
+    Resuelve un pedido ya validado (se ejecuta en el proceso de trabajo)
+
+    Returns:
+        dict: estado, valor, iteraciones, tiempo (s), solucion y error (ver
+        resolucion_paralela.resolver_con); con un modelo LP o MPS, también variables
+    """
+    from archivos_modelo import leer_lp, leer_mps
+    from resolucion_paralela import cargar_datos, resolver_con
+
+    nombres = []
+
+    def cargar(solver):
+        if "lp" in pedido or "mps" in pedido:
+            texto = io.StringIO(pedido["lp"] if "lp" in pedido else pedido["mps"])
+            texto.name = "<pedido>"
+            modelo = leer_lp(texto) if "lp" in pedido else leer_mps(texto)
+            modelo.cargar_en(solver)
+            nombres.extend(modelo.nombres_variables)
+            return modelo
+        cargar_datos(solver, pedido)
+        return None
+
+    resultado = resolver_con(cargar, pedido.get("opciones"))
+    if nombres:
+        resultado["variables"] = nombres
+    return resultado
+
+
+def _trabajador(conexion):
+    """Bucle de un proceso de trabajo: recibe pedidos por la tubería y devuelve resultados"""
+    resolver_pedido(_PROBLEMA_PRUEBA)       # Precalentar importaciones y cachés
+    conexion.send("listo")
+    while True:
+        try:
+            pedido = conexion.recv()
+        except EOFError:
+            return
+        if pedido is None:
+            return
+        conexion.send(resolver_pedido(pedido))
+
+
+class PedidoPendiente:
+    """Pedido en la cola: datos, instante de llegada, plazo y el Future de su respuesta"""
+
+    __slots__ = ("datos", "llegada", "plazo", "futuro")
+
+    def __init__(self, datos, timeout):
+        self.datos = datos
+        self.llegada = time.monotonic()
+        self.plazo = self.llegada + timeout
+        self.futuro = Future()
+
+
+class Metricas:
+    """Contadores y latencias recientes, protegidos por un lock (los usan varios hilos)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.inicio = time.monotonic()
+        self.latencias = deque(maxlen=VENTANA_LATENCIAS)
+        self.terminados = deque()           # Instantes de respuesta dentro de VENTANA_RENDIMIENTO
+        self.por_estado = {}
+        self.rechazados = 0
+        self.vencidos = 0
+        self.reinicios = 0
+
+    def registrar(self, estado, latencia):
+        ahora = time.monotonic()
+        with self._lock:
+            self.por_estado[estado] = self.por_estado.get(estado, 0) + 1
+            self.latencias.append(latencia)
+            self.terminados.append(ahora)
+            self._descartar_viejos(ahora)
+
+    def registrar_rechazo(self):
+        with self._lock:
+            self.rechazados += 1
+
+    def registrar_vencido(self):
+        with self._lock:
+            self.vencidos += 1
+
+    def registrar_reinicio(self):
+        with self._lock:
+            self.reinicios += 1
+
+    def _descartar_viejos(self, ahora):
+        while self.terminados and self.terminados[0] < ahora - VENTANA_RENDIMIENTO:
+            self.terminados.popleft()
+
+    def resumen(self):
+        """Diccionario con rendimiento, conteos y percentiles de latencia (en ms)"""
+        ahora = time.monotonic()
+        with self._lock:
+            self._descartar_viejos(ahora)
+            latencias = sorted(self.latencias)
+            total = sum(self.por_estado.values())
+            activo = ahora - self.inicio
+            resumen = {
+                "tiempo_activo_s": round(activo, 3),
+                "pedidos_totales": total,
+                "pedidos_por_segundo": round(len(self.terminados) / min(activo, VENTANA_RENDIMIENTO), 3)
+                                       if activo > 0 else 0.0,
+                "por_estado": dict(self.por_estado),
+                "rechazados_cola_llena": self.rechazados,
+                "vencidos": self.vencidos,
+                "reinicios_de_trabajadores": self.reinicios,
+            }
+        resumen["latencia_ms"] = {f"p{p}": round(_percentil(latencias, p) * 1000, 3) if latencias else None
+                                  for p in (50, 90, 95, 99)}
+        resumen["latencia_ms"]["max"] = round(latencias[-1] * 1000, 3) if latencias else None
+        return resumen
+
+
+def _percentil(ordenados, p):
+    """Percentil por rango más cercano de una lista ordenada"""
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+class _Ranura:
+    """Un proceso de trabajo y el hilo que le pasa pedidos de la cola"""
+
+    def __init__(self, servidor, numero):
+        self.servidor = servidor
+        self.numero = numero
+        self.proceso = None
+        self.conexion = None
+        self.ocupada = False
+        self.iniciar_proceso()
+        self.hilo = threading.Thread(target=self._atender, name=f"ranura-{numero}", daemon=True)
+
+    def iniciar_proceso(self):
+        """Lanza el proceso y espera a que termine de precalentarse"""
+        contexto = multiprocessing.get_context("spawn")
+        self.conexion, extremo_hijo = contexto.Pipe()
+        self.proceso = contexto.Process(target=_trabajador, args=(extremo_hijo,),
+                                        name=f"simplex-trabajador-{self.numero}", daemon=True)
+        self.proceso.start()
+        extremo_hijo.close()
+        if self.conexion.recv() != "listo":
+            raise RuntimeError(f"El trabajador {self.numero} no pudo iniciarse")
+
+    def reiniciar_proceso(self):
+        """Termina el proceso actual (vencido o caído) y lo reemplaza"""
+        self.proceso.terminate()
+        self.proceso.join()
+        self.conexion.close()
+        self.servidor.metricas.registrar_reinicio()
+        self.iniciar_proceso()
+
+    def _atender(self):
+        cola = self.servidor.cola
+        while True:
+            pedido = cola.get()
+            if pedido is None:
+                break
+            # El cliente ya se fue si su plazo venció mientras el pedido esperaba
+            if not pedido.futuro.set_running_or_notify_cancel():
+                continue
+            restante = pedido.plazo - time.monotonic()
+            if restante <= 0:
+                pedido.futuro.set_result(("vencido", None))
+                continue
+            self.ocupada = True
+            try:
+                self.conexion.send(pedido.datos)
+                if self.conexion.poll(restante):
+                    pedido.futuro.set_result(("ok", self.conexion.recv()))
+                else:
+                    pedido.futuro.set_result(("vencido", None))
+                    self.reiniciar_proceso()
+            except (EOFError, OSError) as e:
+                pedido.futuro.set_result(("caido", f"El proceso de trabajo terminó: {e}"))
+                self.reiniciar_proceso()
+            except Exception as e:
+                # Nunca dejar a un cliente esperando una respuesta que no llegará
+                if not pedido.futuro.done():
+                    pedido.futuro.set_result(("caido", f"{type(e).__name__}: {e}"))
+            finally:
+                self.ocupada = False
+        try:
+            self.conexion.send(None)
+        except OSError:
+            pass
+        self.proceso.join(timeout=5)
+        if self.proceso.is_alive():
+            self.proceso.terminate()
+
+
+class ServidorSimplex:
+    """
+    Servidor HTTP en localhost con una cola acotada y un grupo de procesos de trabajo
+    """
+
+    def __init__(self, host="127.0.0.1", puerto=PUERTO, trabajadores=None, cola=None,
+                 timeout=TIMEOUT):
+        """
+        Args:
+            host: Interfaz de escucha (por defecto solo la máquina local)
+            puerto: Puerto TCP (0 = uno libre, ver direccion)
+            trabajadores: Procesos de trabajo (None = número de CPU)
+            cola: Pedidos que pueden esperar antes de rechazar con 503 (None = 4 por trabajador)
+            timeout: Segundos por pedido si el pedido no indica otro
+        """
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.cola = queue.Queue(maxsize=cola or 4 * self.trabajadores)
+        self.timeout = timeout
+        self.verbose = False            # Registrar cada pedido en stderr
+        self._sirviendo = False
+        self.metricas = Metricas()
+        self.ranuras = [_Ranura(self, numero) for numero in range(self.trabajadores)]
+        for ranura in self.ranuras:
+            ranura.hilo.start()
+        self.http = ThreadingHTTPServer((host, puerto), _Manejador)
+        self.http.daemon_threads = True
+        self.http.simplex = self
+
+    @property
+    def direccion(self):
+        host, puerto = self.http.server_address[:2]
+        return f"http://{host}:{puerto}"
+
+    def resolver(self, datos):
+        """
+        Encola un pedido y espera su resultado (se llama desde un hilo del servidor HTTP)
+
+        Returns:
+            tuple: (código HTTP, diccionario de respuesta)
+        """
+        timeout = datos.pop("timeout", None)
+        timeout = self.timeout if timeout is None else min(float(timeout), TIMEOUT_MAXIMO)
+        pedido = PedidoPendiente(datos, timeout)
+        try:
+            self.cola.put_nowait(pedido)
+        except queue.Full:
+            self.metricas.registrar_rechazo()
+            return 503, {"error": "Cola llena, intente de nuevo más tarde",
+                         "cola": self.cola.qsize()}
+
+        # El plazo también corre mientras el pedido espera en la cola
+        try:
+            tipo, resultado = pedido.futuro.result(timeout=max(0, pedido.plazo - time.monotonic()))
+        except TimeoutError:
+            pedido.futuro.cancel()
+            tipo, resultado = "vencido", None
+        latencia = time.monotonic() - pedido.llegada
+        if tipo == "vencido":
+            self.metricas.registrar_vencido()
+            self.metricas.registrar("vencido", latencia)
+            return 504, {"error": f"Se superó el tiempo límite de {timeout:g} s"}
+        if tipo == "caido":
+            self.metricas.registrar("error", latencia)
+            return 500, {"error": resultado}
+        self.metricas.registrar(resultado["estado"], latencia)
+        resultado["latencia"] = latencia
+        return (400 if resultado["estado"] == "error" else 200), resultado
+
+    def metricas_actuales(self):
+        resumen = self.metricas.resumen()
+        resumen["profundidad_cola"] = self.cola.qsize()
+        resumen["capacidad_cola"] = self.cola.maxsize
+        resumen["trabajadores"] = self.trabajadores
+        resumen["trabajadores_ocupados"] = sum(ranura.ocupada for ranura in self.ranuras)
+        return resumen
+
+    def servir(self):
+        """Atiende pedidos hasta que se llame a cerrar() desde otro hilo (bloquea)"""
+        self._sirviendo = True
+        self.http.serve_forever()
+
+    def cerrar(self):
+        """Deja de aceptar pedidos, termina los procesos de trabajo y libera el puerto"""
+        if self._sirviendo:
+            self.http.shutdown()
+        self.http.server_close()
+        for ranura in self.ranuras:
+            self.cola.put(None)
+        for ranura in self.ranuras:
+            ranura.hilo.join()
+
+
+def validar_pedido(datos):
+    """
+    Revisa la forma del pedido antes de encolarlo
+
+    Returns:
+        str: Mensaje de error, o None si el pedido es válido
+    """
+    if not isinstance(datos, dict):
+        return "El cuerpo debe ser un objeto JSON"
+    if "lp" not in datos and "mps" not in datos:
+        faltantes = [clave for clave in ("objetivo", "A", "b", "desigualdades") if clave not in datos]
+        if faltantes:
+            return f"Faltan claves: {', '.join(faltantes)}"
+    opciones = datos.get("opciones", {})
+    if not isinstance(opciones, dict):
+        return "\"opciones\" debe ser un objeto"
+    desconocidas = sorted(set(opciones) - OPCIONES_PERMITIDAS)
+    if desconocidas:
+        return f"Opciones no admitidas: {', '.join(desconocidas)}"
+    for opcion, admitidos in VALORES_OPCIONES.items():
+        # El solucionador usaría el tableau con un motor desconocido en vez de fallar
+        if opcion in opciones and opciones[opcion] not in admitidos:
+            validos = ", ".join(valor for valor in admitidos if valor is not None)
+            return f"\"{opcion}\" debe ser uno de: {validos}"
+    timeout = datos.get("timeout")
+    if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float))
+                                or timeout <= 0):
+        return "\"timeout\" debe ser un número positivo de segundos"
+    return None
+
+
+class _Manejador(BaseHTTPRequestHandler):
+    """Traduce HTTP a ServidorSimplex; cada conexión corre en su propio hilo"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _responder(self, codigo, datos, encabezados=None):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode("utf-8")
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        for nombre, valor in (encabezados or {}).items():
+            self.send_header(nombre, valor)
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def do_GET(self):
+        servidor = self.server.simplex
+        if self.path == "/metricas":
+            self._responder(200, servidor.metricas_actuales())
+        elif self.path == "/salud":
+            self._responder(200, {"estado": "ok", "trabajadores": servidor.trabajadores})
+        else:
+            self._responder(404, {"error": f"Ruta desconocida: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/resolver":
+            self._responder(404, {"error": f"Ruta desconocida: {self.path}"})
+            return
+        try:
+            longitud = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            longitud = -1
+        if not 0 < longitud <= MAX_CUERPO:
+            self.close_connection = True
+            self._responder(413 if longitud > MAX_CUERPO else 411,
+                            {"error": f"Se requiere un cuerpo JSON de hasta {MAX_CUERPO} bytes"})
+            return
+        try:
+            datos = json.loads(self.rfile.read(longitud))
+        except (ValueError, UnicodeDecodeError) as e:
+            self._responder(400, {"error": f"JSON inválido: {e}"})
+            return
+        error = validar_pedido(datos)
+        if error:
+            self._responder(400, {"error": error})
+            return
+
+        codigo, respuesta = self.server.simplex.resolver(datos)
+        self._responder(codigo, respuesta, {"Retry-After": "1"} if codigo == 503 else None)
+
+    def log_message(self, formato, *args):
+        if self.server.simplex.verbose:
+            super().log_message(formato, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor HTTP/JSON local del solucionador simplex")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Interfaz de escucha (por defecto solo la máquina local)")
+    parser.add_argument("--puerto", type=int, default=PUERTO)
+    parser.add_argument("--trabajadores", type=int, default=None,
+                        help="Procesos de trabajo (por defecto uno por CPU)")
+    parser.add_argument("--cola", type=int, default=None,
+                        help="Pedidos en espera antes de responder 503 (por defecto 4 por trabajador)")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT,
+                        help="Segundos por pedido si el pedido no indica otro")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Registrar cada pedido")
+    args = parser.parse_args()
+
+    servidor = ServidorSimplex(args.host, args.puerto, args.trabajadores, args.cola, args.timeout)
+    servidor.verbose = args.verbose
+    print(f"Escuchando en {servidor.direccion} con {servidor.trabajadores} trabajadores "
+          f"(Ctrl+C para terminar)", file=sys.stderr)
+    try:
+        servidor.servir()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+import numpy as np
+from fractions import Fraction
+from math import lcm
+
+from eventos_simplex import EventoSimplex, TABLEAU_INICIAL, PIVOTE, ITERACION, FASE_DOS
+
+
+def a_fraccion(valor):
+    """
+    Convierte un número o texto a Fraction sin pasar por float
+
+    Los float se convierten desde su representación decimal más corta, así 0.1
+    es 1/10 y no la fracción binaria que guarda el float.
+    """
+    if isinstance(valor, Fraction):
+        return valor
+    if isinstance(valor, (int, np.integer)):
+        return Fraction(int(valor))
+    if isinstance(valor, str):
+        return Fraction(valor.strip())
+    return Fraction(repr(float(valor)))
+
+
+def _fila_entera(valores):
+    """Multiplica una fila de fracciones por el mcm de sus denominadores"""
+    factor = lcm(*(v.denominator for v in valores)) if len(valores) > 0 else 1
+    return [v.numerator * (factor // v.denominator) for v in valores], factor
+
+
+class SimplexExacto:
+    """
+    Simplex de dos fases exacto con pivoteo entero libre de fracciones (Bareiss)
+
+    El tableau se guarda como enteros de Python T con un denominador común D:
+    el tableau verdadero es T / D. Cada fila de restricción se multiplica por el
+    mcm de sus denominadores (equivale a escalar su holgura), así el tableau
+    inicial es entero con D = 1. Al pivotear en (r, s) con p = T[r, s]:
+
+        T[i, j] <- (p·T[i, j] - T[i, s]·T[r, j]) / D    (i != r, división exacta)
+        D <- p
+
+    Las divisiones son exactas porque T es siempre det(B)·B⁻¹·M; los enteros
+    crecen como determinantes de submatrices, no como productos de denominadores.
+
+    Solo admite x >= 0 más cotas (las inferiores se desplazan y las superiores se
+    agregan como filas); las artificiales se manejan siempre con dos fases.
+    """
+
+    def __init__(self, c, A, b, desigualdades, inferiores=None, superiores=None,
+                 max_iteraciones=100, verbose=False, usar_fracciones=True, al_evento=None,
+                 cancelacion=None):
+        """
+        Args:
+            c: Costos en forma de maximización (números, textos o Fraction)
+            A: Matriz de restricciones (lista de filas)
+            b: Lado derecho
+            desigualdades: Tipo de cada restricción ("<=", ">=", "=")
+            inferiores, superiores: Cotas de las variables (None = 0 e infinito)
+            al_evento: Función que recibe un EventoSimplex por paso (tableaux como float)
+            cancelacion: threading.Event; si se activa, se detiene antes del próximo pivote
+        """
+        self.c = [a_fraccion(v) for v in c]
+        A = [[a_fraccion(v) for v in fila] for fila in A]
+        b = [a_fraccion(v) for v in b]
+        desigualdades = list(desigualdades)
+        self.num_variables = n = len(self.c)
+        self.max_iteraciones = max_iteraciones
+        self.verbose = verbose
+        self.al_evento = al_evento
+        self.cancelacion = cancelacion
+        self.usar_fracciones = usar_fracciones
+
+        # Cotas: x = l + x' y las superiores como filas x'_j <= u_j - l_j
+        self.inferiores = [Fraction(0)] * n if inferiores is None else [a_fraccion(v) for v in inferiores]
+        self.constante = sum(cj * lj for cj, lj in zip(self.c, self.inferiores))
+        b = [bi - sum(aij * lj for aij, lj in zip(fila, self.inferiores)) for fila, bi in zip(A, b)]
+        if superiores is not None:
+            for j, u in enumerate(superiores):
+                if u is not None and np.isfinite(float(u)):
+                    A.append([Fraction(int(k == j)) for k in range(n)])
+                    b.append(a_fraccion(u) - self.inferiores[j])
+                    desigualdades.append("<=")
+
+        # Lados derechos no negativos
+        for i in range(len(b)):
+            if b[i] < 0:
+                A[i] = [-v for v in A[i]]
+                b[i] = -b[i]
+                desigualdades[i] = {"<=": ">=", ">=": "<=", "=": "="}[desigualdades[i]]
+
+        self.num_restricciones = m = len(b)
+        self.desigualdades = desigualdades
+        num_holguras = sum(d != "=" for d in desigualdades)
+        self.indices_artificiales = []
+        self.etiquetas = ([f"x{j+1}" for j in range(n + num_holguras)]
+                          + [f"a{k+1}" for k in range(sum(d != "<=" for d in desigualdades))])
+
+        # Tableau entero: cada fila escalada por el mcm de sus denominadores
+        self.tableau = np.zeros((m + 1, len(self.etiquetas) + 1), dtype=object)
+        self.vars_basicas = []
+        holgura, artificial = n, n + num_holguras
+        for i in range(m):
+            fila, _ = _fila_entera(A[i] + [b[i]])
+            self.tableau[i, :n] = fila[:n]
+            self.tableau[i, -1] = fila[-1]
+            if desigualdades[i] != "=":
+                self.tableau[i, holgura] = 1 if desigualdades[i] == "<=" else -1
+                if desigualdades[i] == "<=":
+                    self.vars_basicas.append(holgura)
+                holgura += 1
+            if desigualdades[i] != "<=":
+                self.tableau[i, artificial] = 1
+                self.vars_basicas.append(artificial)
+                self.indices_artificiales.append(artificial)
+                artificial += 1
+        self.denominador = 1
+
+        self.iteraciones = 0
+        self.estado = None
+        self.historial = []             # Tableaux (como float) para visualización
+        self.historial_bases = []       # Variables básicas de cada tableau del historial
+
+    def tableau_actual(self):
+        """Tableau verdadero T / D como matriz de Fraction"""
+        return np.vectorize(lambda v: Fraction(v, self.denominador), otypes=[object])(self.tableau)
+
+    def _mostrar(self, titulo, evento=ITERACION, fila=None, col=None):
+        """Guarda el tableau en el historial, lo emite como evento e imprime (solo con verbose)"""
+        # int / int es división verdadera correctamente redondeada, aun con enteros enormes
+        self.historial.append((self.tableau / self.denominador).astype(float))
+        self.historial_bases.append(np.array(self.vars_basicas, dtype=np.intp))
+        if self.al_evento is not None:
+            self.al_evento(EventoSimplex(evento, self.iteraciones, fila=fila, columna=col,
+                                         tableau=self.historial[-1],
+                                         indice_historial=len(self.historial) - 1))
+        if not self.verbose:
+            return
+        from tabulate import tabulate
+        actual = self.tableau_actual()
+        if self.usar_fracciones:
+            datos = [[str(v) for v in fila] for fila in actual]
+        else:
+            datos = actual.astype(float)
+        filas = [self.etiquetas[v] for v in self.vars_basicas] + ["z"]
+        print(f"\n{titulo}")
+        print(tabulate(datos, headers=self.etiquetas[:self.tableau.shape[1] - 1] + ["LD"],
+                       showindex=filas, tablefmt="grid"))
+
+    def _establecer_fila_objetivo(self, costos):
+        """
+        Fila z entera para los costos dados en la base actual
+
+        Se guarda λ·D·(c_B·B⁻¹·A - c) con λ el mcm de los denominadores de los costos,
+        que es entero porque las filas de restricción ya son D·B⁻¹·M.
+        """
+        enteros, self.factor_objetivo = _fila_entera(list(costos))
+        m = self.num_restricciones
+        fila = np.zeros(self.tableau.shape[1], dtype=object)
+        fila[:len(enteros)] = [-self.denominador * v for v in enteros]
+        for i, var in enumerate(self.vars_basicas):
+            if var < len(enteros) and enteros[var] != 0:
+                fila += enteros[var] * self.tableau[i]
+        self.tableau[m] = fila
+
+    def _pivotear(self, fila, col):
+        """Pivoteo de Bareiss: actualización entera con división exacta por D"""
+        p = self.tableau[fila, col]
+        pivote = self.tableau[fila].copy()
+        columna = self.tableau[:, col].copy()
+        self.tableau = (p * self.tableau - np.outer(columna, pivote)) // self.denominador
+        self.tableau[fila] = pivote
+        self.denominador = p
+        if p < 0:
+            # Mantener D > 0 para que los signos de T sean los del tableau verdadero
+            self.tableau = -self.tableau
+            self.denominador = -p
+        self.vars_basicas[fila] = col
+        self.iteraciones += 1
+
+    def _seleccionar_columna(self, bland, bloqueadas):
+        """Dantzig (o Bland cuando hay degeneración repetida) sobre la fila z entera"""
+        z = self.tableau[self.num_restricciones, :-1]
+        mejor, valor = -1, 0
+        for j, dj in enumerate(z):
+            if dj < 0 and j not in bloqueadas:
+                if bland:
+                    return j
+                if dj < valor:
+                    mejor, valor = j, dj
+        return mejor
+
+    def _seleccionar_fila(self, col):
+        """Prueba de la razón exacta comparando productos cruzados (sin fracciones)"""
+        mejor = -1
+        for i in range(self.num_restricciones):
+            a = self.tableau[i, col]
+            if a <= 0:
+                continue
+            if mejor == -1:
+                mejor = i
+                continue
+            izquierda = self.tableau[i, -1] * self.tableau[mejor, col]
+            derecha = self.tableau[mejor, -1] * a
+            # Empates: la básica de menor índice (regla de Bland)
+            if izquierda < derecha or (izquierda == derecha
+                                       and self.vars_basicas[i] < self.vars_basicas[mejor]):
+                mejor = i
+        return mejor
+
+    def _iterar(self, bloqueadas=(), fase_uno=False):
+        """Pivotea hasta el óptimo de la fase, no acotamiento o el límite de iteraciones"""
+        degeneradas = 0
+        while self.iteraciones < self.max_iteraciones:
+            if self.cancelacion is not None and self.cancelacion.is_set():
+                return "cancelado"
+            if fase_uno and self.tableau[self.num_restricciones, -1] >= 0:
+                return "optimo"
+            col = self._seleccionar_columna(degeneradas >= 10, bloqueadas)
+            if col == -1:
+                return "optimo"
+            fila = self._seleccionar_fila(col)
+            if fila == -1:
+                return "no_acotado"
+            degeneradas = degeneradas + 1 if self.tableau[fila, -1] == 0 else 0
+            self._dar_pivote(fila, col)
+        return "max_iteraciones"
+
+    def _dar_pivote(self, fila, col, detalle=""):
+        """Pivotea como una iteración más: eventos PIVOTE e ITERACION y salida detallada"""
+        if self.verbose:
+            print(f"\nPivote: Fila {fila+1}, Columna {col+1}{detalle}")
+        if self.al_evento is not None:
+            self.al_evento(EventoSimplex(PIVOTE, self.iteraciones, fila=fila, columna=col,
+                                         elemento=Fraction(self.tableau[fila, col], self.denominador)))
+        self._pivotear(fila, col)
+        self._mostrar(f"Iteración {self.iteraciones}", fila=fila, col=col)
+
+    def _terminar_fase_uno(self):
+        """Saca de la base las artificiales en cero y elimina las filas redundantes"""
+        artificiales = set(self.indices_artificiales)
+        redundantes = []
+        for fila, var in enumerate(list(self.vars_basicas)):
+            if var not in artificiales:
+                continue
+            candidatas = [j for j, v in enumerate(self.tableau[fila, :-1])
+                          if v != 0 and j not in artificiales]
+            if not candidatas:
+                redundantes.append(fila)
+                continue
+            # Cuenta como iteración, igual que en el motor de punto flotante
+            self._dar_pivote(fila, candidatas[0], " (expulsión de artificial)")
+        if redundantes:
+            conservar = [i for i in range(self.num_restricciones + 1) if i not in redundantes]
+            self.tableau = self.tableau[conservar]
+            self.vars_basicas = [v for i, v in enumerate(self.vars_basicas) if i not in redundantes]
+            self.num_restricciones = len(self.vars_basicas)
+
+    def resolver(self):
+        """
+        Ejecuta el método simplex de dos fases con aritmética entera exacta
+
+        Returns:
+            str: Estado final ("optimo", "no_acotado", "infactible", "max_iteraciones", "cancelado")
+        """
+        artificiales = self.indices_artificiales
+        if artificiales:
+            if self.verbose:
+                print("\nFase I (exacta): minimizando la suma de las variables artificiales")
+            costos = [Fraction(0)] * (self.tableau.shape[1] - 1)
+            for a in artificiales:
+                costos[a] = Fraction(-1)
+            self._establecer_fila_objetivo(costos)
+            self._mostrar("Tableau Inicial", TABLEAU_INICIAL)
+            self.estado = self._iterar(fase_uno=True)
+            if self.estado != "optimo":
+                return self.estado
+            if self.tableau[self.num_restricciones, -1] < 0:
+                self.estado = "infactible"
+                return self.estado
+            self._terminar_fase_uno()
+            if self.verbose:
+                print("\nFase II (exacta): se optimiza el objetivo original")
+            self._establecer_fila_objetivo(self.c)
+            self._mostrar(f"Iteración {self.iteraciones}", FASE_DOS)
+            self.estado = self._iterar(bloqueadas=set(artificiales))
+        else:
+            self._establecer_fila_objetivo(self.c)
+            self._mostrar("Tableau Inicial", TABLEAU_INICIAL)
+            self.estado = self._iterar()
+        return self.estado
+
+    def solucion(self):
+        """Valores exactos de las variables originales (list de Fraction)"""
+        x = [Fraction(0)] * self.num_variables
+        for i, var in enumerate(self.vars_basicas):
+            if var < self.num_variables:
+                x[var] = Fraction(self.tableau[i, -1], self.denominador)
+        return [xj + lj for xj, lj in zip(x, self.inferiores)]
+
+    def valor_objetivo(self):
+        """Valor exacto del objetivo en forma de maximización"""
+        z = Fraction(self.tableau[self.num_restricciones, -1],
+                     self.denominador * self.factor_objetivo)
+        return z + self.constante
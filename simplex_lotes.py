@@ -0,0 +1,211 @@
+import numpy as np
+
+# Códigos de estado de cada problema del lote (ESTADOS[código] es el nombre que usa SolucionadorPL)
+OPTIMO = 0
+NO_ACOTADO = 1
+INFACTIBLE = 2
+MAX_ITERACIONES = 3
+ESTADOS = ("optimo", "no_acotado", "infactible", "max_iteraciones")
+
+
+class SimplexLotes:
+    """
+    Simplex de dos fases para muchos problemas de la misma dimensión a la vez
+
+    Los tableaux se apilan en un arreglo de k×(m+1)×(N+1) y cada paso (pricing de
+    Dantzig, prueba de la razón y pivoteo) se aplica a todos los problemas activos
+    con operaciones vectorizadas; los que ya terminaron quedan enmascarados.
+
+    Todos los problemas comparten el tipo de cada restricción y el sentido del
+    objetivo; c, A y b pueden variar por problema. Las variables son x >= 0 (sin
+    cotas superiores). Cada fila tiene una columna lógica (holgura, exceso o nula
+    en las igualdades) y una artificial, así la estructura del tableau es la misma
+    aunque el signo de b cambie de un problema a otro.
+    """
+
+    def __init__(self, c, A, b, desigualdades, tipo_problema="max", max_iteraciones=100,
+                 epsilon=1e-12, tolerancia_pivote=1e-9, tolerancia_factibilidad=1e-9):
+        """
+        Args:
+            c: Costos (n) compartidos o uno por problema (k×n)
+            A: Matriz de restricciones (m×n) compartida o una por problema (k×m×n)
+            b: Lado derecho (m) compartido o uno por problema (k×m)
+            desigualdades: Tipo de cada restricción ("<=", ">=", "="), común a todo el lote
+            tipo_problema: "max" o "min"
+            max_iteraciones: Límite de pivoteos por problema (sumando las dos fases)
+        """
+        c = np.asarray(c, dtype=float)
+        A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float)
+        m, n = A.shape[-2:]
+        k = max(c.shape[0] if c.ndim == 2 else 1, A.shape[0] if A.ndim == 3 else 1,
+                b.shape[0] if b.ndim == 2 else 1)
+
+        self.tipo_problema = tipo_problema.lower()
+        self.c = np.broadcast_to(-c if self.tipo_problema == "min" else c, (k, n))
+        self.A = np.broadcast_to(A, (k, m, n))
+        self.b = np.broadcast_to(b, (k, m))
+        self.desigualdades = list(desigualdades)
+        self.num_problemas, self.num_restricciones, self.num_variables = k, m, n
+        self.max_iteraciones = max_iteraciones
+        self.epsilon = epsilon
+        self.tolerancia_pivote = tolerancia_pivote
+        self.tolerancia_factibilidad = tolerancia_factibilidad
+
+        self.tableau = None             # k×(m+1)×(n+2m+1)
+        self.vars_basicas = None        # k×m: columna básica de cada fila
+        self.iteraciones = np.zeros(k, dtype=np.intp)
+        self.estados = np.full(k, MAX_ITERACIONES, dtype=np.int8)
+
+    def _crear_tableaux(self):
+        """Forma estándar de todos los problemas con b >= 0 y base de holguras/artificiales"""
+        k, m, n = self.num_problemas, self.num_restricciones, self.num_variables
+        tipo = np.array([{"<=": 1.0, ">=": -1.0, "=": 0.0}[d] for d in self.desigualdades])
+
+        # Las filas con b < 0 se multiplican por -1 (<= pasa a >= y viceversa)
+        signo = np.where(self.b < 0, -1.0, 1.0)
+        tipo = tipo * signo
+        filas = np.arange(m)
+
+        self.tableau = np.zeros((k, m + 1, n + 2 * m + 1))
+        self.tableau[:, :m, :n] = self.A * signo[:, :, np.newaxis]
+        self.tableau[:, filas, n + filas] = tipo
+        self.tableau[:, filas, n + m + filas] = (tipo != 1.0)
+        self.tableau[:, :m, -1] = self.b * signo
+
+        self.vars_basicas = np.where(tipo == 1.0, n + filas, n + m + filas).astype(np.intp)
+        self._es_artificial = np.zeros(n + 2 * m, dtype=bool)
+        self._es_artificial[n + m:] = True
+
+    def _establecer_fila_objetivo(self, costos, problemas):
+        """Escribe la fila z de los problemas indicados en términos de su base actual"""
+        m = self.num_restricciones
+        T = self.tableau[problemas]
+        T[:, m, :] = 0.0
+        T[:, m, :costos.shape[1]] = -costos
+        costos_basicos = np.take_along_axis(T[:, m, :-1], self.vars_basicas[problemas], axis=1)
+        T[:, m, :] -= np.einsum("pi,pij->pj", costos_basicos, T[:, :m, :])
+        self.tableau[problemas] = T
+
+    def _iterar(self, activos, fase_uno=False):
+        """
+        Pivotea en bloque los problemas activos hasta que todos terminan
+
+        Los tableaux activos se copian a un arreglo de trabajo contiguo; los que van
+        terminando se devuelven a self.tableau y el arreglo se compacta.
+
+        Returns:
+            np.ndarray: Máscara de los problemas que terminaron en el óptimo (de la fase)
+        """
+        m = self.num_restricciones
+        optimos = np.zeros(self.num_problemas, dtype=bool)
+        bloqueadas = self._es_artificial if not fase_uno else np.zeros_like(self._es_artificial)
+
+        idx = np.flatnonzero(activos)
+        T = self.tableau[idx]
+        basicas = self.vars_basicas[idx]
+        iteraciones = self.iteraciones[idx]
+
+        while len(idx) > 0:
+            r = np.arange(len(idx))
+
+            # Pricing de Dantzig con las columnas bloqueadas fuera
+            d = np.where(bloqueadas, np.inf, T[:, m, :-1])
+            col = np.argmin(d, axis=1)
+            terminados = d[r, col] >= -self.epsilon
+            if fase_uno:
+                terminados |= T[:, m, -1] >= -self.tolerancia_factibilidad
+
+            # Prueba de la razón; las artificiales básicas (fijas en cero en la Fase II)
+            # salen en cuanto la columna entrante tiene coeficiente no nulo en su fila
+            columna = T[r, :m, col]
+            validos = columna > self.tolerancia_pivote
+            razones = np.full(columna.shape, np.inf)
+            np.divide(np.maximum(T[:, :m, -1], 0.0), columna, out=razones, where=validos)
+            if not fase_uno:
+                artificiales = self._es_artificial[basicas] & (np.abs(columna) > self.tolerancia_pivote)
+                razones[artificiales] = 0.0
+            fila = np.argmin(razones, axis=1)
+            no_acotados = ~terminados & (razones[r, fila] == np.inf)
+            agotados = ~terminados & ~no_acotados & (iteraciones >= self.max_iteraciones)
+
+            fin = terminados | no_acotados | agotados
+            if fin.any():
+                optimos[idx[terminados]] = True
+                self.estados[idx[no_acotados]] = NO_ACOTADO
+                self.estados[idx[agotados]] = MAX_ITERACIONES
+                self.tableau[idx[fin]] = T[fin]
+                self.vars_basicas[idx[fin]] = basicas[fin]
+                self.iteraciones[idx[fin]] = iteraciones[fin]
+                sigue = ~fin
+                idx, T, basicas, iteraciones = idx[sigue], T[sigue], basicas[sigue], iteraciones[sigue]
+                fila, col = fila[sigue], col[sigue]
+                r = np.arange(len(idx))
+                if len(idx) == 0:
+                    break
+
+            # T -= columna ⊗ fila_pivote / pivote, para todos los problemas a la vez
+            fila_pivote = T[r, fila, :] / T[r, fila, col][:, np.newaxis]
+            columna = T[r, :, col]
+            columna[r, fila] = 0.0
+            T -= columna[:, :, np.newaxis] * fila_pivote[:, np.newaxis, :]
+            T[r, fila, :] = fila_pivote
+            T[r, :, col] = 0.0
+            T[r, fila, col] = 1.0
+
+            basicas[r, fila] = col
+            iteraciones += 1
+
+        return optimos
+
+    def resolver(self):
+        """
+        Resuelve todos los problemas del lote
+
+        Returns:
+            tuple: (soluciones k×n, valores objetivo k, códigos de estado k)
+        """
+        k, m, n = self.num_problemas, self.num_restricciones, self.num_variables
+        self._crear_tableaux()
+        self.iteraciones[:] = 0
+        self.estados[:] = MAX_ITERACIONES
+        todos = np.arange(k)
+
+        # Fase I solo para los problemas con artificiales en la base inicial
+        con_artificiales = self._es_artificial[self.vars_basicas].any(axis=1)
+        if con_artificiales.any():
+            costos = np.zeros((k, n + 2 * m))
+            costos[:, n + m:] = -1.0
+            fase_uno = np.flatnonzero(con_artificiales)
+            self._establecer_fila_objetivo(costos[fase_uno], fase_uno)
+            optimos_fase_uno = self._iterar(con_artificiales, fase_uno=True)
+            # Infactible solo si la Fase I llegó a su óptimo con objetivo negativo; los
+            # que agotaron las iteraciones conservan MAX_ITERACIONES y no pasan a la Fase II
+            infactibles = optimos_fase_uno & (self.tableau[:, m, -1] < -self.tolerancia_factibilidad)
+            self.estados[infactibles] = INFACTIBLE
+            activos = ~con_artificiales | (optimos_fase_uno & ~infactibles)
+        else:
+            activos = np.ones(k, dtype=bool)
+
+        # Fase II con los costos originales; las artificiales no vuelven a entrar
+        if activos.any():
+            self._establecer_fila_objetivo(self.c[activos], todos[activos])
+            optimos = self._iterar(activos)
+            self.estados[optimos] = OPTIMO
+
+        valores_basicos = self.tableau[:, :m, -1]
+        soluciones = np.zeros((k, n + 2 * m))
+        np.put_along_axis(soluciones, self.vars_basicas, valores_basicos, axis=1)
+        soluciones = soluciones[:, :n]
+
+        valores = np.einsum("pj,pj->p", self.c, soluciones)
+        if self.tipo_problema == "min":
+            valores = -valores
+        no_optimos = self.estados != OPTIMO
+        valores[no_optimos] = np.nan
+        return soluciones, valores, self.estados.copy()
+
+
+def resolver_lote(c, A, b, desigualdades, tipo_problema="max", max_iteraciones=100):
+    """Atajo para SimplexLotes(...).resolver(); ver SimplexLotes para los formatos de entrada"""
+    return SimplexLotes(c, A, b, desigualdades, tipo_problema, max_iteraciones).resolver()
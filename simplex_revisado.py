@@ -0,0 +1,489 @@
+import numpy as np
+from matriz_dispersa import MatrizCSC
+from estrategias_pricing import crear_estrategia
+from eventos_simplex import EventoSimplex, PIVOTE, ITERACION
+
+# Resultado de la prueba de la razón cuando la variable entrante llega a su propia cota
+CAMBIO_DE_COTA = -2
+
+# Filas por bloque en las sustituciones triangulares de FactorizacionBase
+TAM_BLOQUE = 64
+
+
+class FactorizacionBase:
+    """
+    Factorización LU de la matriz base con actualizaciones en forma producto (eta)
+
+    La base se factoriza como P·B = L·U. Cada cambio de base agrega una matriz eta
+    en lugar de refactorizar; cada `frecuencia_refactorizacion` actualizaciones
+    la base se vuelve a factorizar desde cero para acotar el error numérico.
+
+    L y U se guardan juntas en una sola matriz densa m×m (L sin su diagonal
+    unitaria, debajo de la de U), así que la memoria es de 8·m² bytes (unos 72 MB
+    con m = 3000) y una refactorización cuesta hasta O(m³) si la base es densa;
+    con bases casi lógicas solo se recorren las filas con multiplicador no nulo.
+    """
+
+    def __init__(self, frecuencia_refactorizacion=64, epsilon=1e-12):
+        self.frecuencia_refactorizacion = frecuencia_refactorizacion
+        self.epsilon = epsilon
+        self.LU = None                  # U en el triángulo superior, L (sin diagonal) debajo
+        self.inversas_L = None          # Inversas de los bloques diagonales de L
+        self.inversas_U = None          # Inversas de los bloques diagonales de U
+        self.permutacion = None         # Permutación de filas P
+        self.etas = []                  # Lista de (fila, columna d) en forma producto
+        self.num_refactorizaciones = 0
+
+    def factorizar(self, B):
+        """Calcula P·B = L·U con pivoteo parcial (sobre B si ya es un arreglo de floats)"""
+        LU = np.asarray(B, dtype=float)
+        m = LU.shape[0]
+        permutacion = np.arange(m)
+
+        for k in range(m - 1):
+            p = k + int(np.argmax(np.abs(LU[k:, k])))
+            if abs(LU[p, k]) <= self.epsilon:
+                raise np.linalg.LinAlgError("La matriz base es singular")
+            if p != k:
+                LU[[k, p]] = LU[[p, k]]
+                permutacion[[k, p]] = permutacion[[p, k]]
+
+            # Solo se actualizan las filas con multiplicador no nulo (bases casi lógicas)
+            filas = k + 1 + np.flatnonzero(LU[k + 1:, k])
+            if len(filas) > 0:
+                multiplicadores = LU[filas, k] / LU[k, k]
+                LU[filas, k] = multiplicadores
+                LU[filas, k + 1:] -= np.outer(multiplicadores, LU[k, k + 1:])
+
+        if m > 0 and abs(LU[m - 1, m - 1]) <= self.epsilon:
+            raise np.linalg.LinAlgError("La matriz base es singular")
+
+        self.LU, self.permutacion = LU, permutacion
+        self.inversas_L, self.inversas_U = _inversas_diagonales(LU)
+        self.etas = []
+        self.num_refactorizaciones += 1
+
+    def necesita_refactorizar(self):
+        """Indica si ya se acumularon suficientes etas para refactorizar"""
+        return len(self.etas) >= self.frecuencia_refactorizacion
+
+    def ftran(self, a):
+        """Resuelve B·x = a"""
+        x = self._resolver_lu(np.asarray(a, dtype=float)[self.permutacion])
+        for r, d in self.etas:
+            if x[r] != 0.0:
+                x_r = x[r] / d[r]
+                x -= x_r * d
+                x[r] = x_r
+        return x
+
+    def btran(self, c):
+        """Resuelve Bᵀ·y = c"""
+        v = np.array(c, dtype=float)
+        for r, d in reversed(self.etas):
+            v[r] = (v[r] - (v @ d - v[r] * d[r])) / d[r]
+
+        # Uᵀ·w = v, luego Lᵀ·z = w (por bloques) y finalmente y = Pᵀ·z
+        m = len(v)
+        bloques = range(0, m, TAM_BLOQUE)
+        for k, inicio in enumerate(bloques):
+            fin = min(inicio + TAM_BLOQUE, m)
+            if v[inicio:fin].any():
+                v[inicio:fin] = self.inversas_U[k].T @ v[inicio:fin]
+                v[fin:] -= self.LU[inicio:fin, fin:].T @ v[inicio:fin]
+        for k, inicio in reversed(list(enumerate(bloques))):
+            fin = min(inicio + TAM_BLOQUE, m)
+            if v[inicio:fin].any():
+                v[inicio:fin] = self.inversas_L[k].T @ v[inicio:fin]
+                v[:inicio] -= self.LU[inicio:fin, :inicio].T @ v[inicio:fin]
+
+        y = np.empty(m)
+        y[self.permutacion] = v
+        return y
+
+    def actualizar(self, fila, d):
+        """Registra el cambio de base en la fila dada, con d = B⁻¹·a_entrante"""
+        self.etas.append((fila, d.copy()))
+
+    def _resolver_lu(self, x):
+        """
+        Sustitución hacia adelante (L) y hacia atrás (U) in situ
+
+        Se recorre por bloques de TAM_BLOQUE filas: cada bloque se resuelve con la
+        inversa de su bloque diagonal y se descuenta del resto con un producto
+        matriz-vector, así que el costo es O(m²) sin un ciclo de Python por fila.
+        """
+        m = len(x)
+        bloques = range(0, m, TAM_BLOQUE)
+        for k, inicio in enumerate(bloques):
+            fin = min(inicio + TAM_BLOQUE, m)
+            if x[inicio:fin].any():
+                x[inicio:fin] = self.inversas_L[k] @ x[inicio:fin]
+                x[fin:] -= self.LU[fin:, inicio:fin] @ x[inicio:fin]
+        for k, inicio in reversed(list(enumerate(bloques))):
+            fin = min(inicio + TAM_BLOQUE, m)
+            if x[inicio:fin].any():
+                x[inicio:fin] = self.inversas_U[k] @ x[inicio:fin]
+                x[:inicio] -= self.LU[:inicio, inicio:fin] @ x[inicio:fin]
+        return x
+
+
+def _inversas_diagonales(LU):
+    """Inversas de los bloques diagonales TAM_BLOQUE×TAM_BLOQUE de L y de U"""
+    inversas_L, inversas_U = [], []
+    for inicio in range(0, LU.shape[0], TAM_BLOQUE):
+        bloque = LU[inicio:inicio + TAM_BLOQUE, inicio:inicio + TAM_BLOQUE]
+        inversas_L.append(np.linalg.inv(np.tril(bloque, -1) + np.eye(len(bloque))))
+        inversas_U.append(np.linalg.inv(np.triu(bloque)))
+    return inversas_L, inversas_U
+
+
+class SimplexRevisado:
+    """
+    Motor del método simplex revisado
+
+    Solo conserva la matriz original A (m×n) y describe las columnas de holgura y
+    artificiales de forma implícita (vector unitario con signo). Las columnas se
+    obtienen bajo demanda y la base se maneja con FactorizacionBase: ftran y btran
+    cuestan O(m²) por iteración en lugar de actualizar un tableau de m·(n+m).
+    El pricing agrega yᵀ·a_j: con Dantzig, Devex o steepest edge para todas las
+    columnas (nnz(A)), con pricing parcial solo para los segmentos que revisa, que
+    es lo que conviene en problemas anchos (n mucho mayor que m).
+    """
+
+    def __init__(self, A, b, c, filas_logicas, signos_logicos, vars_basicas,
+                 epsilon=1e-12, tolerancia_pivote=1e-9, max_iteraciones=100, frecuencia_refactorizacion=64,
+                 pricing=None, cotas_superiores=None, verbose=False, al_evento=None, cancelacion=None):
+        """
+        Args:
+            A: Matriz de restricciones original (m×n), densa o MatrizCSC, sin
+               holguras ni artificiales. Una MatrizCSC nunca se densifica.
+            b: Vector de lado derecho (no negativo)
+            c: Costos en forma de maximización para todas las columnas (n + lógicas)
+            filas_logicas: Fila donde cada columna lógica tiene su único coeficiente
+            signos_logicos: Coeficiente (+1/-1) de cada columna lógica
+            vars_basicas: Índices de la base inicial, uno por fila
+            tolerancia_pivote: Magnitud mínima de un elemento pivote
+            pricing: Estrategia de pricing (ver estrategias_pricing); Dantzig por defecto
+            cotas_superiores: Cota superior de cada columna (inf = sin cota); las
+               variables en su cota se sustituyen por u_j - x_j (columna con signo -1)
+            al_evento: Función que recibe un EventoSimplex por pivote e iteración
+            cancelacion: threading.Event; si se activa, se detiene antes del próximo pivote
+        """
+        self.A = A
+        self.b = np.asarray(b, dtype=float)
+        self.c = np.asarray(c, dtype=float)
+        self.filas_logicas = np.asarray(filas_logicas, dtype=np.intp)
+        self.signos_logicos = np.asarray(signos_logicos, dtype=float)
+        self.num_restricciones, self.num_estructurales = A.shape
+        self.total_vars = self.num_estructurales + len(self.filas_logicas)
+        self.vars_basicas = np.array(vars_basicas, dtype=np.intp)
+        self.epsilon = epsilon
+        self.tolerancia_pivote = tolerancia_pivote
+        self.max_iteraciones = max_iteraciones
+        self.verbose = verbose
+        self.al_evento = al_evento
+        self.cancelacion = cancelacion
+        self.factorizacion = FactorizacionBase(frecuencia_refactorizacion, epsilon)
+        self.x_basicas = None
+        self.iteraciones = 0
+        self.estado = None
+        self.objetivo_meta = None       # Si se alcanza este valor, se detiene (Fase I)
+        self.pricing = crear_estrategia(pricing)
+        self._pricing_inicializado = False
+
+        self._es_dispersa = isinstance(A, MatrizCSC)
+        self._es_basica = np.zeros(self.total_vars, dtype=bool)
+        self._es_basica[self.vars_basicas] = True
+        self._excluidas = np.zeros(self.total_vars, dtype=bool)
+
+        if cotas_superiores is None:
+            self.cotas = np.full(self.total_vars, np.inf)
+        else:
+            self.cotas = np.asarray(cotas_superiores, dtype=float)
+        self._hay_cotas = bool(np.isfinite(self.cotas).any())
+        self.invertida = np.zeros(self.total_vars, dtype=bool)
+        self._signos = np.ones(self.total_vars)
+        self._b_efectivo = self.b.copy()
+        self._sale_en_cota_superior = False
+
+    def columna(self, j):
+        """Devuelve la columna j de la forma estándar como vector denso"""
+        if j < self.num_estructurales:
+            if self._es_dispersa:
+                col = self.A.columna(j)
+            else:
+                col = np.array(self.A[:, j], dtype=float)
+        else:
+            k = j - self.num_estructurales
+            col = np.zeros(self.num_restricciones)
+            col[self.filas_logicas[k]] = self.signos_logicos[k]
+        if self.invertida[j]:
+            col = -col
+        return col
+
+    def _matriz_base(self):
+        """Construye la matriz base B a partir de las columnas básicas"""
+        B = np.empty((self.num_restricciones, self.num_restricciones))
+        for i, j in enumerate(self.vars_basicas):
+            B[:, i] = self.columna(j)
+        return B
+
+    def _refactorizar(self):
+        """Refactoriza la base y recalcula los valores básicos"""
+        self.factorizacion.factorizar(self._matriz_base())
+        self.x_basicas = self.factorizacion.ftran(self._b_efectivo)
+
+    def producto_fila(self, y):
+        """Calcula yᵀ·a_j para todas las columnas (estructurales y lógicas)"""
+        producto = np.empty(self.total_vars)
+        n = self.num_estructurales
+        if self._es_dispersa:
+            producto[:n] = self.A.producto_transpuesto(y)
+        else:
+            producto[:n] = self.A.T @ y
+        producto[n:] = self.signos_logicos * y[self.filas_logicas]
+        return producto * self._signos
+
+    def costos_reducidos(self, y):
+        """Calcula d_j = c_j - yᵀ·a_j para todas las columnas (cero en básicas y excluidas)"""
+        d = self._costos_efectivos() - self.producto_fila(y)
+        d[self._es_basica] = 0.0
+        d[self._excluidas] = 0.0
+        return d
+
+    def costos_reducidos_columnas(self, y, columnas):
+        """Calcula d_j = c_j - yᵀ·a_j solo para las columnas indicadas (cero en básicas y excluidas)"""
+        columnas = np.asarray(columnas, dtype=np.intp)
+        n = self.num_estructurales
+        producto = np.empty(len(columnas))
+        estructurales = columnas < n
+        if self._es_dispersa:
+            producto[estructurales] = self.A.producto_transpuesto_columnas(y, columnas[estructurales])
+        else:
+            producto[estructurales] = self.A[:, columnas[estructurales]].T @ y
+        logicas = columnas[~estructurales] - n
+        producto[~estructurales] = self.signos_logicos[logicas] * y[self.filas_logicas[logicas]]
+        d = (self.c[columnas] - producto) * self._signos[columnas]
+        d[self._es_basica[columnas] | self._excluidas[columnas]] = 0.0
+        return d
+
+    def _costos_efectivos(self):
+        """Costos de las columnas tal como están en la base (con signo si están invertidas)"""
+        return self.c * self._signos
+
+    def _invertir(self, j, direccion):
+        """
+        Cambio de cota de la no básica j: x_j pasa a u_j - x_j
+        
+        Args:
+            direccion: B⁻¹·a_j con el signo actual de la columna
+        """
+        u = self.cotas[j]
+        self._b_efectivo -= u * self.columna(j)
+        self.x_basicas -= u * direccion
+        self.invertida[j] = not self.invertida[j]
+        self._signos[j] = -self._signos[j]
+
+    def establecer_invertidas(self, columnas):
+        """Arranca con las no básicas indicadas en su cota superior (columna con signo -1)"""
+        for j in columnas:
+            self._b_efectivo -= self.cotas[j] * self.columna(j)
+            self.invertida[j] = True
+            self._signos[j] = -1.0
+
+    def base_factible(self, tolerancia):
+        """Factoriza la base actual e indica si sus valores básicos cumplen 0 <= x_B <= u"""
+        self._refactorizar()
+        cotas = self.cotas[self.vars_basicas]
+        return bool((self.x_basicas >= -tolerancia).all()
+                    and (self.x_basicas <= cotas + tolerancia).all())
+
+    def cambiar_costos(self, c, excluidas=None):
+        """
+        Reemplaza el vector de costos conservando la base (p. ej. al pasar a la Fase II)
+        
+        Args:
+            excluidas: Máscara de columnas que ya no pueden entrar a la base
+        """
+        self.c = np.asarray(c, dtype=float)
+        if excluidas is not None:
+            self._excluidas = np.asarray(excluidas, dtype=bool).copy()
+
+    def expulsar_variables(self, mascara):
+        """
+        Saca de la base las variables marcadas que estén en nivel cero mediante
+        pivoteos degenerados; si su fila es redundante, la variable se queda
+        """
+        if not self._pricing_inicializado:
+            self._inicializar_pricing()
+        for fila in np.flatnonzero(mascara[self.vars_basicas]):
+            e = np.zeros(self.num_restricciones)
+            e[fila] = 1.0
+            alfa = np.abs(self.producto_fila(self.factorizacion.btran(e)))
+            alfa[mascara | self._es_basica] = 0.0
+            entrante = int(np.argmax(alfa))
+            if alfa[entrante] <= self.tolerancia_pivote:
+                continue
+            direccion = self.factorizacion.ftran(self.columna(entrante))
+            self._actualizar_pricing(fila, entrante, direccion)
+            self._pivotear(fila, entrante, direccion)
+
+    def _inicializar_pricing(self):
+        """Prepara la estrategia de pricing; las normas exactas solo se conocen para bases lógicas"""
+        normas = None
+        if self.pricing.usa_normas and (self.vars_basicas >= self.num_estructurales).all():
+            # Con una base de columnas lógicas ||B⁻¹·a_j|| = ||a_j||
+            normas = np.ones(self.total_vars)
+            if self._es_dispersa:
+                normas[:self.num_estructurales] += np.bincount(
+                    self.A.columnas_de_entradas(), weights=self.A.datos ** 2,
+                    minlength=self.num_estructurales)
+            else:
+                normas[:self.num_estructurales] += np.einsum("ij,ij->j", self.A, self.A)
+        self.pricing.inicializar(self.total_vars, normas)
+        self._pricing_inicializado = True
+
+    def _seleccionar_entrante(self, y):
+        """
+        Elige la columna entrante con la estrategia de pricing (convención del tableau: -d)
+
+        Con pricing parcial solo se calculan los costos reducidos de las columnas
+        que la estrategia revisa; las demás reglas necesitan el vector completo.
+        """
+        if self.pricing.por_columnas:
+            return self.pricing.seleccionar_por_columnas(
+                lambda columnas: -self.costos_reducidos_columnas(y, columnas),
+                self.total_vars, self.epsilon)
+        return self.pricing.seleccionar(-self.costos_reducidos(y), self.epsilon)
+
+    def _actualizar_pricing(self, fila, entrante, direccion):
+        """Entrega a la estrategia los datos del pivote que necesite"""
+        alfa_fila = productos = None
+        if self.pricing.usa_fila_pivote:
+            e = np.zeros(self.num_restricciones)
+            e[fila] = 1.0
+            alfa_fila = self.producto_fila(self.factorizacion.btran(e))
+        if self.pricing.usa_productos:
+            productos = self.producto_fila(self.factorizacion.btran(direccion))
+        self.pricing.actualizar(fila, entrante, int(self.vars_basicas[fila]),
+                                direccion, alfa_fila, productos)
+
+    def _seleccionar_saliente(self, direccion, entrante):
+        """
+        Prueba de la razón mínima sobre x_B / d, recorriendo solo las filas con d > 0
+        
+        Con cotas también limitan el paso las básicas que suben a su cota superior y
+        la propia entrante (en ese caso devuelve CAMBIO_DE_COTA).
+        """
+        self._sale_en_cota_superior = False
+        fila, paso = -1, np.inf
+        
+        candidatos = np.flatnonzero(direccion > self.tolerancia_pivote)
+        if len(candidatos) > 0:
+            # Los valores básicos negativos solo pueden venir del redondeo: se tratan como cero
+            razones = np.maximum(self.x_basicas[candidatos], 0.0) / direccion[candidatos]
+            k = int(np.argmin(razones))
+            fila, paso = int(candidatos[k]), razones[k]
+        
+        if self._hay_cotas:
+            cotas = self.cotas[self.vars_basicas]
+            candidatos = np.flatnonzero((direccion < -self.tolerancia_pivote) & np.isfinite(cotas))
+            if len(candidatos) > 0:
+                razones = (np.maximum(cotas[candidatos] - self.x_basicas[candidatos], 0.0)
+                           / -direccion[candidatos])
+                k = int(np.argmin(razones))
+                if razones[k] < paso:
+                    fila, paso = int(candidatos[k]), razones[k]
+                    self._sale_en_cota_superior = True
+            
+            if np.isfinite(self.cotas[entrante]) and self.cotas[entrante] <= paso:
+                self._sale_en_cota_superior = False
+                return CAMBIO_DE_COTA
+        
+        return fila
+
+    def resolver(self):
+        """
+        Ejecuta el simplex revisado desde la base inicial
+
+        Returns:
+            str: "optimo", "no_acotado", "max_iteraciones" o "cancelado"
+        """
+        self._refactorizar()
+        if not self._pricing_inicializado:
+            self._inicializar_pricing()
+
+        while self.iteraciones < self.max_iteraciones:
+            if self.cancelacion is not None and self.cancelacion.is_set():
+                self.estado = "cancelado"
+                return self.estado
+            if self.objetivo_meta is not None and self.valor_objetivo() >= self.objetivo_meta:
+                self.estado = "optimo"
+                return self.estado
+            
+            y = self.factorizacion.btran(self._costos_efectivos()[self.vars_basicas])
+            entrante = self._seleccionar_entrante(y)
+            if entrante == -1:
+                self.estado = "optimo"
+                return self.estado
+
+            direccion = self.factorizacion.ftran(self.columna(entrante))
+            fila = self._seleccionar_saliente(direccion, entrante)
+            if fila == -1:
+                self.estado = "no_acotado"
+                return self.estado
+
+            if fila == CAMBIO_DE_COTA:
+                if self.verbose:
+                    print(f"\nCambio de cota: x{entrante+1} pasa a su otra cota")
+                self._invertir(entrante, direccion)
+                self.iteraciones += 1
+                if self.al_evento is not None:
+                    self.al_evento(EventoSimplex(ITERACION, self.iteraciones, columna=entrante,
+                                                 direccion=direccion))
+                continue
+
+            if self.verbose:
+                print(f"\nPivote: Fila {fila+1}, Columna {entrante+1}")
+                print(f"  Elemento pivote: {direccion[fila]:.4f}")
+            if self.al_evento is not None:
+                self.al_evento(EventoSimplex(PIVOTE, self.iteraciones, fila=fila, columna=entrante,
+                                             elemento=direccion[fila], direccion=direccion))
+
+            self._actualizar_pricing(fila, entrante, direccion)
+            self._pivotear(fila, entrante, direccion)
+            self.iteraciones += 1
+            if self.al_evento is not None:
+                self.al_evento(EventoSimplex(ITERACION, self.iteraciones, fila=fila, columna=entrante,
+                                             direccion=direccion))
+
+        self.estado = "max_iteraciones"
+        return self.estado
+
+    def _pivotear(self, fila, entrante, direccion):
+        """Actualiza valores básicos, base y factorización tras un cambio de base"""
+        theta = self.x_basicas[fila] / direccion[fila]
+        self.x_basicas -= theta * direccion
+        self.x_basicas[fila] = theta
+
+        saliente = self.vars_basicas[fila]
+        self.vars_basicas[fila] = entrante
+        self._es_basica[saliente] = False
+        self._es_basica[entrante] = True
+
+        if self.factorizacion.necesita_refactorizar():
+            self._refactorizar()
+        else:
+            self.factorizacion.actualizar(fila, direccion)
+
+        # La básica que llegó a su cota superior sale como no básica en esa cota
+        if self._sale_en_cota_superior:
+            self._sale_en_cota_superior = False
+            self._invertir(saliente, self.factorizacion.ftran(self.columna(saliente)))
+
+    def valor_objetivo(self):
+        """Valor de la función objetivo (forma de maximización) en la base actual"""
+        valor = self._costos_efectivos()[self.vars_basicas] @ self.x_basicas
+        valor += self.c[self.invertida] @ self.cotas[self.invertida]
+        return float(valor)
@@ -0,0 +1,367 @@
+"""
+Grilla virtualizada para ingresar restricciones
+
+Un solo Canvas dibuja únicamente las celdas visibles a partir de un
+ModeloRestricciones; al desplazarse o cambiar los datos se vuelven a dibujar solo
+esas celdas. Para editar se usa una única Entry que se ubica sobre la celda
+activa, así que la cantidad de widgets no depende del tamaño del problema.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+from modelo_restricciones import DESIGUALDADES, ModeloRestricciones
+
+ANCHO_CELDA = 64
+ANCHO_ETIQUETA = 44         # Columna con el número de restricción
+ANCHO_ELIMINAR = 28         # Columna con el botón ✕ de cada fila
+ALTO_CELDA = 24
+COLOR_INVALIDA = "#ffcdd2"
+COLOR_ACTIVA = "#c8e6c9"
+COLOR_ENCABEZADO = "#eeeeee"
+
+
+class TablaRestricciones(ttk.Frame):
+    """
+    Grilla de restricciones: x1 … xn, desigualdad, lado derecho y eliminar
+
+    Teclado: flechas, Tab y Enter se mueven entre celdas; escribir o F2 edita la
+    celda activa; Ctrl+V pega un bloque desde la celda activa; en la columna de
+    desigualdad, espacio o clic la cambian.
+    """
+
+    def __init__(self, padre, modelo=None, al_eliminar=None):
+        """
+        Args:
+            modelo: ModeloRestricciones a mostrar (se crea uno vacío si es None)
+            al_eliminar: Función que recibe el índice de la fila a eliminar
+        """
+        super().__init__(padre)
+        self.modelo = modelo or ModeloRestricciones()
+        self.al_eliminar = al_eliminar
+        self.activa = (0, 0)            # (fila, columna) de la celda activa
+        self._editando = None           # Celda que se está editando con la Entry
+
+        self.canvas = tk.Canvas(self, background="white", highlightthickness=1,
+                                highlightbackground="#bdbdbd", takefocus=True)
+        barra_vertical = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._desplazar_y)
+        barra_horizontal = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self._desplazar_x)
+        self.canvas.configure(yscrollcommand=barra_vertical.set, xscrollcommand=barra_horizontal.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        barra_vertical.grid(row=0, column=1, sticky="ns")
+        barra_horizontal.grid(row=1, column=0, sticky="ew")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.editor = ttk.Entry(self.canvas, width=1)
+        self.editor.bind("<Return>", lambda e: self._terminar_edicion(1, 0))
+        self.editor.bind("<KP_Enter>", lambda e: self._terminar_edicion(1, 0))
+        self.editor.bind("<Tab>", lambda e: self._terminar_edicion(0, 1))
+        self.editor.bind("<Shift-Tab>", lambda e: self._terminar_edicion(0, -1))
+        self.editor.bind("<ISO_Left_Tab>", lambda e: self._terminar_edicion(0, -1))
+        self.editor.bind("<Up>", lambda e: self._terminar_edicion(-1, 0))
+        self.editor.bind("<Down>", lambda e: self._terminar_edicion(1, 0))
+        self.editor.bind("<Escape>", lambda e: self._cancelar_edicion())
+        self.editor.bind("<FocusOut>", lambda e: self._terminar_edicion(0, 0, enfocar=False))
+        self.editor.bind("<<Paste>>", self._pegar_en_editor)
+
+        self.canvas.bind("<Configure>", lambda e: self.redibujar())
+        self.canvas.bind("<Button-1>", self._clic)
+        self.canvas.bind("<Double-Button-1>", lambda e: self.editar())
+        self.canvas.bind("<MouseWheel>", self._rueda)
+        self.canvas.bind("<Shift-MouseWheel>", self._rueda_horizontal)
+        self.canvas.bind("<Button-4>", lambda e: self._desplazar_y("scroll", -3, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self._desplazar_y("scroll", 3, "units"))
+        self.canvas.bind("<Key>", self._tecla)
+        for evento in ("<<Paste>>", "<Control-v>", "<Control-V>"):
+            self.canvas.bind(evento, lambda e: self.pegar_portapapeles())
+        for tecla, paso in (("<Up>", (-1, 0)), ("<Down>", (1, 0)), ("<Left>", (0, -1)),
+                            ("<Right>", (0, 1)), ("<Return>", (1, 0)), ("<Tab>", (0, 1)),
+                            ("<Shift-Tab>", (0, -1)), ("<ISO_Left_Tab>", (0, -1))):
+            self.canvas.bind(tecla, lambda e, paso=paso: self._mover(*paso))
+        self.canvas.bind("<F2>", lambda e: self.editar())
+        self.canvas.bind("<Delete>", lambda e: self._borrar_celda())
+
+        self.actualizar()
+
+    # -- Geometría -------------------------------------------------------
+
+    @property
+    def _col_desigualdad(self):
+        return self.modelo.num_variables
+
+    @property
+    def _col_rhs(self):
+        return self.modelo.num_variables + 1
+
+    @property
+    def _num_columnas(self):
+        """Columnas navegables: coeficientes, desigualdad y lado derecho"""
+        return self.modelo.num_variables + 2
+
+    def _x_columna(self, columna):
+        return ANCHO_ETIQUETA + columna * ANCHO_CELDA
+
+    def _y_fila(self, fila):
+        return ALTO_CELDA + fila * ALTO_CELDA
+
+    def _tamano(self):
+        return (ANCHO_ETIQUETA + self._num_columnas * ANCHO_CELDA + ANCHO_ELIMINAR,
+                ALTO_CELDA * (self.modelo.num_filas + 1))
+
+    def _celda_en(self, x, y):
+        """(fila, columna) bajo un punto del canvas; columna _num_columnas = eliminar"""
+        if x < ANCHO_ETIQUETA or y < ALTO_CELDA:
+            return None                 # Encabezados fijos
+        x, y = self.canvas.canvasx(x), self.canvas.canvasy(y)
+        fila = int((y - ALTO_CELDA) // ALTO_CELDA)
+        columna = int((x - ANCHO_ETIQUETA) // ANCHO_CELDA)
+        if not 0 <= fila < self.modelo.num_filas or columna > self._num_columnas:
+            return None
+        if columna == self._num_columnas and x > self._x_columna(columna) + ANCHO_ELIMINAR:
+            return None
+        return fila, columna
+
+    # -- Dibujo ----------------------------------------------------------
+
+    def actualizar(self):
+        """Ajusta el área desplazable a los datos y redibuja (después de cambiar el modelo)"""
+        ancho, alto = self._tamano()
+        self.canvas.configure(scrollregion=(0, 0, ancho, alto))
+        fila, columna = self.activa
+        self.activa = (max(0, min(fila, self.modelo.num_filas - 1)),
+                       max(0, min(columna, self._num_columnas - 1)))
+        self.redibujar()
+
+    def redibujar(self):
+        """Dibuja solo las celdas visibles y los encabezados fijos"""
+        c = self.canvas
+        c.delete("celda")
+        x0, y0 = c.canvasx(0), c.canvasy(0)
+        x1, y1 = x0 + c.winfo_width(), y0 + c.winfo_height()
+        modelo = self.modelo
+
+        primera_fila = max(0, int(y0 // ALTO_CELDA))
+        ultima_fila = min(modelo.num_filas, int((y1 - ALTO_CELDA) // ALTO_CELDA) + 1)
+        primera_col = max(0, int(x0 // ANCHO_CELDA))
+        ultima_col = min(self._num_columnas, int((x1 - ANCHO_ETIQUETA) // ANCHO_CELDA) + 1)
+        fila_activa, col_activa = self.activa
+
+        for i in range(primera_fila, ultima_fila):
+            y = self._y_fila(i)
+            textos, invalidas = modelo.textos[i], modelo.invalidas[i]
+            for j in range(primera_col, ultima_col):
+                x = self._x_columna(j)
+                if j == self._col_desigualdad:
+                    texto, invalida = modelo.desigualdades[i], False
+                else:
+                    k = j if j < self._col_desigualdad else j - 1
+                    texto, invalida = textos[k], invalidas[k]
+                fondo = (COLOR_ACTIVA if (i, j) == (fila_activa, col_activa)
+                         else COLOR_INVALIDA if invalida
+                         else COLOR_ENCABEZADO if j == self._col_desigualdad else "white")
+                c.create_rectangle(x, y, x + ANCHO_CELDA, y + ALTO_CELDA, fill=fondo,
+                                   outline="#d0d0d0", tags="celda")
+                c.create_text(x + ANCHO_CELDA - 4, y + ALTO_CELDA // 2, text=texto, anchor="e",
+                              font=("Arial", 9), tags="celda")
+            if ultima_col == self._num_columnas:
+                x = self._x_columna(self._num_columnas)
+                c.create_text(x + ANCHO_ELIMINAR // 2, y + ALTO_CELDA // 2, text="✕",
+                              fill="#f44336", font=("Arial", 10, "bold"), tags="celda")
+
+        # Encabezados encima de las celdas, fijos al borde visible
+        c.create_rectangle(x0, y0, x1, y0 + ALTO_CELDA, fill=COLOR_ENCABEZADO, outline="",
+                           tags="celda")
+        for j in range(primera_col, ultima_col):
+            x = self._x_columna(j)
+            titulo = ("" if j == self._col_desigualdad else "b" if j == self._col_rhs
+                      else f"x{j + 1}")
+            c.create_text(x + ANCHO_CELDA // 2, y0 + ALTO_CELDA // 2, text=titulo,
+                          font=("Arial", 9, "bold"), tags="celda")
+        c.create_rectangle(x0, y0, x0 + ANCHO_ETIQUETA, y1, fill=COLOR_ENCABEZADO, outline="",
+                           tags="celda")
+        for i in range(primera_fila, ultima_fila):
+            c.create_text(x0 + ANCHO_ETIQUETA // 2, self._y_fila(i) + ALTO_CELDA // 2,
+                          text=f"R{i + 1}", font=("Arial", 9, "bold"), tags="celda")
+
+        if self._editando is not None:
+            self._ubicar_editor()
+
+    def _desplazar_y(self, *args):
+        self.canvas.yview(*args)
+        self.redibujar()
+
+    def _desplazar_x(self, *args):
+        self.canvas.xview(*args)
+        self.redibujar()
+
+    def _rueda(self, event):
+        self._desplazar_y("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def _rueda_horizontal(self, event):
+        self._desplazar_x("scroll", -1 if event.delta > 0 else 1, "units")
+
+    def ver_celda(self, fila, columna):
+        """Desplaza la vista lo mínimo para que la celda quede visible"""
+        c = self.canvas
+        ancho, alto = self._tamano()
+        x0, y0 = c.canvasx(0), c.canvasy(0)
+        visible_x, visible_y = c.winfo_width(), c.winfo_height()
+        x, y = self._x_columna(columna), self._y_fila(fila)
+        if x < x0 + ANCHO_ETIQUETA:
+            c.xview_moveto((x - ANCHO_ETIQUETA) / ancho)
+        elif x + ANCHO_CELDA > x0 + visible_x:
+            c.xview_moveto((x + ANCHO_CELDA - visible_x) / ancho)
+        if y < y0 + ALTO_CELDA:
+            c.yview_moveto((y - ALTO_CELDA) / alto)
+        elif y + ALTO_CELDA > y0 + visible_y:
+            c.yview_moveto((y + ALTO_CELDA - visible_y) / alto)
+
+    # -- Edición ---------------------------------------------------------
+
+    def seleccionar(self, fila, columna):
+        self.activa = (fila, columna)
+        self.ver_celda(fila, columna)
+        self.redibujar()
+
+    def _mover(self, filas, columnas):
+        if self.modelo.num_filas == 0:
+            return "break"
+        fila, columna = self.activa
+        columna += columnas
+        if columna >= self._num_columnas:
+            fila, columna = fila + 1, 0
+        elif columna < 0:
+            fila, columna = fila - 1, self._num_columnas - 1
+        fila = max(0, min(fila + filas, self.modelo.num_filas - 1))
+        self.seleccionar(fila, columna)
+        return "break"
+
+    def _clic(self, event):
+        self.canvas.focus_set()
+        celda = self._celda_en(event.x, event.y)
+        if celda is None:
+            return
+        fila, columna = celda
+        if columna == self._num_columnas:
+            if self.al_eliminar:
+                self.al_eliminar(fila)
+            return
+        self.seleccionar(fila, columna)
+        if columna == self._col_desigualdad:
+            self._siguiente_desigualdad()
+
+    def _tecla(self, event):
+        if self.modelo.num_filas == 0:
+            return
+        if self.activa[1] == self._col_desigualdad:
+            if event.char in ("<", ">", "="):
+                self.modelo.establecer_desigualdad(self.activa[0], event.char)
+                self.redibujar()
+            elif event.char == " ":
+                self._siguiente_desigualdad()
+            return
+        if event.char and event.char.isprintable() and not event.state & 0x4:
+            self.editar(event.char)
+            return "break"
+
+    def _siguiente_desigualdad(self):
+        fila = self.activa[0]
+        actual = DESIGUALDADES.index(self.modelo.desigualdades[fila])
+        self.modelo.establecer_desigualdad(fila, DESIGUALDADES[(actual + 1) % len(DESIGUALDADES)])
+        self.redibujar()
+
+    def _indice_modelo(self, columna):
+        """Columna de modelo.textos para una columna de la grilla"""
+        return columna if columna < self._col_desigualdad else columna - 1
+
+    def editar(self, texto_inicial=None):
+        """Abre la Entry sobre la celda activa (con el texto tecleado, si hay)"""
+        fila, columna = self.activa
+        if self.modelo.num_filas == 0 or columna == self._col_desigualdad:
+            return
+        self._editando = (fila, columna)
+        self.editor.delete(0, tk.END)
+        if texto_inicial is None:
+            self.editor.insert(0, self.modelo.textos[fila, self._indice_modelo(columna)])
+            self.editor.select_range(0, tk.END)
+        else:
+            self.editor.insert(0, texto_inicial)
+        self.ver_celda(fila, columna)
+        self.redibujar()
+        self.editor.focus_set()
+
+    def _ubicar_editor(self):
+        fila, columna = self._editando
+        x = self._x_columna(columna) - self.canvas.canvasx(0)
+        y = self._y_fila(fila) - self.canvas.canvasy(0)
+        self.editor.place(x=x, y=y, width=ANCHO_CELDA, height=ALTO_CELDA)
+
+    def _terminar_edicion(self, filas, columnas, enfocar=True):
+        if self._editando is None:
+            return "break"
+        fila, columna = self._editando
+        self._editando = None
+        self.editor.place_forget()
+        if fila < self.modelo.num_filas:
+            self.modelo.establecer_texto(fila, self._indice_modelo(columna), self.editor.get())
+        if enfocar:
+            self.canvas.focus_set()
+            self._mover(filas, columnas)
+        else:
+            self.redibujar()
+        return "break"
+
+    def _cancelar_edicion(self):
+        self._editando = None
+        self.editor.place_forget()
+        self.canvas.focus_set()
+        self.redibujar()
+        return "break"
+
+    def _borrar_celda(self):
+        fila, columna = self.activa
+        if self.modelo.num_filas and columna != self._col_desigualdad:
+            self.modelo.establecer_texto(fila, self._indice_modelo(columna), "0")
+            self.redibujar()
+
+    def _pegar_en_editor(self, event):
+        """Un bloque de varias celdas se pega en la grilla; un valor suelto, en la Entry"""
+        try:
+            texto = self.clipboard_get()
+        except tk.TclError:
+            return "break"
+        if "\n" not in texto.strip() and "\t" not in texto:
+            return None
+        self._cancelar_edicion()
+        self.pegar(texto)
+        return "break"
+
+    def pegar_portapapeles(self):
+        try:
+            texto = self.clipboard_get()
+        except tk.TclError:
+            return "break"
+        self.pegar(texto)
+        return "break"
+
+    def pegar(self, texto):
+        """
+        Pega un bloque desde la celda activa (ver ModeloRestricciones.pegar)
+
+        Returns:
+            int: Filas pegadas
+        """
+        fila, columna = self.activa if self.modelo.num_filas else (0, 0)
+        if columna == self._col_desigualdad:
+            columna = self._col_rhs
+        filas = self.modelo.pegar(texto, fila, self._indice_modelo(columna))
+        self.actualizar()
+        return filas
+
+    def agregar_fila(self):
+        """Agrega una restricción y deja su primera celda lista para escribir"""
+        fila = self.modelo.agregar_filas()
+        self.actualizar()
+        self.seleccionar(fila, 0)
+        self.canvas.focus_set()
+        return fila
@@ -1,5 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
+from modelo_restricciones import ModeloRestricciones
+from tabla_restricciones import TablaRestricciones
 
 class SimplexVista:
     def __init__(self, root):
@@ -26,14 +28,22 @@ class SimplexVista:
         # Variables de la interfaz
         self.tipo_problema = tk.StringVar(value="max")
         self.entradas_coef_obj = []
-        self.entradas_restricciones = []
+        self.modelo_restricciones = ModeloRestricciones()
+        
+        # Visor del proceso: un resumen y una página por tableau, armada al mostrarla
+        self._texto_resumen = ""
+        self._num_tableaux = 0
+        self._obtener_tableau = None
+        self._tableau_actual = None     # None = página de resumen
         
         # Callbacks que serán asignados por el controlador
         self.callback_configurar_objetivo = None
         self.callback_agregar_restriccion = None
         self.callback_eliminar_restriccion = None
         self.callback_limpiar_restricciones = None
+        self.callback_importar_csv = None
         self.callback_resolver = None
+        self.callback_cancelar = None
         self.callback_exportar_imagenes = None
         self.callback_update_result_tab = None
         
@@ -103,6 +113,7 @@ class SimplexVista:
         """Construye toda la interfaz de usuario"""
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.notebook = notebook
 
         self.tab_config = ttk.Frame(notebook)
         self.tab_result = ttk.Frame(notebook)
@@ -145,9 +156,12 @@ class SimplexVista:
         self.area_coeficientes = ttk.LabelFrame(f, text="Función Objetivo")
         self.area_coeficientes.pack(fill=tk.X, padx=10, pady=5)
 
-        # Restricciones
-        self.area_restricciones = ttk.LabelFrame(f, text="Restricciones")
+        # Restricciones: grilla que dibuja solo las celdas visibles
+        self.area_restricciones = ttk.LabelFrame(f, text="Restricciones (Ctrl+V pega desde una planilla)")
         self.area_restricciones.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.tabla_restricciones = TablaRestricciones(self.area_restricciones, self.modelo_restricciones,
+                                                      al_eliminar=self._eliminar_restriccion_especifica)
+        self.tabla_restricciones.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Botones de acción
         botones_frame = ttk.Frame(f)
@@ -157,8 +171,21 @@ class SimplexVista:
                   command=self._agregar_restriccion).pack(side=tk.LEFT, padx=5)
         ttk.Button(botones_frame, text="Limpiar Restricciones", 
                   command=self._limpiar_restricciones).pack(side=tk.LEFT, padx=5)
-        ttk.Button(botones_frame, text="Resolver", 
-                  command=self._resolver).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(botones_frame, text="Importar CSV", 
+                  command=self._importar_csv).pack(side=tk.LEFT, padx=5)
+        self.boton_cancelar = ttk.Button(botones_frame, text="Cancelar", state=tk.DISABLED,
+                                         command=self._cancelar)
+        self.boton_cancelar.pack(side=tk.RIGHT, padx=5)
+        self.boton_resolver = ttk.Button(botones_frame, text="Resolver", 
+                                         command=self._resolver)
+        self.boton_resolver.pack(side=tk.RIGHT, padx=5)
+
+        # Progreso de la resolución en curso (oculto mientras no se resuelve)
+        self.progreso_frame = ttk.Frame(f)
+        self.barra_progreso = ttk.Progressbar(self.progreso_frame, mode="indeterminate", length=160)
+        self.barra_progreso.pack(side=tk.LEFT, padx=5)
+        self.etiqueta_progreso = ttk.Label(self.progreso_frame, text="")
+        self.etiqueta_progreso.pack(side=tk.LEFT, padx=5)
 
         # Área de resultados resumidos
         resultado_frame = ttk.LabelFrame(f, text="Resultados")
@@ -196,14 +223,44 @@ class SimplexVista:
         ttk.Button(botones_frame, text="Exportar Proceso como Imágenes", 
                   command=self._exportar_imagenes).pack(side=tk.RIGHT)
 
-        # Área de texto para el proceso completo
+        # Navegación: resumen y un tableau por página
+        navegacion_frame = ttk.Frame(f)
+        navegacion_frame.pack(fill=tk.X, padx=10)
+
+        ttk.Button(navegacion_frame, text="Resumen", 
+                  command=self._ir_a_resumen).pack(side=tk.LEFT, padx=(0, 10))
+        self.entrada_tableau = ttk.Entry(navegacion_frame, width=6)
+        self.entrada_tableau.bind("<Return>", self._ir_a_tableau_ingresado)
+        self.etiqueta_total_tableaux = ttk.Label(navegacion_frame, text="de 0")
+        self.controles_navegacion = [
+            ttk.Button(navegacion_frame, text="⏮", width=3, command=lambda: self._ir_a_tableau(0)),
+            ttk.Button(navegacion_frame, text="◀", width=3, command=lambda: self._mover_tableau(-1)),
+            self.entrada_tableau,
+            ttk.Button(navegacion_frame, text="Ir", width=4, command=self._ir_a_tableau_ingresado),
+            ttk.Button(navegacion_frame, text="▶", width=3, command=lambda: self._mover_tableau(1)),
+            ttk.Button(navegacion_frame, text="⏭", width=3,
+                       command=lambda: self._ir_a_tableau(self._num_tableaux - 1)),
+        ]
+        ttk.Label(navegacion_frame, text="Tableau").pack(side=tk.LEFT, padx=(0, 5))
+        for widget in self.controles_navegacion[:3]:
+            widget.pack(side=tk.LEFT, padx=2)
+        self.etiqueta_total_tableaux.pack(side=tk.LEFT, padx=2)
+        for widget in self.controles_navegacion[3:]:
+            widget.pack(side=tk.LEFT, padx=2)
+
+        # Área de texto de la página actual (sin cortar las filas de los tableaux anchos)
+        barra_horizontal = ttk.Scrollbar(f, orient=tk.HORIZONTAL)
+        barra_horizontal.pack(side=tk.BOTTOM, fill=tk.X, padx=10)
         self.text_resultado = scrolledtext.ScrolledText(f, 
-                                                       wrap=tk.WORD, 
+                                                       wrap=tk.NONE, 
                                                        font=("Courier", 10),
                                                        bg="#f8f8f8",
                                                        relief="sunken",
-                                                       borderwidth=1)
+                                                       borderwidth=1,
+                                                       xscrollcommand=barra_horizontal.set)
+        barra_horizontal.config(command=self.text_resultado.xview)
         self.text_resultado.pack(expand=True, fill=tk.BOTH, padx=10, pady=5)
+        self.mostrar_proceso_completo("")
     
     def crear_area_coeficientes(self, n):
         """Crea el área de coeficientes de la función objetivo"""
@@ -232,6 +289,10 @@ class SimplexVista:
             self.entradas_coef_obj.append(entry)
             
             ttk.Label(obj_frame, text=f"x{i+1}").pack(side=tk.LEFT, padx=2)
+        
+        # La grilla de restricciones conserva sus datos con la nueva cantidad de variables
+        self.modelo_restricciones.redimensionar(n)
+        self.tabla_restricciones.actualizar()
     
     def _validate_coefficient_input(self, event):
         """Valida que el input de coeficientes sea un número válido"""
@@ -244,79 +305,127 @@ class SimplexVista:
                 event.widget.delete(len(value)-1)
     
     def crear_restriccion(self, n):
-        """Crea una nueva restricción en la interfaz"""
-        # Crear marco para la restricción
-        fila = ttk.Frame(self.area_restricciones)
-        fila.pack(pady=3, fill=tk.X, padx=5)
-
-        entradas = []
-        for i in range(n):
-            if i > 0:
-                ttk.Label(fila, text=" + ").pack(side=tk.LEFT, padx=2)
-            
-            e = ttk.Entry(fila, width=6)
-            e.pack(side=tk.LEFT, padx=2)
-            e.insert(0, "0")  # Valor por defecto
-            e.bind('<KeyRelease>', self._validate_coefficient_input)
-            entradas.append(e)
-            
-            ttk.Label(fila, text=f"x{i+1}").pack(side=tk.LEFT, padx=2)
-
-        # Tipo de desigualdad
-        desigualdad = tk.StringVar(value="<=")
-        desig_menu = ttk.OptionMenu(fila, desigualdad, "<=", "<=", ">=", "=")
-        desig_menu.pack(side=tk.LEFT, padx=8)
-
-        # Lado derecho
-        rhs = ttk.Entry(fila, width=8)
-        rhs.pack(side=tk.LEFT, padx=5)
-        rhs.insert(0, "0")  # Valor por defecto
-        rhs.bind('<KeyRelease>', self._validate_coefficient_input)
-
-        # Botón para eliminar esta restricción (con estilo rojo)
-        delete_btn = ttk.Button(fila, text="Eliminar", style="Delete.TButton",
-                               command=lambda: self._eliminar_restriccion_especifica(fila))
-        delete_btn.pack(side=tk.RIGHT, padx=5)
-
-        # Agregar a la lista
-        restriccion_data = (entradas, desigualdad, rhs, fila)
-        self.entradas_restricciones.append(restriccion_data)
-        
-        return restriccion_data
-    
-    def eliminar_restriccion_especifica(self, fila_frame):
-        """Elimina una restricción específica de la interfaz"""
-        # Encontrar y remover de la lista
-        self.entradas_restricciones = [
-            (entradas, desig, rhs, frame) for entradas, desig, rhs, frame in self.entradas_restricciones 
-            if frame != fila_frame
-        ]
-        # Destruir el widget
-        fila_frame.destroy()
+        """Agrega una restricción en cero a la grilla y devuelve su índice"""
+        self.modelo_restricciones.redimensionar(n)
+        return self.tabla_restricciones.agregar_fila()
+    
+    def eliminar_restriccion_especifica(self, fila):
+        """Elimina la restricción de la fila indicada"""
+        self.modelo_restricciones.eliminar_fila(fila)
+        self.tabla_restricciones.actualizar()
     
     def limpiar_area_restricciones(self):
         """Limpia todas las restricciones de la interfaz"""
-        for widget in self.area_restricciones.winfo_children():
-            widget.destroy()
-        self.entradas_restricciones = []
+        self.modelo_restricciones.limpiar()
+        self.tabla_restricciones.actualizar()
+    
+    def cargar_csv_restricciones(self, ruta):
+        """
+        Reemplaza las restricciones por las de un archivo CSV
+        
+        Returns:
+            int: Cantidad de restricciones cargadas
+        """
+        try:
+            return self.modelo_restricciones.cargar_csv(ruta)
+        finally:
+            self.tabla_restricciones.actualizar()
     
     def mostrar_resultado_principal(self, texto):
         """Muestra texto en el área de resultados principal"""
         self.text_resultado_principal.delete("1.0", tk.END)
         self.text_resultado_principal.insert(tk.END, texto)
     
+    def iniciar_progreso(self):
+        """Muestra la barra de progreso y habilita Cancelar mientras se resuelve"""
+        self.boton_resolver.config(state=tk.DISABLED)
+        self.boton_cancelar.config(state=tk.NORMAL)
+        self.etiqueta_progreso.config(text="Resolviendo...")
+        self.progreso_frame.pack(fill=tk.X, padx=10, pady=(0, 5), after=self.boton_resolver.master)
+        self.barra_progreso.start(15)
+    
+    def mostrar_progreso(self, texto):
+        """Actualiza el texto de progreso (p. ej. la iteración actual)"""
+        self.etiqueta_progreso.config(text=texto)
+    
+    def marcar_cancelando(self):
+        """Indica que se pidió cancelar y se espera a que el solver se detenga"""
+        self.boton_cancelar.config(state=tk.DISABLED)
+        self.etiqueta_progreso.config(text="Cancelando...")
+    
+    def terminar_progreso(self):
+        """Oculta el progreso y vuelve a habilitar Resolver"""
+        self.barra_progreso.stop()
+        self.progreso_frame.pack_forget()
+        self.boton_cancelar.config(state=tk.DISABLED)
+        self.boton_resolver.config(state=tk.NORMAL)
+    
     def mostrar_proceso_completo(self, texto):
-        """Muestra texto en el área de proceso completo"""
+        """Muestra texto en el área de proceso completo (sin páginas de tableaux)"""
+        if not texto:
+            texto = ("Aún no se ha resuelto ningún problema.\n\n"
+                     "Para ver el proceso detallado:\n"
+                     "1. Configure el problema en la pestaña anterior\n"
+                     "2. Haga clic en 'Resolver'\n"
+                     "3. Regrese a esta pestaña para ver el proceso completo")
+        self.mostrar_proceso_paginado(texto, 0, None)
+    
+    def mostrar_proceso_paginado(self, texto_resumen, num_tableaux, obtener_tableau):
+        """
+        Prepara el visor del proceso y muestra la página de resumen
+        
+        Args:
+            texto_resumen: Texto de la página de resumen
+            num_tableaux: Cantidad de tableaux del historial
+            obtener_tableau: Función indice -> texto; solo se llama con la página visible
+        """
+        self._texto_resumen = texto_resumen
+        self._num_tableaux = num_tableaux
+        self._obtener_tableau = obtener_tableau
+        self.etiqueta_total_tableaux.config(text=f"de {max(num_tableaux - 1, 0)}")
+        estado = tk.NORMAL if num_tableaux else tk.DISABLED
+        for widget in self.controles_navegacion:
+            widget.config(state=estado)
+        self._ir_a_resumen()
+    
+    def _mostrar_pagina(self, texto):
+        """Reemplaza el contenido del área de texto por una sola página"""
         self.text_resultado.delete("1.0", tk.END)
-        if texto:
-            self.text_resultado.insert(tk.END, texto)
-        else:
-            self.text_resultado.insert(tk.END, 
-                "Aún no se ha resuelto ningún problema.\n\n"
-                "Para ver el proceso detallado:\n"
-                "1. Configure el problema en la pestaña anterior\n"
-                "2. Haga clic en 'Resolver'\n"
-                "3. Regrese a esta pestaña para ver el proceso completo")
+        self.text_resultado.insert(tk.END, texto)
+        self.text_resultado.yview_moveto(0)
+        self.text_resultado.xview_moveto(0)
+    
+    def _ir_a_resumen(self):
+        self._tableau_actual = None
+        self.entrada_tableau.delete(0, tk.END)
+        self._mostrar_pagina(self._texto_resumen)
+    
+    def _ir_a_tableau(self, indice):
+        """Muestra el tableau `indice` del historial (se ajusta al rango válido)"""
+        if not self._num_tableaux:
+            return
+        indice = min(max(indice, 0), self._num_tableaux - 1)
+        self._tableau_actual = indice
+        self.entrada_tableau.delete(0, tk.END)
+        self.entrada_tableau.insert(0, str(indice))
+        self._mostrar_pagina(self._obtener_tableau(indice))
+    
+    def _mover_tableau(self, paso):
+        actual = -1 if self._tableau_actual is None else self._tableau_actual
+        self._ir_a_tableau(actual + paso)
+    
+    def _ir_a_tableau_ingresado(self, event=None):
+        """Salta al tableau escrito en el campo de navegación"""
+        try:
+            indice = int(self.entrada_tableau.get())
+        except ValueError:
+            self.root.bell()
+            return
+        self._ir_a_tableau(indice)
+    
+    def pestana_actual(self):
+        """Texto de la pestaña seleccionada"""
+        return self.notebook.tab(self.notebook.select(), "text")
     
     def obtener_numero_variables(self):
         """Obtiene el número de variables del campo de entrada"""
@@ -331,8 +440,8 @@ class SimplexVista:
         return [e.get() for e in self.entradas_coef_obj]
     
     def obtener_restricciones_data(self):
-        """Obtiene todos los datos de las restricciones"""
-        return self.entradas_restricciones
+        """Obtiene el ModeloRestricciones con los datos de la grilla"""
+        return self.modelo_restricciones
     
     def tiene_coeficientes_objetivo(self):
         """Verifica si hay coeficientes de objetivo configurados"""
@@ -340,7 +449,7 @@ class SimplexVista:
     
     def tiene_restricciones(self):
         """Verifica si hay restricciones configuradas"""
-        return len(self.entradas_restricciones) > 0
+        return self.modelo_restricciones.num_filas > 0
     
     # Métodos privados que conectan con los callbacks
     def _configurar_objetivo(self):
@@ -351,18 +460,26 @@ class SimplexVista:
         if self.callback_agregar_restriccion:
             self.callback_agregar_restriccion()
     
-    def _eliminar_restriccion_especifica(self, fila_frame):
+    def _eliminar_restriccion_especifica(self, fila):
         if self.callback_eliminar_restriccion:
-            self.callback_eliminar_restriccion(fila_frame)
+            self.callback_eliminar_restriccion(fila)
     
     def _limpiar_restricciones(self):
         if self.callback_limpiar_restricciones:
             self.callback_limpiar_restricciones()
     
+    def _importar_csv(self):
+        if self.callback_importar_csv:
+            self.callback_importar_csv()
+    
     def _resolver(self):
         if self.callback_resolver:
             self.callback_resolver()
     
+    def _cancelar(self):
+        if self.callback_cancelar:
+            self.callback_cancelar()
+    
     def _exportar_imagenes(self):
         if self.callback_exportar_imagenes:
             self.callback_exportar_imagenes()
@@ -384,9 +501,15 @@ class SimplexVista:
     def set_callback_limpiar_restricciones(self, callback):
         self.callback_limpiar_restricciones = callback
     
+    def set_callback_importar_csv(self, callback):
+        self.callback_importar_csv = callback
+    
     def set_callback_resolver(self, callback):
         self.callback_resolver = callback
     
+    def set_callback_cancelar(self, callback):
+        self.callback_cancelar = callback
+    
     def set_callback_exportar_imagenes(self, callback):
         self.callback_exportar_imagenes = callback
     